@@ -0,0 +1,57 @@
+"""
+Response decoding benchmark.
+
+Decodes random responses for every request of a full poll, as _get_data does, and reports
+the throughput in registers per second as JSON.
+
+    python benchmarks/bench_decode.py [--number 200] [--path /other/checkout]
+"""
+import argparse
+import random
+
+from common import best_time, report, use_checkout
+
+
+def run(number=200, path=None):
+    """Return decoded registers per second by model."""
+    use_checkout(path)
+    from pythermiagenesis import ThermiaGenesis
+    from pythermiagenesis.const import MODEL_INVERTER, MODEL_MEGA, REG_COIL, REG_DISCRETE_INPUT
+
+    rng = random.Random(1)
+    results = {}
+    for kind in (MODEL_MEGA, MODEL_INVERTER):
+        plan = ThermiaGenesis('localhost', kind=kind, transport='asyncio').read_plan()
+        responses = []
+        for request in plan.requests:
+            if request.reg_type in (REG_COIL, REG_DISCRETE_INPUT):
+                responses.append([rng.random() < 0.5 for _ in range(request.length)])
+            else:
+                responses.append([rng.randrange(65536) for _ in range(request.length)])
+        work = tuple(zip(plan.decoders, responses))
+
+        def decode():
+            data = {}
+            for decoder, words in work:
+                decoder.decode_into(words, data)
+
+        elapsed = best_time(decode, number)
+        decoded = len(plan.slots)
+        results[kind] = {
+            'registers_per_second': round(decoded / elapsed),
+            'poll_us': round(elapsed * 1e6, 2),
+            'registers': decoded,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=200)
+    parser.add_argument('--path', help="Directory containing the pythermiagenesis package to measure")
+    args = parser.parse_args()
+    report('decode', 'registers/s', run(args.number, args.path))
+
+
+if __name__ == '__main__':
+    main()
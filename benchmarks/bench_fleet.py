@@ -0,0 +1,113 @@
+"""
+Fleet polling benchmark.
+
+Starts one simulator per heat pump, all served by one event loop in a separate thread, and
+polls them with ThermiaFleet. Reports the wall time of a full sweep in seconds and the pumps
+polled per second as JSON, for each fleet size and global concurrency limit. Every pump is
+its own gateway, so only the global limit applies. With --workers the fleet is sharded over
+worker processes with ShardedFleet, the simulators stay in this process.
+
+    python benchmarks/bench_fleet.py [--pumps 100 300 1000] [--concurrency 16 64 256] [--latency 0.01] [--delay 0.05]
+        [--workers 4]
+"""
+import argparse
+import asyncio
+import threading
+import time
+
+from common import report, use_checkout
+
+
+class _SimulatorThread:
+    """Simulators sharing one event loop in a daemon thread."""
+
+    def __init__(self, kind, count, latency):
+        from pythermiagenesis.simulator import GenesisSimulator
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name='simulators', daemon=True)
+        self.thread.start()
+        self.simulators = [GenesisSimulator(kind, port=0, latency=latency, seed=index, update_interval=60.0)
+                           for index in range(count)]
+        asyncio.run_coroutine_threadsafe(self._call('start'), self.loop).result()
+
+    async def _call(self, method):
+        await asyncio.gather(*(getattr(simulator, method)() for simulator in self.simulators))
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._call('stop'), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+
+async def _sweep(ports, kind, concurrency, delay, stagger, workers=None):
+    from pythermiagenesis import ThermiaGenesis
+    from pythermiagenesis.fleet import ThermiaFleet
+    from pythermiagenesis.sharding import ShardedFleet
+
+    if workers:
+        fleet = ShardedFleet(workers, concurrency=concurrency, stagger=stagger)
+        for port in ports:
+            fleet.add('127.0.0.1', port, gateway=port, kind=kind, delay=delay, transport='asyncio')
+    else:
+        fleet = ThermiaFleet(concurrency=concurrency, stagger=stagger)
+        for port in ports:
+            fleet.add(ThermiaGenesis('127.0.0.1', port=port, kind=kind, delay=delay, transport='asyncio'),
+                      gateway=port)
+    start = time.perf_counter()
+    results = await fleet.async_update()
+    elapsed = time.perf_counter() - start
+    await fleet.aclose()
+    return elapsed, sum(result.ok for result in results.values())
+
+
+def run(pumps=(100, 300, 1000), concurrencies=(16, 64, 256), latency=0.01, delay=0.05, stagger=1.0, path=None,
+        workers=None):
+    """Return sweep wall time and pumps per second by fleet size and concurrency.
+
+    The poll time of a single pump is reported as well, a sequential sweep takes about that
+    times the number of pumps. With workers the pumps are sharded over that many processes,
+    concurrency then applies per process.
+    """
+    use_checkout(path)
+    from pythermiagenesis.const import MODEL_INVERTER
+
+    results = {}
+    for count in pumps:
+        simulators = _SimulatorThread(MODEL_INVERTER, count, latency)
+        try:
+            ports = [simulator.port for simulator in simulators.simulators]
+            if not results:
+                elapsed, _ = asyncio.run(_sweep(ports[:1], MODEL_INVERTER, 1, delay, 0.0))
+                results['single_pump'] = {'sweep_s': round(elapsed, 2), 'pumps_per_s': round(1 / elapsed, 1)}
+            for concurrency in concurrencies:
+                elapsed, ok = asyncio.run(_sweep(ports, MODEL_INVERTER, concurrency, delay, stagger, workers))
+                name = f'pumps_{count}_concurrency_{concurrency}'
+                if workers:
+                    name += f'_workers_{workers}'
+                results[name] = {
+                    'sweep_s': round(elapsed, 2),
+                    'pumps_per_s': round(count / elapsed, 1),
+                    'failed': count - ok,
+                }
+        finally:
+            simulators.stop()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pumps', type=int, nargs='+', default=[100, 300, 1000])
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[16, 64, 256])
+    parser.add_argument('--latency', type=float, default=0.01, help="simulated seconds per request")
+    parser.add_argument('--delay', type=float, default=0.05, help="ThermiaGenesis delay between requests")
+    parser.add_argument('--stagger', type=float, default=1.0, help="seconds the starts of a sweep are spread over")
+    parser.add_argument('--workers', type=int, help="shard the fleet over this many processes")
+    parser.add_argument('--path', help="Directory containing the pythermiagenesis package to measure")
+    args = parser.parse_args()
+    report('fleet', 's', run(args.pumps, args.concurrency, args.latency, args.delay, args.stagger, args.path,
+                             args.workers))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Import time benchmark.
+
+Each snippet runs in a fresh interpreter after asyncio and logging are imported (any user
+of the library needs them anyway), the median time of the snippet itself is reported in
+milliseconds as JSON. Pass --path to measure another checkout, e.g. an older commit.
+
+    python benchmarks/bench_import.py [--runs 20] [--path /other/checkout]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+from common import report
+
+SNIPPETS = {
+    'import': "import pythermiagenesis",
+    'import_const': "import pythermiagenesis.const",
+    'import_and_register_map': "from pythermiagenesis.const import REGISTERS",
+    'import_and_plan': "import pythermiagenesis; pythermiagenesis.ThermiaGenesis('localhost', transport='asyncio').read_plan()",
+}
+
+TIMER = """
+import asyncio, logging, time
+start = time.perf_counter()
+{snippet}
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def time_snippet(snippet, runs, path):
+    """Return the median time of a snippet in milliseconds, or None if it fails."""
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, '-c', TIMER.format(snippet=snippet)], cwd=path,
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            return None
+        timings.append(float(result.stdout))
+    return round(statistics.median(timings), 3)
+
+
+def run(runs=20, path=None):
+    """Return the median time per snippet in milliseconds."""
+    path = path or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    #Warm up the bytecode cache
+    for snippet in SNIPPETS.values():
+        time_snippet(snippet, 1, path)
+    return {name: time_snippet(snippet, runs, path) for name, snippet in SNIPPETS.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--path', help="Directory containing the pythermiagenesis package to measure")
+    args = parser.parse_args()
+    report('import', 'ms', run(args.runs, args.path))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Read plan construction benchmark.
+
+Times compile_plan without its cache (what the first poll of a register selection costs) and
+the cached lookup done by every later ThermiaGenesis.read_plan call, for full and partial
+register sets of both models. Reports microseconds per plan as JSON.
+
+    python benchmarks/bench_plan.py [--number 200] [--path /other/checkout]
+"""
+import argparse
+import random
+
+from common import best_time, report, use_checkout
+
+
+def selections(kind):
+    """Return the register selections measured for a model, None is every register."""
+    from pythermiagenesis.catalog import get_catalog
+    from pythermiagenesis.scheduler import group_registers
+    names = [register.name for register in get_catalog().for_model(kind)]
+    return {
+        'full': None,
+        'temperatures': tuple(group_registers('temperatures', kind)),
+        'random_20': tuple(random.Random(1).sample(names, 20)),
+        'single': (names[len(names) // 2],),
+    }
+
+
+def run(number=200, path=None):
+    """Return microseconds per plan by model, selection and cached/uncached."""
+    use_checkout(path)
+    from pythermiagenesis import ThermiaGenesis
+    from pythermiagenesis.const import MODEL_INVERTER, MODEL_MEGA
+    from pythermiagenesis.plan import compile_plan
+
+    results = {}
+    for kind in (MODEL_MEGA, MODEL_INVERTER):
+        thermia = ThermiaGenesis('localhost', kind=kind, transport='asyncio')
+        for name, registers in selections(kind).items():
+            def build():
+                compile_plan.cache_clear()
+                thermia.read_plan(registers)
+            cold = best_time(build, number)
+            cached = best_time(lambda: thermia.read_plan(registers), number * 10)
+            plan = thermia.read_plan(registers)
+            results[f'{kind}_{name}'] = {
+                'build_us': round(cold * 1e6, 2),
+                'cached_us': round(cached * 1e6, 3),
+                'requests': plan.request_count,
+                'registers_transferred': plan.register_count,
+            }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=200)
+    parser.add_argument('--path', help="Directory containing the pythermiagenesis package to measure")
+    args = parser.parse_args()
+    report('plan', 'us', run(args.number, args.path))
+
+
+if __name__ == '__main__':
+    main()
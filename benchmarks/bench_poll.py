@@ -0,0 +1,76 @@
+"""
+End-to-end polling benchmark.
+
+Runs full async_update polls of both models against the bundled simulator with injected
+per-request latency and reports the median wall time in milliseconds and the number of
+Modbus requests per poll as JSON. The simulator runs in its own thread so its work is not
+timed, the library delay between requests is 0 unless --delay is given.
+
+    python benchmarks/bench_poll.py [--polls 5] [--latency 0 0.01] [--transport asyncio] [--pipeline 1 8]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from common import report, use_checkout
+
+
+async def _poll(thermia, polls):
+    timings = []
+    for _ in range(polls):
+        start = time.perf_counter()
+        data = await thermia.async_update()
+        timings.append(time.perf_counter() - start)
+    return timings, len(data)
+
+
+def run(polls=5, latencies=(0.0, 0.01), transports=('asyncio',), delay=0.0, path=None, pipelines=(1,)):
+    """Return wall time and request count per poll by model, transport, latency and pipeline window.
+
+    Pipelined polls run against a simulator answering requests concurrently.
+    """
+    use_checkout(path)
+    from pythermiagenesis import ThermiaGenesis
+    from pythermiagenesis.const import MODEL_INVERTER, MODEL_MEGA
+    from pythermiagenesis.simulator import GenesisSimulator
+
+    results = {}
+    for kind in (MODEL_MEGA, MODEL_INVERTER):
+        for latency in latencies:
+            simulator = GenesisSimulator(kind, port=0, latency=latency, seed=1, pipelining='concurrent').start_thread()
+            try:
+                for transport in transports:
+                    for pipeline in (pipelines if transport == 'asyncio' else (1,)):
+                        thermia = ThermiaGenesis('127.0.0.1', port=simulator.port, kind=kind, delay=delay,
+                                                 transport=transport, pipeline=pipeline)
+                        before = sum(simulator.requests.values())
+                        timings, registers = asyncio.run(_poll(thermia, polls))
+                        requests = (sum(simulator.requests.values()) - before) / polls
+                        name = f'{kind}_{transport}_latency_{latency * 1000:g}ms'
+                        if pipeline > 1:
+                            name += f'_pipeline_{pipeline}'
+                        results[name] = {
+                            'wall_ms': round(statistics.median(timings) * 1000, 2),
+                            'requests': requests,
+                            'registers': registers,
+                        }
+            finally:
+                simulator.stop_thread()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--polls', type=int, default=5)
+    parser.add_argument('--latency', type=float, nargs='+', default=[0.0, 0.01], help="seconds per request")
+    parser.add_argument('--transport', nargs='+', default=['asyncio'], choices=['asyncio', 'pymodbustcp'])
+    parser.add_argument('--pipeline', type=int, nargs='+', default=[1], help="requests in flight, asyncio transport only")
+    parser.add_argument('--delay', type=float, default=0.0, help="ThermiaGenesis delay between requests")
+    parser.add_argument('--path', help="Directory containing the pythermiagenesis package to measure")
+    args = parser.parse_args()
+    report('poll', 'ms', run(args.polls, args.latency, args.transport, args.delay, args.path, args.pipeline))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+"""Helpers shared by the benchmarks."""
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def use_checkout(path=None):
+    """Make the pythermiagenesis package of a checkout importable, this one by default."""
+    sys.path.insert(0, path or ROOT)
+
+
+def best_time(func, number, repeat=5):
+    """Return the best time of a call to func in seconds, out of repeat rounds of number calls."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = (time.perf_counter() - start) / number
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def report(benchmark, unit, results):
+    """Print results in the format shared by all benchmarks."""
+    print(json.dumps({'benchmark': benchmark, 'unit': unit, 'results': results}, indent=2))
@@ -0,0 +1,48 @@
+"""
+Compare two result files written by run_all.py, printing every measurement side by side with
+the ratio new/old.
+
+    python benchmarks/compare.py old.json new.json
+"""
+import argparse
+import json
+
+
+def flatten(results, prefix=''):
+    """Yield (dotted name, number) for every number in nested results."""
+    for key, value in results.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict):
+            yield from flatten(value, name + '.')
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield name, value
+
+
+def compare(old, new):
+    """Return rows of (name, old value, new value, ratio) for the measurements of the new file."""
+    rows = []
+    for benchmark, measured in new['benchmarks'].items():
+        before = dict(flatten(old['benchmarks'].get(benchmark, {}).get('results', {})))
+        for name, value in flatten(measured['results']):
+            previous = before.get(name)
+            ratio = value / previous if previous else None
+            rows.append((f'{benchmark}.{name}', previous, value, ratio))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('old')
+    parser.add_argument('new')
+    args = parser.parse_args()
+    with open(args.old) as old, open(args.new) as new:
+        old, new = json.load(old), json.load(new)
+    print(f"{'measurement':60} {old['commit'] or 'old':>14} {new['commit'] or 'new':>14} {'ratio':>7}")
+    for name, before, after, ratio in compare(old, new):
+        ratio = '' if ratio is None else f'{ratio:.2f}'
+        before = '-' if before is None else f'{before:g}'
+        print(f"{name:60} {before:>14} {after:>14g} {ratio:>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Run every benchmark and write the results, with the commit they were measured at, as one JSON
+document. Compare two result files with compare.py.
+
+    python benchmarks/run_all.py [--output results.json] [--quick]
+"""
+import argparse
+import json
+import platform
+import subprocess
+
+import bench_decode
+import bench_fleet
+import bench_import
+import bench_plan
+import bench_poll
+from common import ROOT
+
+
+def commit(path):
+    result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=path, capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+
+def run(quick=False, path=None):
+    """Return the results of all benchmarks."""
+    return {
+        'commit': commit(path or ROOT),
+        'python': platform.python_version(),
+        'benchmarks': {
+            'import': {'unit': 'ms', 'results': bench_import.run(5 if quick else 20, path)},
+            'plan': {'unit': 'us', 'results': bench_plan.run(20 if quick else 200, path)},
+            'decode': {'unit': 'registers/s', 'results': bench_decode.run(20 if quick else 200, path)},
+            'poll': {'unit': 'ms', 'results': bench_poll.run(2 if quick else 5, path=path)},
+            'fleet': {'unit': 's', 'results': bench_fleet.run((20 if quick else 100,), (16, 64), path=path)},
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', help="File to write, printed when omitted")
+    parser.add_argument('--quick', action='store_true', help="Fewer repetitions, noisier numbers")
+    parser.add_argument('--path', help="Directory containing the pythermiagenesis package to measure")
+    args = parser.parse_args()
+    document = json.dumps(run(args.quick, args.path), indent=2)
+    if args.output:
+        with open(args.output, 'w') as output:
+            output.write(document + '\n')
+    else:
+        print(document)
+
+
+if __name__ == '__main__':
+    main()
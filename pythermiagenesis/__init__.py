@@ -1,26 +1,43 @@
 """
 Python wrapper for getting data from Thermie Genesis heatpump using Modbus TCP
 """
-import logging
-
-import datetime
 import asyncio
-import traceback
-
-from time import sleep
-
-from datetime import timedelta
-from operator import itemgetter, attrgetter
 import logging
-
-from pyModbusTCP.client import ModbusClient
-from pyModbusTCP.utils import *
-
-from .const import *
-from struct import unpack
+from time import monotonic, perf_counter, time
+
+from . import const
+from .catalog import get_catalog
+from .const import (
+    ATTR_INPUT_SOFTWARE_VERSION_MAJOR,
+    ATTR_INPUT_SOFTWARE_VERSION_MICRO,
+    ATTR_INPUT_SOFTWARE_VERSION_MINOR,
+    MAX_RETRY_DELAY,
+    MODEL_MEGA,
+    OVERFLOW_DROP_OLDEST,
+    REG_COIL,
+    REG_DISCRETE_INPUT,
+    REG_HOLDING,
+    REG_INPUT,
+    READ_FAILED,
+    READ_OK,
+    READ_STALE,
+    REG_TYPES,
+    GROUP_POLL_INTERVALS,
+    REGISTER_RANGES,
+    TRANSPORT_PYMODBUSTCP,
+)
+from .metrics import OPERATION_READ, OPERATION_WRITE, Metrics, Transaction, UpdateStats
+from .plan import DEFAULT_REQUEST_COST, compile_plan
+from .stream import async_stream
+from .subscriptions import Deadband, SubscriptionManager
+from .transport import EXP_DATA_ADDRESS, EXP_SLAVE_DEVICE_BUSY, MB_EXCEPT_ERR, READ_FUNCTION_CODES, create_transport
+from .tuning import get_tuner, is_overload
+from .writes import decode_written, encode_value, num_to_bin, plan_writes
 
 _LOGGER = logging.getLogger(__name__)
 
+FIRMWARE_REGISTERS = (ATTR_INPUT_SOFTWARE_VERSION_MAJOR, ATTR_INPUT_SOFTWARE_VERSION_MINOR, ATTR_INPUT_SOFTWARE_VERSION_MICRO)
+
 class ThermiaException(Exception):
     def __init__(self, code=None, *args, **kwargs):
         self.message = ""
@@ -34,18 +51,45 @@ class ThermiaException(Exception):
 class ThermiaConnectionError(ThermiaException):
     pass
 
-def num_to_bin(value):
-    if(value > -1): return value
-    return 65536 + value
+#The constants are looked up lazily, they are listed so star imports still include them
+__all__ = ['Deadband', 'FIRMWARE_REGISTERS', 'Metrics', 'ThermiaConnectionError', 'ThermiaException', 'ThermiaGenesis',
+           'num_to_bin', *const.__all__]
+
+def __getattr__(name):
+    """Keep the constants available from the package, as with the former star import of const."""
+    try:
+        return getattr(const, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+class _Poll:
+    """An update in flight and the registers it reads, None for all."""
+
+    __slots__ = ('names', 'task')
+
+    def __init__(self, names, task):
+        self.names = names
+        self.task = task
 
 class ThermiaGenesis:  # pylint:disable=too-many-instance-attributes
     """Main class to perform modbus requests to heat pump."""
 
-    def __init__(self, host, port=502, kind='inverter', delay=0.1, max_registers=16):
+    def __init__(self, host, port=502, kind='inverter', delay=0.1, max_registers=16, transport=TRANSPORT_PYMODBUSTCP, timeout=None,
+            keep_alive=False, idle_timeout=30.0, reconnect_attempts=None, reconnect_delay=0.5, auto_tune=False,
+            history=None, metrics=None, retries=2, retry_delay=0.2, pipeline=1, capabilities=None, snapshot=None,
+            snapshot_interval=60.0):
         """Initialize."""
 
         self.data = {}
-        self._client = ModbusClient(host, port=port, unit_id=1, auto_open=True)
+        #Values written to self.data that have not been confirmed by reading them back
+        self.pending = {}
+        #READ_OK, READ_STALE or READ_FAILED for each register of the last update
+        self.status = {}
+        #Last known values of the registers used as a condition for reading other registers
+        self._conditions = {}
+        #Wall clock time each register was last read
+        self.updated = {}
+        self._client = create_transport(transport, host, port=port, unit_id=1, timeout=timeout)
         self.firmware = None
         if(kind == MODEL_MEGA): self.model = "Mega"
         else: self.model = "Diplomat Inverter"
@@ -54,43 +98,292 @@ class ThermiaGenesis:  # pylint:disable=too-many-instance-attributes
         self._kind = kind
         self._delay = delay
         self.MAX_REGISTERS = max_registers
-
-    async def async_set(self, register, value):  # pylint:disable=too-many-branches
-        """Write data to heat pump."""
-        ret_value = await self._set_data(register, value)
-        self._client.close()
-
-    async def async_update(self, register_types=REG_TYPES, only_registers = None):  # pylint:disable=too-many-branches
-        """Update data from heat pump."""
-        if not self._client.is_open():
-            _LOGGER.info("Attempting to open a Modbus TCP connection to %s:%s", self._host, self._port)
-            if not self._client.open():
-                raise ThermiaConnectionError(f"Failed to connect to {self._host}:{self._port}")
-        use_registers = []
-        if(only_registers != None):
-            #Make sure to sort registers by type and address
-            use_registers = sorted(only_registers, key=(lambda x: f"{REGISTERS[x][KEY_REG_TYPE]}-{REGISTERS[x][KEY_ADDRESS]:03}"))
+        self._keep_alive = keep_alive
+        self._retries = retries
+        self._retry_delay = retry_delay
+        #Number of read requests sent before waiting for responses, 1 for one request at a time
+        self._pipeline = pipeline
+        self._idle_timeout = idle_timeout
+        #Only retry connecting by default when holding a long-lived connection
+        if(reconnect_attempts is None): reconnect_attempts = 3 if keep_alive else 1
+        self._reconnect_attempts = reconnect_attempts
+        self._reconnect_delay = reconnect_delay
+        self._last_activity = None
+        #Updates in flight, and the lock that queues everything using the connection, created in the running event loop
+        self._polls = []
+        self._bus_lock = None
+        self._bus_loop = None
+        self._tuner = None
+        if(auto_tune):
+            self._tuner = get_tuner(host, port, max_registers, delay)
+            self._apply_tuning()
+        self._subscriptions = SubscriptionManager()
+        #Optional bounded history of each register, history is the number of samples kept per register
+        self.history = None
+        if(history):
+            from .history import RegisterHistory
+            self.history = RegisterHistory(history)
+        #Optional instrumentation, True or a Metrics instance to collect into
+        if(metrics is True): metrics = Metrics({'host': host, 'port': port})
+        self.metrics = metrics or None
+        #Optional probing of the registers the device answers, capabilities is True or the path of the cache file
+        self.capabilities = None
+        self._capability_cache = None
+        self._capabilities_firmware = None
+        if(capabilities):
+            from .capabilities import DEFAULT_CACHE_PATH, CapabilityCache
+            self._capability_cache = CapabilityCache(DEFAULT_CACHE_PATH if capabilities is True else capabilities)
+        #Optional snapshot file, the data saved by the last run is available right away, marked stale
+        self._snapshot = snapshot
+        self._snapshot_interval = snapshot_interval
+        self._snapshot_saved = monotonic()
+        if(snapshot):
+            self._load_snapshot()
+
+    async def __aenter__(self):
+        self._keep_alive = True
+        async with self._bus():
+            await self._async_connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the connection to the heat pump."""
+        async with self._bus():
+            self._last_activity = None
+            await self._client.close()
+        if self._snapshot:
+            self.save_snapshot()
+
+    def save_snapshot(self):
+        """Write the current data to the snapshot file."""
+        from .snapshot import Snapshot, save_snapshot
+        save_snapshot(self._snapshot, Snapshot(self._host, self._port, self._kind, self.firmware, self.data, self.updated))
+        self._snapshot_saved = monotonic()
+
+    def _load_snapshot(self):
+        from .snapshot import load_snapshot
+        snapshot = load_snapshot(self._snapshot)
+        if(snapshot is None or (snapshot.host, snapshot.port, snapshot.kind) != (self._host, self._port, self._kind)):
+            return
+        _LOGGER.debug(f"Loaded {snapshot}")
+        self.data = snapshot.values
+        self.updated = snapshot.timestamps
+        self.firmware = snapshot.firmware
+        self.status = dict.fromkeys(self.data, READ_STALE)
+        self._update_conditions(self.data)
+
+    def stale_registers(self, intervals=None, now=None):
+        """Return the registers of the model not read within the poll interval of their group.
+
+        intervals overrides GROUP_POLL_INTERVALS, see scheduler.
+        """
+        from .scheduler import register_group
+        group_intervals = dict(GROUP_POLL_INTERVALS)
+        group_intervals.update(intervals or {})
+        if now is None:
+            now = time()
+        updated = self.updated
+        stale = []
+        for register in get_catalog().for_model(self._kind):
+            interval = group_intervals.get(register_group(register.name))
+            if(interval is not None and now - updated.get(register.name, 0.0) >= interval):
+                stale.append(register.name)
+        return stale
+
+    async def async_refresh(self, intervals=None):
+        """Read only the stale registers, e.g. in the background after starting from a snapshot."""
+        stale = self.stale_registers(intervals)
+        if not stale:
+            return {}
+        return await self.async_update(only_registers=stale, merge=True)
+
+    async def async_set(self, register, value, verify=False):  # pylint:disable=too-many-branches
+        """Write data to heat pump.
+
+        The written value is stored in data right away and kept in pending until it has been read
+        back, with verify it is read back before returning. Return value, with verify the value read
+        back, or None if the write failed, could not be read back or the heat pump reports another value.
+        """
+        confirmed = {}
+        async with self._bus():
+            written = await self._set_data(register, value)
+            try:
+                if(verify and written):
+                    expected = self.pending[register]
+                    confirmed = await self._verify((register,))
+            finally:
+                await self._async_release()
+        if confirmed:
+            await self._confirmed(confirmed)
+        if not verify:
+            return value
+        if(register in confirmed and confirmed[register] == expected):
+            return confirmed[register]
+        return None
+
+    async def async_set_many(self, values, verify=True):
+        """Write several registers on one connection, consecutive registers are written with a single request.
+
+        Written values are stored in data right away. With verify only the written registers are read
+        back afterwards. Return a dict of register name to True if the value was confirmed (or only
+        acknowledged, without verify), False if the write failed or the heat pump reports another
+        value, or None if it could not be read back.
+        """
+        requests = plan_writes(values, self.MAX_REGISTERS)
+        results = {}
+        read = {}
+        async with self._bus():
+            await self._async_connect()
+            try:
+                for request in requests:
+                    await asyncio.sleep(self._delay)
+                    results.update(dict.fromkeys(request.names, await self._write_request(request)))
+                written = [name for name, ok in results.items() if ok]
+                if(verify and written):
+                    for name in written:
+                        results[name] = None
+                    read = await self._verify(written)
+            finally:
+                await self._async_release()
+        for name, value in read.items():
+            if name in results:
+                results[name] = value == self._expected(name, values[name])
+        if read:
+            await self._confirmed(read)
+        return results
+
+    async def async_verify(self, registers=None):
+        """Read back pending writes, by default all of them, see async_set_many for the result."""
+        names = [name for name in (self.pending if registers is None else registers) if name in self.pending]
+        if not names:
+            return {}
+        expected = {name: self.pending[name] for name in names}
+        async with self._bus():
+            await self._async_connect()
+            try:
+                read = await self._verify(names)
+            finally:
+                await self._async_release()
+        await self._confirmed(read)
+        return {name: (read[name] == value if name in read else None) for name, value in expected.items()}
+
+    async def async_update(self, register_types=REG_TYPES, only_registers = None, merge = False):
+        """Update data from heat pump.
+
+        With merge the values read are added to the existing data instead of replacing it.
+
+        Concurrent calls share their reads: a call joins the updates in flight that read any of its
+        registers, or a full update in flight when it updates all registers, and only reads the
+        registers they do not cover itself. Updates, writes and probes use the connection one at a
+        time, in the order they were called.
+        """
+        if only_registers is not None:
+            #Any iterable, it is used more than once
+            only_registers = list(only_registers)
+        wanted = None if only_registers is None else frozenset(only_registers)
+        own = None
+        if wanted is None:
+            joined = [poll for poll in self._polls if poll.names is None]
+            if not joined:
+                own = self._start_poll(None, None, merge)
         else:
-            use_registers = dict(filter(lambda x: x[1][self._kind], REGISTERS.items())).keys()
+            joined = [poll for poll in self._polls if poll.names is None or not poll.names.isdisjoint(wanted)]
+            covered = set()
+            for poll in joined:
+                covered.update(wanted if poll.names is None else poll.names)
+            missing = [name for name in only_registers if name not in covered]
+            if missing:
+                #Data of the joined updates is kept even when not merging
+                own = self._start_poll(frozenset(missing), missing, merge or bool(joined))
+        if not joined:
+            #Nothing to read for an empty only_registers
+            return {} if own is None else await asyncio.shield(own.task)
+        polls = joined if own is None else joined + [own]
+        data = {}
+        for result in await asyncio.gather(*(asyncio.shield(poll.task) for poll in polls)):
+            data.update(result if wanted is None else {name: value for name, value in result.items() if name in wanted})
+        return data
+
+    def _start_poll(self, names, only_registers, merge):
+        poll = _Poll(names, None)
+        poll.task = asyncio.ensure_future(self._async_poll(poll, only_registers, merge))
+        poll.task.add_done_callback(lambda task: self._poll_done(poll))
+        self._polls.append(poll)
+        return poll
+
+    def _poll_done(self, poll):
+        if poll in self._polls:
+            self._polls.remove(poll)
+        #The error is raised to the callers, mark it retrieved in case they were all cancelled
+        if not poll.task.cancelled():
+            poll.task.exception()
+
+    def _bus(self):
+        """Return the lock that queues the use of the connection."""
+        loop = asyncio.get_event_loop()
+        if(self._bus_loop is not loop):
+            self._bus_loop = loop
+            self._bus_lock = asyncio.Lock()
+        return self._bus_lock
+
+    async def _async_poll(self, poll, only_registers, merge):
+        async with self._bus():
+            data = await self._async_update(only_registers, merge)
+        #Callbacks may update or write, they neither hold the connection nor join this update
+        self._polls.remove(poll)
+        if(data and self._subscriptions):
+            await self._subscriptions.async_dispatch(data)
+        return data
 
-        raw_data = await self._get_data(use_registers)
-        self._client.close()
+    async def _async_update(self, only_registers, merge):  # pylint:disable=too-many-branches
+        await self._async_connect()
+        if(self._tuner is not None and not self._tuner.probed):
+            await self._async_tune()
+        if(self._capability_cache is not None and self._capabilities_firmware is None):
+            await self._async_load_capabilities()
+        names, raw_data = await self._read(only_registers)
+        await self._async_release()
+
+        #Registers that could not be read keep their last good value
+        missing = [name for name in names if name not in raw_data] if len(raw_data) < len(names) else ()
+        previous = self.data
+        status = self.status if merge else {}
+        for name in raw_data:
+            status[name] = READ_OK
+        for name in missing:
+            status[name] = READ_STALE if name in previous else READ_FAILED
+        self.status = status
 
         if not raw_data:
-            self.data = {}
+            if not merge:
+                self.data = {name: previous[name] for name in missing if name in previous}
             return {}
+        if self.pending:
+            for name in raw_data:
+                self.pending.pop(name, None)
 
         #_LOGGER.debug("RAW data: %s", raw_data)
         data = {}
+        #The returned dict is never data itself, later merges and writes change data in place
+        current = self.data if merge else {name: previous[name] for name in missing if name in previous}
         try:
             for i, (name, val) in enumerate(raw_data.items()):
                 data[name] = val
+                current[name] = val
 
-            self.firmware = f"{self.data[ATTR_INPUT_SOFTWARE_VERSION_MAJOR]}.{self.data[ATTR_INPUT_SOFTWARE_VERSION_MINOR]}.{self.data[ATTR_INPUT_SOFTWARE_VERSION_MICRO]}"
+            self.firmware = f"{current[ATTR_INPUT_SOFTWARE_VERSION_MAJOR]}.{current[ATTR_INPUT_SOFTWARE_VERSION_MINOR]}.{current[ATTR_INPUT_SOFTWARE_VERSION_MICRO]}"
+            if(self._capabilities_firmware is not None and self._capabilities_firmware != self.firmware):
+                #Firmware changed, use the capabilities of the new firmware from the next update
+                self.capabilities = None
+                self._capabilities_firmware = None
 
             _LOGGER.debug("------------- REGISTERS ----------------------")
-            for i, (name, val) in enumerate(self.data.items()):
-                _LOGGER.debug(f"{REGISTERS[name][KEY_ADDRESS]}\t{val}\t{name}")
+            catalog = get_catalog()
+            for i, (name, val) in enumerate(data.items()):
+                _LOGGER.debug(f"{catalog[name].address}\t{val}\t{name}")
 
 
         except AttributeError as err:
@@ -102,149 +395,313 @@ class ThermiaGenesis:  # pylint:disable=too-many-instance-attributes
         except TypeError as err:
             _LOGGER.debug("Incomplete data from modbus.")
             _LOGGER.debug(err)
-        self.data = data
+        self.data = current
+        self.updated.update(dict.fromkeys(data, time()))
+        if(self._snapshot and monotonic() - self._snapshot_saved >= self._snapshot_interval):
+            self.save_snapshot()
+        if self.history is not None:
+            self.history.record(data)
         return data
 
+    def subscribe(self, callback, registers=None, groups=None, deadband=None, deadbands=None):
+        """Call callback with a dict of the values that changed after each update, return a function that unsubscribes.
+
+        See SubscriptionManager.subscribe, deadbands are Deadband instances.
+        """
+        return self._subscriptions.subscribe(callback, registers, groups, deadband, deadbands)
+
+    def stream(self, interval=10.0, registers=None, groups=None, deltas=False, buffer=16, overflow=OVERFLOW_DROP_OLDEST):
+        """Poll every interval seconds in the background and iterate over the results as StreamItems.
+
+        Polls start on a fixed schedule, a poll that takes longer than interval skips the ticks it
+        overran. Items wait in a buffer of the given size, when the consumer falls behind the oldest
+        item is dropped (OVERFLOW_DROP_OLDEST) or the newest is replaced (OVERFLOW_COALESCE_LATEST),
+        polling never waits for the consumer. With deltas an item only holds the values that changed, the
+        changes of dropped items are merged into the next item.
+        Polling stops when the iterator is closed, e.g. with contextlib.aclosing.
+        """
+        return async_stream(self, interval, registers, groups, deltas, buffer, overflow)
+
+    async def async_tune(self):
+        """Probe the largest block size and smallest delay the heat pump handles, remembered per host."""
+        async with self._bus():
+            return await self._async_tune()
+
+    async def _async_tune(self):
+        if(self._tuner is None):
+            self._tuner = get_tuner(self._host, self._port, self.MAX_REGISTERS, self._delay)
+        await self._async_connect()
+        await self._tuner.async_probe(self._client, self._kind)
+        self._apply_tuning()
+        return self.MAX_REGISTERS, self._delay
+
+    async def async_probe_capabilities(self):
+        """Probe which registers and request sizes the heat pump answers and use them for later reads.
+
+        The result is stored in the capability cache, if one is configured, for the current firmware.
+        """
+        from .capabilities import async_probe_capabilities
+        async with self._bus():
+            await self._async_connect()
+            try:
+                if(self.firmware is None):
+                    await self._async_read_firmware()
+                capabilities = await async_probe_capabilities(self._client, self._kind, self._delay)
+            finally:
+                await self._async_release()
+        if(capabilities is not None):
+            self.capabilities = capabilities
+            self._capabilities_firmware = self.firmware
+            if(self._capability_cache is not None and self.firmware is not None):
+                self._capability_cache.put(self._host, self._port, self._kind, self.firmware, capabilities)
+        return capabilities
+
+    async def _async_load_capabilities(self):
+        """Use the cached capabilities for the firmware of the heat pump, probing them if there are none."""
+        if(self.firmware is None and not await self._async_read_firmware()):
+            return
+        capabilities = self._capability_cache.get(self._host, self._port, self._kind, self.firmware)
+        if(capabilities is None):
+            from .capabilities import async_probe_capabilities
+            capabilities = await async_probe_capabilities(self._client, self._kind, self._delay)
+            if(capabilities is None):
+                return
+            self._capability_cache.put(self._host, self._port, self._kind, self.firmware, capabilities)
+        self.capabilities = capabilities
+        self._capabilities_firmware = self.firmware
+
+    async def _async_read_firmware(self):
+        values = await self._get_data(self.read_plan(FIRMWARE_REGISTERS))
+        if(len(values) < len(FIRMWARE_REGISTERS)):
+            return False
+        self.firmware = ".".join(str(values[name]) for name in FIRMWARE_REGISTERS)
+        return True
+
+    def _apply_tuning(self):
+        self.MAX_REGISTERS = self._tuner.max_registers
+        self._delay = self._tuner.delay
+
     @property
     def available(self):
         """Return True is data is available."""
         return bool(self.data)
 
 
+    async def _async_connect(self):
+        """Make sure there is a working connection, reconnecting with backoff if needed."""
+        if self._client.is_open():
+            if(not self._keep_alive or self._last_activity is None
+                    or monotonic() - self._last_activity < self._idle_timeout):
+                return
+            #Connection has been idle, make sure it is not half-open before using it
+            if await self._async_probe():
+                return
+            _LOGGER.info("Idle connection to %s:%s is dead, reconnecting", self._host, self._port)
+            await self._client.close()
+
+        delay = self._reconnect_delay
+        for attempt in range(max(1, self._reconnect_attempts)):
+            if(attempt > 0):
+                await asyncio.sleep(delay)
+                delay *= 2
+            _LOGGER.info("Attempting to open a Modbus TCP connection to %s:%s", self._host, self._port)
+            if await self._client.open():
+                self._last_activity = monotonic()
+                return
+        raise ThermiaConnectionError(f"Failed to connect to {self._host}:{self._port}")
+
+    async def _async_probe(self):
+        """Read a single input register to check that the connection is alive."""
+        address = REGISTER_RANGES[self._kind][REG_INPUT][0][0]
+        sent = perf_counter()
+        read_data = await self._client.read_input_registers(address, 1)
+        if self.metrics is not None:
+            self._record_transaction(OPERATION_READ, REG_INPUT, address, 1, perf_counter() - sent, read_data)
+        if read_data is None:
+            return False
+        self._last_activity = monotonic()
+        return True
+
+    async def _async_release(self):
+        """Close the connection unless it should be kept open between calls."""
+        if self._keep_alive and self._client.is_open():
+            self._last_activity = monotonic()
+            return
+        await self._client.close()
+
+    def _expected(self, name, value):
+        register = get_catalog()[name]
+        return decode_written(register, encode_value(register, value))
+
+    def _write_through(self, names, raw_values):
+        """Store acknowledged writes in data as pending until they are read back."""
+        catalog = get_catalog()
+        for name, raw in zip(names, raw_values):
+            value = decode_written(catalog[name], raw)
+            self.data[name] = value
+            self.pending[name] = value
+        self._update_conditions(dict(zip(names, raw_values)))
+
+    async def _verify(self, names):
+        """Read back written registers with the smallest read plan containing them, update pending and data."""
+        read = await self._get_data(self.read_plan(names))
+        for name, value in read.items():
+            expected = self.pending.pop(name, None)
+            if(expected is not None and value != expected):
+                _LOGGER.warning(f"{name} was written as {expected} but reads back {value}")
+            self.status[name] = READ_OK
+        self.data.update(read)
+        self.updated.update(dict.fromkeys(read, time()))
+        return read
+
+    async def _confirmed(self, read):
+        """Notify subscribers and history of values read back after a write."""
+        if self.history is not None:
+            self.history.record(read)
+        if self._subscriptions:
+            await self._subscriptions.async_dispatch(read)
+
     async def _set_data(self, register, value):
-        meta = REGISTERS[register]
-        regtype = meta[KEY_REG_TYPE]
-        address = meta[KEY_ADDRESS]
-        scale = meta[KEY_SCALE]
+        """Write a single register, return True if the heat pump acknowledged it."""
+        meta = get_catalog()[register]
+        regtype = meta.reg_type
+        address = meta.address
+        scale = meta.scale
 
-        if not self._client.is_open():
-            _LOGGER.info("Attempting to open a Modbus TCP connection to %s:%s", self._host, self._port)
-            if not self._client.open():
-                raise ThermiaConnectionError(f"Failed to connect to {self._host}:{self._port}")
+        await self._async_connect()
 
         await asyncio.sleep(self._delay)
+        written = None
         try:
             if(regtype == REG_COIL):
                 _LOGGER.debug(f"Set {regtype} register at {address} value {value} ({value})")
-                self._client.write_single_coil(address, value)
+                sent = perf_counter()
+                written = await self._client.write_single_coil(address, value)
+                if self.metrics is not None:
+                    self._record_transaction(OPERATION_WRITE, regtype, address, 1, perf_counter() - sent, written)
+                if written:
+                    self._write_through((register,), (bool(value),))
             elif(regtype == REG_HOLDING):
-                converted_value = int(value * scale)
-                if(meta[KEY_DATATYPE] == TYPE_INT):
-                    converted_value = num_to_bin(converted_value)
+                converted_value = encode_value(meta, value)
                 _LOGGER.debug(f"Set {regtype} register at {address} value {converted_value} ({value}) {scale}")
-                self._client.write_single_register(address, converted_value)
-            else: 
-                raise "This register can not be changed"
-        except Exception as e:
-            _LOGGER.error(f'exception: {e}')
-            print(traceback.format_exc())
-        return value
-
-
-    async def _get_data(self, registers):
-        """Retreive data from heat pump."""
-        raw_data = {}
-        #Split into requests that reads up to self.MAX_REGISTERS within REGISTER_RANGES (register blocks) for the requested registers
-        first_chunk_address = 0
-        current_type = None
-        chunks = []
-        chunk = None
-        for name in registers:
-            meta = REGISTERS[name]
-
-            if(name == ATTR_HOLDING_FIXED_SYSTEM_SUPPLY_SET_POINT):
-                #This will give an errror unless coil 42 is True, so skip if we don't know this or if it's false
-                enableAttr = ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT
-                if(enableAttr not in raw_data and enableAttr not in self.data): 
-                    _LOGGER.debug(f"Will not read {name} since we don't know if {ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT} is set, include this register in the request to read this")
-                    continue
-                if(not raw_data[ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT] and not self.data[ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT]):
-                    _LOGGER.debug(f"Will not read {name} since {ATTR_COIL_ENABLE_FIXED_SYSTEM_SUPPLY_SET_POINT} is False which disables this register")
-                    continue
-
-            reg_address = meta[KEY_ADDRESS]
-            if(chunk == None #First iteration
-                    or chunk[KEY_REG_TYPE] != meta[KEY_REG_TYPE] #New register type
-                    or (reg_address - chunk['start']) >= self.MAX_REGISTERS #Exceeds max number of registers per request
-                    or reg_address > chunk['range_end']): #Address belongs to another register block
-                if(chunk != None):
-                    chunks.append(chunk)
-                start = meta[KEY_ADDRESS]
-                chunk = { KEY_REG_TYPE: meta[KEY_REG_TYPE], 'start': start, 'slots': { name: 0 } }
-
-                if(meta[KEY_DATATYPE] == TYPE_LONG): 
-                    chunk['end'] = start + 1
-                else: 
-                    chunk['end'] = start
-
-                in_range = list(filter(lambda x: x[0] <= start and x[1] >= start, REGISTER_RANGES[self._kind][meta[KEY_REG_TYPE]]))
-                chunk['range_end'] = in_range[0][1]
-
+                sent = perf_counter()
+                written = await self._client.write_single_register(address, converted_value)
+                if self.metrics is not None:
+                    self._record_transaction(OPERATION_WRITE, regtype, address, 1, perf_counter() - sent, written)
+                if written:
+                    self._write_through((register,), (converted_value,))
             else:
-                chunk['slots'][name] = reg_address - start
-                if(meta[KEY_DATATYPE] == TYPE_LONG):
-                    chunk['end'] = reg_address + 1
-                else:
-                    chunk['end'] = reg_address
-        if(chunk != None): chunks.append(chunk)
-        _LOGGER.debug(f"Will make {len(chunks)} requests to read {len(registers)} registers")
-
+                raise ValueError(f"{register} can not be changed")
+        except Exception:  # pylint:disable=broad-except
+            _LOGGER.exception(f"Failed to set {register}")
+        return written
+
+
+    async def _write_request(self, request):
+        """Send a WriteRequest, using the single register function codes for a single value."""
+        regtype = request.reg_type
+        address = request.start
+        _LOGGER.debug(f"Set {regtype} registers at {address} values {request.values} ({request.names})")
+        sent = perf_counter()
+        if(len(request.values) == 1):
+            if(regtype == REG_COIL):
+                result = await self._client.write_single_coil(address, request.values[0])
+            else:
+                result = await self._client.write_single_register(address, request.values[0])
+        elif(regtype == REG_COIL):
+            result = await self._client.write_multiple_coils(address, request.values)
+        else:
+            result = await self._client.write_multiple_registers(address, request.values)
+        if self.metrics is not None:
+            self._record_transaction(OPERATION_WRITE, regtype, address, len(request.values), perf_counter() - sent, result)
+        if not result:
+            _LOGGER.error(f"Failed to write {regtype} {address} length {len(request.values)}, error {self._client.last_error()}")
+            return False
+        self._write_through(request.names, request.values)
+        return True
+
+    def read_plan(self, only_registers=None):
+        """Return the cached read plan used to read the given registers (all registers if None)."""
+        registers = None
+        if(only_registers != None):
+            registers = tuple(sorted(set(only_registers)))
+        #Conditional registers give an error unless their condition is set, they are left out unless the condition
+        #is known to be set, and read in a second plan when the condition itself is read, see _read
+        excluded = frozenset(register.name for register in get_catalog().conditional
+                             if registers is None or register.condition in registers
+                             or not self._conditions.get(register.condition))
+        return compile_plan(self._kind, registers, self.MAX_REGISTERS, excluded, DEFAULT_REQUEST_COST + self._delay,
+                            capabilities=self.capabilities)
+
+    async def _read(self, only_registers=None):
+        """Read registers with conditional registers after their condition, return (names planned, values read)."""
+        catalog = get_catalog()
+        selection = None
+        if(only_registers is not None):
+            selection = set(only_registers)
+            #Conditions are read along with the registers depending on them, the cached value may be outdated
+            selection.update(register.condition for register in catalog.conditional
+                             if register.name in selection and self._kind in catalog[register.condition].models)
+        plan = self.read_plan(selection)
+        raw_data = await self._get_data(plan)
+        names = plan.registers
+        enabled = [register.name for register in catalog.conditional
+                   if (selection is None or register.name in selection) and register.name not in names
+                   and raw_data.get(register.condition)]
+        if enabled:
+            plan = self.read_plan(enabled)
+            #The condition may have been cleared since it was read, that is not a failure
+            refused = set()
+            raw_data.update(await self._get_data(plan, refused))
+            for name in refused:
+                _LOGGER.debug(f"{name} is not readable, {catalog[name].condition} is no longer set")
+                self._conditions[catalog[name].condition] = False
+            names += tuple(name for name in plan.registers if name not in refused)
+        return names, raw_data
+
+    def _update_conditions(self, values):
+        """Remember the values of registers used as a condition."""
+        for name in get_catalog().conditions:
+            if name in values:
+                self._conditions[name] = bool(values[name])
+
+    async def _get_data(self, plan, refused=None):
+        """Retreive data from heat pump.
+
+        With a refused set, the registers of requests answered with an illegal data address exception
+        are added to it instead of being reported as failed.
+        """
+        raw_data = {}
+        _LOGGER.debug(f"Will make {plan.request_count} requests to read {len(plan.registers)} registers")
+
+        metrics = self.metrics
+        if metrics is not None:
+            stats = UpdateStats()
+            started = perf_counter()
+        #Only failures caused by polling too fast make the tuner back off
+        overloaded = False
         try:
-            for chunk in chunks:
-                await asyncio.sleep(self._delay)
-                start_address = chunk['start']
-                length = chunk['end'] - chunk['start'] + 1
-                regtype = chunk[KEY_REG_TYPE]
-                _LOGGER.debug(f"Reading {regtype} {start_address} length {length}")
-                read_data = None
-                if(regtype == REG_COIL):
-                    read_data = self._client.read_coils(start_address, length)
-                elif(regtype == REG_DISCRETE_INPUT):
-                    read_data = self._client.read_discrete_inputs(start_address, length)
-                elif(regtype == REG_INPUT):
-                    read_data = self._client.read_input_registers(start_address, length)
-                elif(regtype == REG_HOLDING):
-                    read_data = self._client.read_holding_registers(start_address, length)
-                if read_data:
-                    for i, (name, address) in enumerate(chunk['slots'].items()):
-                        info = REGISTERS[name]
-                        datatype = info[KEY_DATATYPE]
-                        scale = info[KEY_SCALE]
-                        val = read_data[address]
-                        if(datatype == TYPE_LONG):
-                            regs = read_data[address:(address+2)]
-                            val = word_list_to_long(regs)[0]
-                        elif(datatype == TYPE_INT):
-                            if(val == 32767): val = 0
-                            if(val > 32767): val = val - 65536
-                        elif(datatype == TYPE_STATUS):
-                            status_str = "OFF"
-                            if val == 1:
-                                status_str = "Manual Operation"
-                            elif val == 2:
-                                status_str = "Defrost"
-                            elif val == 3:
-                                status_str = "Hot water"
-                            elif val == 4:
-                                status_str = "Heat"
-                            elif val == 5:
-                                status_str = "Cool"
-                            elif val == 6:
-                                status_str = "Pool"
-                            elif val == 7:
-                                status_str = "Anti legionella"
-                            elif val == 98:
-                                status_str = "Standby"
-                            elif val == 99:
-                                status_str = "No demand"
-                            val = status_str
-
-                        if(scale != 1): val = val / scale
-                        raw_data[name] = val
+            requests = zip(plan.requests, plan.decoders)
+            if(self._pipeline > 1 and refused is None and hasattr(self._client, 'read_pipelined')):
+                requests = await self._read_pipelined(plan, raw_data, stats if metrics is not None else None)
+            #Requests not read by the pipeline are read one at a time, with retries
+            for chunk, decoder in requests:
+                if metrics is None:
+                    await asyncio.sleep(self._delay)
+                    read_data, retries = await self._read_retrying(chunk)
+                    if read_data:
+                        decoder.decode_into(read_data, raw_data)
                 else:
-                    if self._client.last_error() > 0:
-                        _LOGGER.error(f'error {self._client.last_error()}')
-                    raise Exception(f"Failed to read {regtype} {start_address} length {length}", self._client.last_error())
+                    read_data, retries = await self._read_instrumented(chunk, decoder, raw_data, stats)
+                if not read_data:
+                    if(refused is not None and self._client.last_error() == MB_EXCEPT_ERR
+                            and self._client.last_except() == EXP_DATA_ADDRESS):
+                        refused.update(name for name, _ in chunk.slots)
+                        continue
+                    #Keep reading the rest of the plan, the registers of this chunk are reported as stale/failed
+                    overloaded = overloaded or is_overload(self._client.last_error(), self._client.last_except())
+                    _LOGGER.error(f"Failed to read {chunk.reg_type} {chunk.start} length {chunk.length} after "
+                                  f"{retries + 1} attempts, error {self._client.last_error()} exception {self._client.last_except()}")
             #for regtype in register_types:
             #    last_chunk_address = 0
             #    values = []
@@ -273,8 +730,108 @@ class ThermiaGenesis:  # pylint:disable=too-many-instance-attributes
             #            raise Exception(f"Failed to read {regtype} {start_address} length {length}", self._client.last_error())
             #        last_chunk_address = chunk[1]
             #    raw_data[regtype] = values
-        except Exception as e:
-            _LOGGER.error(f'exception: {e}')
-            print(traceback.format_exc())
-
+        except Exception:  # pylint:disable=broad-except
+            _LOGGER.exception(f"Failed to read {plan}")
+        if(self._tuner is not None):
+            if(overloaded):
+                self._tuner.record_failure()
+            else:
+                self._tuner.record_success()
+            self._apply_tuning()
+
+        self._update_conditions(raw_data)
+        if metrics is not None:
+            stats.wall_time = perf_counter() - started
+            stats.registers = len(raw_data)
+            metrics.record_update(stats)
         return raw_data
+
+    async def _read_request(self, chunk):
+        """Send a ReadRequest, return the response data or None."""
+        start_address = chunk.start
+        length = chunk.length
+        regtype = chunk.reg_type
+        _LOGGER.debug(f"Reading {regtype} {start_address} length {length}")
+        if(regtype == REG_COIL):
+            return await self._client.read_coils(start_address, length)
+        elif(regtype == REG_DISCRETE_INPUT):
+            return await self._client.read_discrete_inputs(start_address, length)
+        elif(regtype == REG_INPUT):
+            return await self._client.read_input_registers(start_address, length)
+        elif(regtype == REG_HOLDING):
+            return await self._client.read_holding_registers(start_address, length)
+        return None
+
+    async def _read_instrumented(self, chunk, decoder, raw_data, stats):
+        """Delay, read and decode a ReadRequest like _get_data, recording it in metrics."""
+        started = perf_counter()
+        await asyncio.sleep(self._delay)
+        sent = perf_counter()
+        read_data, retries = await self._read_retrying(chunk)
+        received = perf_counter()
+        self._record_transaction(OPERATION_READ, chunk.reg_type, chunk.start, chunk.length, received - sent, read_data, retries)
+        if read_data:
+            decoder.decode_into(read_data, raw_data)
+            stats.decode_time += perf_counter() - received
+        else:
+            stats.failures += 1
+        stats.requests += 1
+        stats.delay_time += sent - started
+        return read_data, retries
+
+    async def _read_pipelined(self, plan, raw_data, stats):
+        """Read a plan with up to pipeline requests in flight.
+
+        Return the (request, decoder) pairs that still have to be read one at a time, requests refused
+        with an exception are not retried. Pipelining is turned off if the device does not handle it.
+        """
+        started = perf_counter()
+        await asyncio.sleep(self._delay)
+        sent = perf_counter()
+        results, ok = await self._client.read_pipelined(
+            [(READ_FUNCTION_CODES[chunk.reg_type], chunk.start, chunk.length) for chunk in plan.requests], self._pipeline)
+        if not ok:
+            _LOGGER.warning(f"{self._host}:{self._port} does not handle pipelined requests (error {self._client.last_error()}), reading one request at a time")
+            self._pipeline = 1
+        remaining = []
+        for chunk, decoder, (read_data, error, exception, latency) in zip(plan.requests, plan.decoders, results):
+            if self.metrics is not None:
+                self._record_transaction(OPERATION_READ, chunk.reg_type, chunk.start, chunk.length, latency, read_data,
+                                         error=error, exception=exception)
+            if read_data:
+                decoded = perf_counter()
+                decoder.decode_into(read_data, raw_data)
+                if stats is not None:
+                    stats.decode_time += perf_counter() - decoded
+            elif(error == MB_EXCEPT_ERR and exception != EXP_SLAVE_DEVICE_BUSY):
+                _LOGGER.error(f"Failed to read {chunk.reg_type} {chunk.start} length {chunk.length}, exception {exception}")
+            else:
+                remaining.append((chunk, decoder))
+        if stats is not None:
+            stats.requests += len(results)
+            stats.failures += len(results) - sum(1 for result in results if result[0])
+            stats.delay_time += sent - started
+        return remaining
+
+    async def _read_retrying(self, chunk):
+        """Read a ReadRequest, retrying failures that may be transient with backoff, return (data, retries)."""
+        delay = self._retry_delay
+        for retry in range(self._retries + 1):
+            if(retry > 0):
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_DELAY)
+                if not self._client.is_open() and not await self._client.open():
+                    continue
+            read_data = await self._read_request(chunk)
+            if read_data:
+                return read_data, retry
+            #Exception responses other than busy are answered the same way every time
+            if(self._client.last_error() == MB_EXCEPT_ERR and self._client.last_except() != EXP_SLAVE_DEVICE_BUSY):
+                break
+        return None, retry
+
+    def _record_transaction(self, operation, reg_type, start, length, latency, result, retries=0, error=None, exception=None):
+        if(error is None):
+            error = 0 if result else (self._client.last_error() or -1)
+            exception = self._client.last_except() if error else 0
+        self.metrics.record_transaction(Transaction(operation, reg_type, start, length, latency, retries, error, exception))
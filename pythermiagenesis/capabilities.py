@@ -0,0 +1,183 @@
+"""Register ranges and request sizes a heat pump actually answers, probed once per firmware and cached on disk."""
+import asyncio
+import json
+import logging
+import os
+
+from .catalog import get_catalog
+from .const import REG_COIL, REG_DISCRETE_INPUT, REG_HOLDING, REG_INPUT, REG_TYPES
+from .transport import EXP_SLAVE_DEVICE_BUSY, MAX_READ_BITS, MAX_READ_REGISTERS, MB_EXCEPT_ERR
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'pythermiagenesis', 'capabilities.json')
+CACHE_VERSION = 1
+#Attempts of a probe read answered with device busy
+BUSY_ATTEMPTS = 3
+
+
+class Capabilities:
+    """Blocks of addresses readable in one request, and the largest request, for each register type."""
+
+    __slots__ = ('ranges', 'limits', '_key')
+
+    def __init__(self, ranges, limits):
+        """Initialize from dicts of register type to ((start, end), ...) and to the maximum request size."""
+        self.ranges = {reg_type: tuple(tuple(block) for block in blocks) for reg_type, blocks in ranges.items()}
+        self.limits = dict(limits)
+        self._key = (tuple(sorted(self.ranges.items())), tuple(sorted(self.limits.items())))
+
+    def __eq__(self, other):
+        return isinstance(other, Capabilities) and self._key == other._key
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def supports(self, register):
+        """Return True if a register can be read."""
+        return any(start <= register.address and register.end <= end for start, end in self.ranges.get(register.reg_type, ()))
+
+    def as_dict(self):
+        return {'ranges': {reg_type: [list(block) for block in blocks] for reg_type, blocks in self.ranges.items()},
+                'limits': self.limits}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['ranges'], data['limits'])
+
+    def __repr__(self):
+        blocks = sum(len(blocks) for blocks in self.ranges.values())
+        return f"Capabilities({blocks} blocks, limits {self.limits})"
+
+
+class CapabilityCache:
+    """JSON file of Capabilities keyed by host, port, model and firmware."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        """Initialize."""
+        self.path = path
+
+    @staticmethod
+    def _key(host, port, kind, firmware):
+        return f"{host}:{port}/{kind}/{firmware}"
+
+    def _load(self):
+        try:
+            with open(self.path) as cache:
+                data = json.load(cache)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != CACHE_VERSION:
+            return {}
+        return data.get('devices', {})
+
+    def get(self, host, port, kind, firmware):
+        """Return the cached Capabilities of a device, or None."""
+        entry = self._load().get(self._key(host, port, kind, firmware))
+        return None if entry is None else Capabilities.from_dict(entry)
+
+    def put(self, host, port, kind, firmware, capabilities):
+        """Store the Capabilities of a device."""
+        devices = self._load()
+        devices[self._key(host, port, kind, firmware)] = capabilities.as_dict()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, 'w') as cache:
+            json.dump({'version': CACHE_VERSION, 'devices': devices}, cache, indent=1)
+        os.replace(temporary, self.path)
+
+
+class _ProbeFailed(Exception):
+    """The device did not answer a probe read."""
+
+
+async def async_probe_capabilities(client, kind, delay=0.0):
+    """Find which registers of a model the device answers, the blocks they form and the largest request size.
+
+    Spans of registers are read as a whole and split in halves when the device answers with an
+    exception, so unsupported registers only cost a few requests. Conditional registers are kept
+    as blocks of their own as they can not be probed. Return None if the device stops answering.
+    """
+    readers = {
+        REG_COIL: client.read_coils,
+        REG_DISCRETE_INPUT: client.read_discrete_inputs,
+        REG_INPUT: client.read_input_registers,
+        REG_HOLDING: client.read_holding_registers,
+    }
+
+    async def read(reg_type, start, length):
+        for _ in range(BUSY_ATTEMPTS):
+            await asyncio.sleep(delay)
+            if not client.is_open() and not await client.open():
+                raise _ProbeFailed()
+            if await readers[reg_type](start, length) is not None:
+                return True
+            if client.last_error() != MB_EXCEPT_ERR:
+                raise _ProbeFailed()
+            if client.last_except() != EXP_SLAVE_DEVICE_BUSY:
+                return False
+        return False
+
+    ranges = {}
+    limits = {}
+    try:
+        for reg_type in REG_TYPES:
+            ranges[reg_type], limits[reg_type] = await _probe_type(read, kind, reg_type)
+    except _ProbeFailed:
+        _LOGGER.warning(f"Capability probe failed, error {client.last_error()}")
+        return None
+    capabilities = Capabilities(ranges, limits)
+    _LOGGER.info(f"Probed {capabilities}")
+    return capabilities
+
+
+async def _probe_type(read, kind, reg_type):
+    """Return the blocks and the largest request size for one register type."""
+    protocol_limit = MAX_READ_BITS if reg_type in (REG_COIL, REG_DISCRETE_INPUT) else MAX_READ_REGISTERS
+    registers = sorted((register for register in get_catalog().for_model(kind) if register.reg_type == reg_type),
+                       key=lambda register: register.address)
+    conditional = [(register.address, register.end) for register in registers if register.condition is not None]
+    registers = [register for register in registers if register.condition is None]
+
+    #Spans of consecutive registers that the device answers in one request
+    pieces = []
+
+    async def probe(span):
+        start, end = span[0].address, max(register.end for register in span)
+        if end - start < protocol_limit and await read(reg_type, start, end - start + 1):
+            pieces.append([start, end])
+        elif len(span) > 1:
+            middle = len(span) // 2
+            await probe(span[:middle])
+            await probe(span[middle:])
+
+    if registers:
+        await probe(registers)
+
+    #Join pieces the device also answers in one request with as much of the preceding block as fits
+    blocks = []
+    for piece in pieces:
+        start = max(blocks[-1][0], piece[1] - protocol_limit + 1) if blocks else None
+        if(blocks and start <= blocks[-1][1] and await read(reg_type, start, piece[1] - start + 1)):
+            blocks[-1][1] = piece[1]
+        else:
+            blocks.append(list(piece))
+
+    #Largest request the device answers on the largest block, searched between the longest piece read and the block size
+    limit = 1
+    if blocks:
+        start, end = max(blocks, key=lambda block: block[1] - block[0])
+        low = max(piece[1] - piece[0] + 1 for piece in pieces)
+        high = min(end - start + 1, protocol_limit)
+        while low < high:
+            size = (low + high + 1) // 2
+            if await read(reg_type, start, size):
+                low = size
+            else:
+                high = size - 1
+        limit = low
+    blocks.extend(list(block) for block in conditional)
+    blocks.sort()
+    return tuple(tuple(block) for block in blocks), limit
@@ -0,0 +1,95 @@
+"""Indexed register catalog used by the hot paths instead of the REGISTERS dicts."""
+from functools import lru_cache
+
+from .const import (
+    KEY_ADDRESS,
+    KEY_DATATYPE,
+    KEY_REG_TYPE,
+    KEY_SCALE,
+    MODEL_INVERTER,
+    MODEL_MEGA,
+    TYPE_LONG,
+)
+
+MODELS = (MODEL_MEGA, MODEL_INVERTER)
+
+
+class Register:
+    """Description of a single register."""
+
+    __slots__ = ('name', 'index', 'address', 'end', 'reg_type', 'scale', 'datatype', 'models', 'condition')
+
+    def __init__(self, name, index, address, reg_type, scale, datatype, models, condition=None):
+        self.name = name
+        #Position in the catalog, stable for a given library version
+        self.index = index
+        self.address = address
+        #Last address used, 32 bit values span two registers
+        self.end = address + 1 if datatype == TYPE_LONG else address
+        self.reg_type = reg_type
+        self.scale = scale
+        self.datatype = datatype
+        self.models = models
+        #Name of the register that has to be set for this register to be readable, or None
+        self.condition = condition
+
+    def as_dict(self):
+        """Return the register in the REGISTERS dict format."""
+        meta = {KEY_ADDRESS: self.address, KEY_REG_TYPE: self.reg_type, KEY_SCALE: self.scale, KEY_DATATYPE: self.datatype}
+        for model in MODELS:
+            meta[model] = model in self.models
+        return meta
+
+    def __repr__(self):
+        return f"Register({self.name}, {self.reg_type} {self.address})"
+
+
+class RegisterCatalog:
+    """All registers with indexes by name and by (model, register type, address)."""
+
+    def __init__(self, table, conditions=None):
+        """Initialize from rows of (name, address, register type, scale, datatype, on Mega, on Inverter).
+
+        conditions maps the name of a register to the register that has to be set for it to be readable.
+        """
+        conditions = conditions or {}
+        self.registers = tuple(
+            Register(name, index, address, reg_type, scale, datatype,
+                     frozenset(model for model, available in zip(MODELS, availability) if available),
+                     conditions.get(name))
+            for index, (name, address, reg_type, scale, datatype, *availability) in enumerate(table))
+        self.by_name = {register.name: register for register in self.registers}
+        self._by_model = {model: tuple(register for register in self.registers if model in register.models)
+                          for model in MODELS}
+        #Registers with a condition, and the registers used as a condition
+        self.conditional = tuple(register for register in self.registers if register.condition is not None)
+        self.conditions = frozenset(register.condition for register in self.conditional)
+        self._by_address = {(model, register.reg_type, register.address): register
+                            for model in MODELS for register in self._by_model[model]}
+
+    def __getitem__(self, name):
+        return self.by_name[name]
+
+    def __contains__(self, name):
+        return name in self.by_name
+
+    def __iter__(self):
+        return iter(self.registers)
+
+    def __len__(self):
+        return len(self.registers)
+
+    def for_model(self, model):
+        """Return the registers available on a model, ordered by type and address."""
+        return self._by_model[model]
+
+    def lookup(self, model, reg_type, address):
+        """Return the register of a model at an address, or None."""
+        return self._by_address.get((model, reg_type, address))
+
+
+@lru_cache(maxsize=None)
+def get_catalog():
+    """Return the catalog of all known registers."""
+    from .register_map import REGISTER_CONDITIONS, REGISTER_TABLE
+    return RegisterCatalog(REGISTER_TABLE, REGISTER_CONDITIONS)
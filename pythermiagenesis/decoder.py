@@ -0,0 +1,91 @@
+"""Decode whole read responses with converters compiled once per read request."""
+from functools import lru_cache
+
+from .catalog import get_catalog
+from .const import (
+    STATUS_OFF,
+    STATUS_TEXT,
+    TYPE_BIT,
+    TYPE_INT,
+    TYPE_LONG,
+    TYPE_STATUS,
+)
+
+_BITS = (False, True)
+
+
+def _status_table():
+    values = [STATUS_OFF] * 65536
+    for code, text in STATUS_TEXT.items():
+        values[code] = text
+    return tuple(values)
+
+
+def _signed(value):
+    """Reinterpret a word as signed, 32767 is reported by the heat pump for missing values."""
+    return 0 if value == 32767 else value - 65536 if value > 32767 else value
+
+
+@lru_cache(maxsize=None)
+def value_converter(datatype, scale):
+    """Return a function mapping a raw register value to its decoded value.
+
+    Bits and status texts are looked up in a table, numbers are converted arithmetically so no
+    table of every raw value is kept per scale.
+    """
+    if datatype == TYPE_BIT:
+        return _BITS.__getitem__
+    if datatype == TYPE_STATUS:
+        return _status_table().__getitem__
+    if datatype == TYPE_INT:
+        if scale == 1:
+            return _signed
+        return lambda value: _signed(value) / scale
+    if scale == 1:
+        return int
+    return scale.__rtruediv__
+
+
+def _deferred(value):
+    """Placeholder for slots that are decoded after the first pass."""
+    return None
+
+
+class RequestDecoder:
+    """Converts the response of one ReadRequest into decoded values.
+
+    Every slot is decoded with a single call of its value converter, which covers signed
+    conversion, scaling and status texts. 32 bit values span two words and are filled in
+    afterwards.
+    """
+
+    __slots__ = ('ops', 'longs')
+
+    def __init__(self, request):
+        """Initialize."""
+        catalog = get_catalog()
+        ops = []
+        longs = []
+        for name, offset in request.slots:
+            register = catalog[name]
+            if register.datatype == TYPE_LONG:
+                ops.append((name, offset, _deferred))
+                longs.append((name, offset, register.scale))
+            else:
+                ops.append((name, offset, value_converter(register.datatype, register.scale)))
+        self.ops = tuple(ops)
+        self.longs = tuple(longs)
+
+    def decode_into(self, words, data):
+        """Decode a response and store the values in data, in slot order."""
+        for name, offset, convert in self.ops:
+            data[name] = convert(words[offset])
+        for name, offset, scale in self.longs:
+            value = (words[offset] << 16) | words[offset + 1]
+            data[name] = value if scale == 1 else value / scale
+
+    def decode(self, words):
+        """Return a dict of decoded values for a response."""
+        data = {}
+        self.decode_into(words, data)
+        return data
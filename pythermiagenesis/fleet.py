@@ -0,0 +1,139 @@
+"""Concurrent polling of many heat pumps with global and per-gateway concurrency limits."""
+import asyncio
+import logging
+from time import monotonic
+
+from .metrics import export_prometheus
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FleetResult:
+    """Outcome of polling one heat pump of a fleet."""
+
+    __slots__ = ('key', 'data', 'error', 'elapsed')
+
+    def __init__(self, key, data, error, elapsed):
+        self.key = key
+        #Values read, None if the poll failed
+        self.data = data
+        self.error = error
+        #Seconds from acquiring a slot until the poll finished
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        outcome = f"{len(self.data)} values" if self.error is None else f"error {self.error!r}"
+        return f"FleetResult({self.key}, {outcome}, {self.elapsed * 1000:.1f} ms)"
+
+
+class ThermiaFleet:
+    """Heat pumps polled concurrently, at most concurrency at a time and per_gateway through one gateway.
+
+    Pumps behind the same Modbus TCP gateway share its connection limit, by default each host is a
+    gateway. The starts of a sweep are spread evenly over stagger seconds to avoid a burst of
+    connections. Every ThermiaGenesis keeps its own delay between its requests.
+    """
+
+    def __init__(self, concurrency=32, per_gateway=1, stagger=1.0):
+        """Initialize."""
+        if concurrency < 1 or per_gateway < 1:
+            raise ValueError("Concurrency limits must be at least 1")
+        self.pumps = {}
+        self._gateways = {}
+        self._concurrency = concurrency
+        self._per_gateway = per_gateway
+        self._stagger = stagger
+        #Semaphores are bound to the event loop they are first used in
+        self._loop = None
+        self._semaphore = None
+        self._gateway_semaphores = {}
+
+    def __len__(self):
+        return len(self.pumps)
+
+    def __iter__(self):
+        return iter(self.pumps)
+
+    def __getitem__(self, key):
+        return self.pumps[key]
+
+    def add(self, thermia, key=None, gateway=None):
+        """Add a ThermiaGenesis, return the key of its results, host:port by default."""
+        if key is None:
+            key = f"{thermia._host}:{thermia._port}"
+        if key in self.pumps:
+            raise ValueError(f"Heat pump {key} is already in the fleet")
+        self.pumps[key] = thermia
+        self._gateways[key] = thermia._host if gateway is None else gateway
+        return key
+
+    def remove(self, key):
+        """Remove a heat pump and return its ThermiaGenesis, closing it is left to the caller."""
+        del self._gateways[key]
+        return self.pumps.pop(key)
+
+    async def as_completed(self, only_registers=None, keys=None):
+        """Poll all heat pumps, or those in keys, and yield a FleetResult as each poll finishes.
+
+        Polls still running when the iterator is closed are cancelled.
+        """
+        keys = list(self.pumps) if keys is None else list(keys)
+        offset = self._stagger / len(keys) if keys else 0.0
+        tasks = [asyncio.ensure_future(self._poll(key, index * offset, only_registers))
+                 for index, key in enumerate(keys)]
+        try:
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def async_update(self, only_registers=None, keys=None):
+        """Poll all heat pumps, or those in keys, and return a dict of key to FleetResult."""
+        results = {}
+        async for result in self.as_completed(only_registers, keys):
+            results[result.key] = result
+        return results
+
+    async def aclose(self):
+        """Close the connections to all heat pumps."""
+        await asyncio.gather(*(thermia.aclose() for thermia in self.pumps.values()), return_exceptions=True)
+
+    def prometheus(self, prefix='thermiagenesis'):
+        """Return the metrics of all heat pumps created with metrics as Prometheus text."""
+        return export_prometheus(*(thermia.metrics for thermia in self.pumps.values() if thermia.metrics is not None),
+                                 prefix=prefix)
+
+    def _limits(self, gateway):
+        loop = asyncio.get_event_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+            self._gateway_semaphores = {}
+        if gateway not in self._gateway_semaphores:
+            self._gateway_semaphores[gateway] = asyncio.Semaphore(self._per_gateway)
+        return self._semaphore, self._gateway_semaphores[gateway]
+
+    async def _poll(self, key, offset, only_registers):
+        thermia = self.pumps[key]
+        if offset:
+            await asyncio.sleep(offset)
+        semaphore, gateway = self._limits(self._gateways[key])
+        #A slot of the gateway first, so pumps waiting for a busy gateway do not hold global slots
+        async with gateway:
+            async with semaphore:
+                start = monotonic()
+                try:
+                    data = await thermia.async_update(only_registers=only_registers, merge=only_registers is not None)
+                except asyncio.CancelledError:
+                    #An Exception before Python 3.8
+                    raise
+                except Exception as err:  # pylint:disable=broad-except
+                    _LOGGER.debug(f"Polling {key} failed: {err!r}")
+                    return FleetResult(key, None, err, monotonic() - start)
+                return FleetResult(key, data, None, monotonic() - start)
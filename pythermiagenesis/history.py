@@ -0,0 +1,153 @@
+"""Bounded in-memory history of register values."""
+from array import array
+from time import monotonic
+
+from .const import STATUS_CODES
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+class RingBuffer:
+    """Fixed capacity buffer of (monotonic timestamp, value) samples, oldest samples are overwritten.
+
+    Storage is two preallocated float64 arrays, NumPy arrays when NumPy is installed, so memory use
+    is 16 bytes per sample regardless of how long the process runs. Queries return the samples in
+    chronological order as arrays of the same kind.
+    """
+
+    __slots__ = ('capacity', '_times', '_values', '_next', '_count', '_numpy')
+
+    def __init__(self, capacity, use_numpy=None):
+        """Initialize."""
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if use_numpy is None:
+            use_numpy = np is not None
+        self.capacity = capacity
+        self._numpy = use_numpy
+        if use_numpy:
+            self._times = np.zeros(capacity)
+            self._values = np.zeros(capacity)
+        else:
+            self._times = array('d', bytes(8 * capacity))
+            self._values = array('d', bytes(8 * capacity))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def append(self, timestamp, value):
+        """Add a sample, timestamps must not decrease."""
+        i = self._next
+        self._times[i] = timestamp
+        self._values[i] = value
+        i += 1
+        self._next = 0 if i == self.capacity else i
+        if self._count < self.capacity:
+            self._count += 1
+
+    def _physical(self, position):
+        """Index in the storage of the sample at a chronological position."""
+        oldest = self._next if self._count == self.capacity else 0
+        return (oldest + position) % self.capacity
+
+    def _slice(self, data, position):
+        """Samples from a chronological position up to the newest sample."""
+        if position >= self._count:
+            return data[:0]
+        start = self._physical(position)
+        end = self._next if self._count == self.capacity else self._count
+        if start < end:
+            return data[start:end]
+        if self._numpy:
+            return np.concatenate((data[start:], data[:end]))
+        return data[start:] + data[:end]
+
+    def _position_since(self, timestamp):
+        """First chronological position with a timestamp at or after the given one."""
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._times[self._physical(middle)] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _position(self, last=None, since=None):
+        position = 0
+        if last is not None:
+            position = max(position, self._count - last)
+        if since is not None:
+            position = max(position, self._position_since(since))
+        return position
+
+    def window(self, last=None, since=None):
+        """Return (timestamps, values) of the last N samples and/or the samples since a monotonic time."""
+        position = self._position(last, since)
+        return self._slice(self._times, position), self._slice(self._values, position)
+
+    def latest(self):
+        """Return the newest (timestamp, value) or None."""
+        if not self._count:
+            return None
+        i = self._physical(self._count - 1)
+        return self._times[i], self._values[i]
+
+    def stats(self, last=None, since=None):
+        """Return count, min, max and mean of the values in a window, or None if it is empty."""
+        values = self._slice(self._values, self._position(last, since))
+        count = len(values)
+        if not count:
+            return None
+        if self._numpy:
+            return {'count': count, 'min': float(values.min()), 'max': float(values.max()), 'mean': float(values.mean())}
+        return {'count': count, 'min': min(values), 'max': max(values), 'mean': sum(values) / count}
+
+
+class RegisterHistory:
+    """One RingBuffer per register, created when the register is first recorded."""
+
+    def __init__(self, capacity, use_numpy=None):
+        """Initialize."""
+        self.capacity = capacity
+        self._use_numpy = use_numpy
+        self.buffers = {}
+
+    def __contains__(self, name):
+        return name in self.buffers
+
+    def __getitem__(self, name):
+        return self.buffers[name]
+
+    def record(self, values, timestamp=None):
+        """Append the decoded values of an update, status texts are stored as their code."""
+        if timestamp is None:
+            timestamp = monotonic()
+        buffers = self.buffers
+        for name, value in values.items():
+            if isinstance(value, str):
+                value = STATUS_CODES.get(value)
+                if value is None:
+                    continue
+            buffer = buffers.get(name)
+            if buffer is None:
+                buffer = buffers[name] = RingBuffer(self.capacity, self._use_numpy)
+            buffer.append(timestamp, value)
+
+    def window(self, name, last=None, since=None):
+        """Return (timestamps, values) for a register, see RingBuffer.window."""
+        return self.buffers[name].window(last, since)
+
+    def stats(self, name, last=None, since=None):
+        """Return count, min, max and mean for a register, see RingBuffer.stats."""
+        return self.buffers[name].stats(last, since)
+
+    @property
+    def memory(self):
+        """Bytes allocated for samples."""
+        return len(self.buffers) * self.capacity * 16
@@ -0,0 +1,212 @@
+"""Instrumentation of Modbus transactions and updates, with Prometheus text export."""
+import logging
+from collections import deque
+
+from .const import REG_COIL, REG_DISCRETE_INPUT
+from .transport import MBAP_HEADER
+
+_LOGGER = logging.getLogger(__name__)
+
+#Upper bounds in seconds of the transaction latency histogram
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+#Number of transactions and updates kept for inspection
+DEFAULT_KEEP = 100
+
+OPERATION_READ = 'read'
+OPERATION_WRITE = 'write'
+
+#MBAP header, function code, address and count/value
+_REQUEST_BYTES = MBAP_HEADER.size + 5
+
+
+def data_bytes(reg_type, length):
+    """Number of data bytes for length registers or bits."""
+    if reg_type in (REG_COIL, REG_DISCRETE_INPUT):
+        return (length + 7) // 8
+    return length * 2
+
+
+def frame_bytes(operation, reg_type, length, ok=True):
+    """Bytes sent and received for a transaction, a failed one only counts the request."""
+    if operation == OPERATION_READ:
+        sent = _REQUEST_BYTES
+        received = MBAP_HEADER.size + 2 + data_bytes(reg_type, length)
+    else:
+        sent = _REQUEST_BYTES + (1 + data_bytes(reg_type, length) if length > 1 else 0)
+        received = _REQUEST_BYTES
+    return sent + received if ok else sent
+
+
+class Transaction:
+    """One Modbus request and its outcome."""
+
+    __slots__ = ('operation', 'reg_type', 'start', 'length', 'latency', 'bytes', 'retries', 'error', 'exception')
+
+    def __init__(self, operation, reg_type, start, length, latency, retries=0, error=0, exception=0):
+        self.operation = operation
+        self.reg_type = reg_type
+        self.start = start
+        self.length = length
+        #Seconds from sending the request until the response was decoded by the transport
+        self.latency = latency
+        self.bytes = frame_bytes(operation, reg_type, length, not error)
+        self.retries = retries
+        #MB_* error and EXP_* exception code of a failed transaction
+        self.error = error
+        self.exception = exception
+
+    @property
+    def ok(self):
+        return not self.error
+
+    def __repr__(self):
+        return (f"Transaction({self.operation} {self.reg_type} {self.start} length {self.length}, "
+                f"{self.latency * 1000:.1f} ms, error {self.error}, exception {self.exception})")
+
+
+class UpdateStats:
+    """Totals of one async_update."""
+
+    __slots__ = ('requests', 'failures', 'registers', 'wall_time', 'delay_time', 'decode_time')
+
+    def __init__(self):
+        self.requests = 0
+        self.failures = 0
+        self.registers = 0
+        self.wall_time = 0.0
+        #Time spent in the delay between requests and decoding responses
+        self.delay_time = 0.0
+        self.decode_time = 0.0
+
+    def __repr__(self):
+        return (f"UpdateStats({self.requests} requests, {self.failures} failed, {self.registers} registers, "
+                f"{self.wall_time * 1000:.1f} ms, delay {self.delay_time * 1000:.1f} ms, "
+                f"decode {self.decode_time * 1000:.2f} ms)")
+
+
+class Metrics:
+    """Counters for the transactions and updates of a heat pump, see ThermiaGenesis(metrics=...).
+
+    The last transactions and updates are kept in transactions and updates, hooks are called
+    with each Transaction and UpdateStats as they are recorded.
+    """
+
+    def __init__(self, labels=None, keep=DEFAULT_KEEP):
+        """Initialize, labels are added to every exported sample."""
+        self.labels = dict(labels or {})
+        self.transactions = deque(maxlen=keep)
+        self.updates = deque(maxlen=keep)
+        self.requests = {}
+        self.failures = {}
+        self.exceptions = {}
+        self.retries = 0
+        self.bytes = 0
+        self.latency_sum = 0.0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.update_count = 0
+        self.update_time = 0.0
+        self.delay_time = 0.0
+        self.decode_time = 0.0
+        self._transaction_hooks = []
+        self._update_hooks = []
+
+    def add_hook(self, on_transaction=None, on_update=None):
+        """Call on_transaction with every Transaction and on_update with every UpdateStats, return a function that removes them."""
+        if on_transaction is not None:
+            self._transaction_hooks.append(on_transaction)
+        if on_update is not None:
+            self._update_hooks.append(on_update)
+
+        def remove():
+            if on_transaction in self._transaction_hooks:
+                self._transaction_hooks.remove(on_transaction)
+            if on_update in self._update_hooks:
+                self._update_hooks.remove(on_update)
+        return remove
+
+    def record_transaction(self, transaction):
+        key = (transaction.operation, transaction.reg_type)
+        self.requests[key] = self.requests.get(key, 0) + 1
+        if transaction.error:
+            self.failures[key] = self.failures.get(key, 0) + 1
+        if transaction.exception:
+            self.exceptions[transaction.exception] = self.exceptions.get(transaction.exception, 0) + 1
+        self.retries += transaction.retries
+        self.bytes += transaction.bytes
+        self.latency_sum += transaction.latency
+        bucket = 0
+        while bucket < len(LATENCY_BUCKETS) and transaction.latency > LATENCY_BUCKETS[bucket]:
+            bucket += 1
+        self.latency_buckets[bucket] += 1
+        self.transactions.append(transaction)
+        self._call(self._transaction_hooks, transaction)
+
+    def record_update(self, stats):
+        self.update_count += 1
+        self.update_time += stats.wall_time
+        self.delay_time += stats.delay_time
+        self.decode_time += stats.decode_time
+        self.updates.append(stats)
+        self._call(self._update_hooks, stats)
+
+    @staticmethod
+    def _call(hooks, record):
+        for hook in hooks:
+            try:
+                hook(record)
+            except Exception:  # pylint:disable=broad-except
+                _LOGGER.exception("Error in metrics hook")
+
+    def samples(self):
+        """Yield (metric name, type, help, labels, value) for every exported value."""
+        labels = self.labels
+        for (operation, reg_type), count in sorted(self.requests.items()):
+            yield ('requests_total', 'counter', "Modbus requests sent.",
+                   {**labels, 'operation': operation, 'reg_type': reg_type}, count)
+        for (operation, reg_type), count in sorted(self.failures.items()):
+            yield ('request_failures_total', 'counter', "Modbus requests without a valid response.",
+                   {**labels, 'operation': operation, 'reg_type': reg_type}, count)
+        for code, count in sorted(self.exceptions.items()):
+            yield ('exceptions_total', 'counter', "Modbus exception responses by exception code.",
+                   {**labels, 'code': str(code)}, count)
+        yield 'retries_total', 'counter', "Modbus requests repeated after a failure.", labels, self.retries
+        yield 'bytes_total', 'counter', "Modbus TCP bytes sent and received.", labels, self.bytes
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), self.latency_buckets):
+            cumulative += count
+            yield ('request_latency_seconds', 'histogram', "Modbus request latency.",
+                   {**labels, 'le': str(bound)}, cumulative, '_bucket')
+        yield 'request_latency_seconds', 'histogram', None, labels, self.latency_sum, '_sum'
+        yield 'request_latency_seconds', 'histogram', None, labels, cumulative, '_count'
+        yield 'updates_total', 'counter', "Updates run.", labels, self.update_count
+        yield 'update_seconds_total', 'counter', "Wall time spent in updates.", labels, self.update_time
+        yield 'update_delay_seconds_total', 'counter', "Time spent in the delay between requests.", labels, self.delay_time
+        yield 'update_decode_seconds_total', 'counter', "Time spent decoding responses.", labels, self.decode_time
+
+    def prometheus(self, prefix='thermiagenesis'):
+        """Return the metrics in the Prometheus text exposition format."""
+        return export_prometheus(self, prefix=prefix)
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for value in labels.values())
+    return '{' + ','.join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + '}'
+
+
+def export_prometheus(*metrics, prefix='thermiagenesis'):
+    """Return the samples of one or more Metrics, e.g. of several heat pumps, as Prometheus text."""
+    families = {}
+    for source in metrics:
+        for name, kind, description, labels, value, *suffix in source.samples():
+            family = families.setdefault(name, [kind, description, []])
+            family[1] = family[1] or description
+            family[2].append((suffix[0] if suffix else '', labels, value))
+    lines = []
+    for name, (kind, description, samples) in families.items():
+        lines.append(f"# HELP {prefix}_{name} {description}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        for suffix, labels, value in samples:
+            lines.append(f"{prefix}_{name}{suffix}{_format_labels(labels)} {value}")
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,172 @@
+"""Read plans: the Modbus requests needed to read a selection of registers."""
+import logging
+from functools import lru_cache
+
+from .catalog import get_catalog
+from .const import REG_COIL, REG_DISCRETE_INPUT, REGISTER_RANGES
+from .decoder import RequestDecoder
+from .transport import MAX_READ_BITS, MAX_READ_REGISTERS
+
+_LOGGER = logging.getLogger(__name__)
+
+PLAN_CACHE_SIZE = 256
+
+#Estimated cost in seconds of one round trip and of each register transferred
+DEFAULT_REQUEST_COST = 0.1
+DEFAULT_REGISTER_COST = 0.00001
+
+
+class ReadRequest:
+    """A single Modbus read and the registers decoded from its response."""
+
+    __slots__ = ('reg_type', 'start', 'length', 'slots')
+
+    def __init__(self, reg_type, start, length, slots):
+        self.reg_type = reg_type
+        self.start = start
+        self.length = length
+        #Tuple of (register name, offset in the response)
+        self.slots = slots
+
+    @property
+    def end(self):
+        return self.start + self.length - 1
+
+    def __repr__(self):
+        return f"ReadRequest({self.reg_type}, start={self.start}, length={self.length}, registers={len(self.slots)})"
+
+
+class ReadPlan:
+    """Immutable list of read requests for a register selection on one model."""
+
+    __slots__ = ('kind', 'max_registers', 'requests', 'registers', '_decoders')
+
+    def __init__(self, kind, max_registers, requests):
+        self.kind = kind
+        self.max_registers = max_registers
+        self.requests = tuple(requests)
+        self.registers = tuple(name for request in self.requests for name, _ in request.slots)
+        self._decoders = None
+
+    def __len__(self):
+        return len(self.requests)
+
+    def __iter__(self):
+        return iter(self.requests)
+
+    @property
+    def decoders(self):
+        """Decoder for each request, compiled on first use."""
+        if self._decoders is None:
+            self._decoders = tuple(RequestDecoder(request) for request in self.requests)
+        return self._decoders
+
+    @property
+    def request_count(self):
+        """Number of Modbus round trips needed to execute the plan."""
+        return len(self.requests)
+
+    @property
+    def register_count(self):
+        """Number of registers (or bits) transferred, including unused gaps."""
+        return sum(request.length for request in self.requests)
+
+    @property
+    def addresses(self):
+        """List of (register type, start address, length) for each request."""
+        return [(request.reg_type, request.start, request.length) for request in self.requests]
+
+    @property
+    def slots(self):
+        """Dict of register name to (register type, address) read by the plan."""
+        return {name: (request.reg_type, request.start + offset)
+                for request in self.requests for name, offset in request.slots}
+
+    def __repr__(self):
+        return (f"ReadPlan({self.kind}, requests={self.request_count}, registers={len(self.registers)}, "
+                f"transferred={self.register_count})")
+
+
+def _find_range(ranges, register):
+    for start, end in ranges.get(register.reg_type, ()):
+        if start <= register.address and register.end <= end:
+            return (start, end)
+    return None
+
+
+def _protocol_limit(reg_type):
+    if reg_type in (REG_COIL, REG_DISCRETE_INPUT):
+        return MAX_READ_BITS
+    return MAX_READ_REGISTERS
+
+
+def _cover_block(items, max_registers, request_cost, register_cost):
+    """Split sorted (address, end, name) items of one register block into requests of minimal total cost."""
+    count = len(items)
+    best = [0.0] + [None] * count
+    split = [0] * (count + 1)
+    for i in range(1, count + 1):
+        end = items[i - 1][1]
+        for j in range(i - 1, -1, -1):
+            start = items[j][0]
+            end = max(end, items[j][1])
+            length = end - start + 1
+            if length > max_registers and j < i - 1:
+                break
+            cost = best[j] + request_cost + register_cost * length
+            if best[i] is None or cost < best[i]:
+                best[i] = cost
+                split[i] = j
+
+    requests = []
+    i = count
+    while i > 0:
+        j = split[i]
+        chunk = items[j:i]
+        start = chunk[0][0]
+        end = max(item[1] for item in chunk)
+        requests.append((start, end, [(name, address - start) for address, _, name in chunk]))
+        i = j
+    requests.reverse()
+    return requests
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def compile_plan(kind, registers=None, max_registers=16, excluded=frozenset(),
+        request_cost=DEFAULT_REQUEST_COST, register_cost=DEFAULT_REGISTER_COST, capabilities=None):
+    """Compile and cache the read plan for a tuple of register names (None for all registers of the model).
+
+    Requests never cross a REGISTER_RANGES block or exceed max_registers, and unneeded registers
+    in gaps are read whenever that is cheaper than another round trip according to the cost model.
+    With probed Capabilities their blocks and request size limits are used instead.
+    """
+    ranges = REGISTER_RANGES[kind] if capabilities is None else capabilities.ranges
+    catalog = get_catalog()
+    if registers is None:
+        selected = catalog.for_model(kind)
+    else:
+        #Make sure to sort registers by type and address
+        selected = sorted((catalog[name] for name in registers), key=lambda x: (x.reg_type, x.address))
+
+    #Group the registers by register block, keeping the order of the blocks
+    blocks = {}
+    for register in selected:
+        if register.name in excluded:
+            continue
+        block = _find_range(ranges, register)
+        if block is None:
+            _LOGGER.debug(f"Will not read {register.name} since address {register.address} is outside the {register.reg_type} ranges for {kind}")
+            continue
+        blocks.setdefault((register.reg_type, block), []).append((register.address, register.end, register.name))
+
+    requests = []
+    for (reg_type, block), items in blocks.items():
+        limit = min(max_registers if capabilities is None else capabilities.limits.get(reg_type, max_registers),
+                    _protocol_limit(reg_type))
+        items.sort()
+        for start, end, slots in _cover_block(items, limit, request_cost, register_cost):
+            requests.append(ReadRequest(reg_type, start, end - start + 1, tuple(slots)))
+
+    plan = ReadPlan(kind, max_registers, requests)
+    _LOGGER.debug(f"Compiled {plan}")
+    return plan
@@ -0,0 +1,446 @@
+"""Register map: name, address, register type, scale, datatype, available on Mega, available on Inverter.
+
+Kept as one literal tuple of constants so that it is loaded from the bytecode cache as a single
+constant when the register map is first used.
+"""
+REGISTER_TABLE = (
+    ('coil_reset_all_alarms', 3, 'coil', 1, 'bit', True, True),
+    ('coil_enable_internal_additional_heater', 4, 'coil', 1, 'bit', False, True),
+    ('coil_enable_external_additional_heater', 5, 'coil', 1, 'bit', True, True),
+    ('coil_enable_hgw', 6, 'coil', 1, 'bit', False, True),
+    ('coil_enable_flow_switch_pressure_switch', 7, 'coil', 1, 'bit', True, True),
+    ('coil_enable_tap_water', 8, 'coil', 1, 'bit', True, True),
+    ('coil_enable_heat', 9, 'coil', 1, 'bit', True, True),
+    ('coil_enable_active_cooling', 10, 'coil', 1, 'bit', True, True),
+    ('coil_enable_mix_valve_1', 11, 'coil', 1, 'bit', True, True),
+    ('coil_enable_twc', 12, 'coil', 1, 'bit', True, True),
+    ('coil_enable_wcs', 13, 'coil', 1, 'bit', True, False),
+    ('coil_enable_hot_gas_pump', 14, 'coil', 1, 'bit', True, False),
+    ('coil_enable_mix_valve_2', 16, 'coil', 1, 'bit', True, True),
+    ('coil_enable_mix_valve_3', 17, 'coil', 1, 'bit', True, True),
+    ('coil_enable_mix_valve_4', 18, 'coil', 1, 'bit', True, True),
+    ('coil_enable_mix_valve_5', 19, 'coil', 1, 'bit', True, True),
+    ('coil_enable_brine_out_monitoring', 20, 'coil', 1, 'bit', True, True),
+    ('coil_enable_brine_pump_continuous_operation', 21, 'coil', 1, 'bit', True, True),
+    ('coil_enable_system_circulation_pump', 22, 'coil', 1, 'bit', True, True),
+    ('coil_enable_dew_point_calculation', 23, 'coil', 1, 'bit', True, False),
+    ('coil_enable_anti_legionella', 24, 'coil', 1, 'bit', False, True),
+    ('coil_enable_additional_heater_only', 25, 'coil', 1, 'bit', True, True),
+    ('coil_enable_current_limitation', 26, 'coil', 1, 'bit', False, True),
+    ('coil_enable_pool', 28, 'coil', 1, 'bit', True, True),
+    ('coil_enable_surplus_heat_chiller', 29, 'coil', 1, 'bit', True, False),
+    ('coil_enable_surplus_heat_borehole', 30, 'coil', 1, 'bit', True, False),
+    ('coil_enable_external_additional_heater_for_pool', 31, 'coil', 1, 'bit', True, True),
+    ('coil_enable_internal_additional_heater_for_pool', 32, 'coil', 1, 'bit', False, True),
+    ('coil_enable_passive_cooling', 33, 'coil', 1, 'bit', True, True),
+    ('coil_enable_variable_speed_mode_for_condenser_pump', 34, 'coil', 1, 'bit', True, True),
+    ('coil_enable_variable_speed_mode_for_brine_pump', 35, 'coil', 1, 'bit', True, True),
+    ('coil_enable_cooling_mode_for_mixing_valve_1', 36, 'coil', 1, 'bit', True, True),
+    ('coil_enable_outdoor_temp_dependent_for_cooling_with_mixing_valve_1', 37, 'coil', 1, 'bit', True, True),
+    ('coil_enable_internal_brine_pump_to_start_when_cooling_is_active_for_mixing_valve_1', 38, 'coil', 1, 'bit', True, True),
+    ('coil_enable_outdoor_temp_dependent_for_external_heater', 39, 'coil', 1, 'bit', True, True),
+    ('coil_enable_brine_in_monitoring', 40, 'coil', 1, 'bit', True, True),
+    ('coil_enable_fixed_system_supply_set_point', 41, 'coil', 1, 'bit', True, False),
+    ('coil_enable_evaporator_freeze_protection', 42, 'coil', 1, 'bit', True, False),
+    ('coil_enable_outdoor_temp_dependent_for_cooling_with_mixing_valve_2', 43, 'coil', 1, 'bit', True, False),
+    ('coil_enable_dew_point_calculation_on_mixing_valve_2', 44, 'coil', 1, 'bit', True, False),
+    ('coil_enable_outdoor_temp_dependent_for_heating_with_mixing_valve_2', 45, 'coil', 1, 'bit', True, False),
+    ('coil_enable_outdoor_temp_dependent_for_cooling_with_mixing_valve_3', 46, 'coil', 1, 'bit', True, False),
+    ('coil_enable_dew_point_calculation_on_mixing_valve_3', 47, 'coil', 1, 'bit', True, False),
+    ('coil_enable_outdoor_temp_dependent_for_heating_with_mixing_valve_3', 48, 'coil', 1, 'bit', True, False),
+    ('coil_enable_outdoor_temp_dependent_for_cooling_with_mixing_valve_4', 49, 'coil', 1, 'bit', True, False),
+    ('coil_enable_dew_point_calculation_on_mixing_valve_4', 50, 'coil', 1, 'bit', True, False),
+    ('coil_enable_outdoor_temp_dependent_for_heating_with_mixing_valve_4', 51, 'coil', 1, 'bit', True, False),
+    ('coil_enable_outdoor_temp_dependent_for_cooling_with_mixing_valve_5', 52, 'coil', 1, 'bit', True, False),
+    ('coil_enable_dew_point_calculation_on_mixing_valve_5', 53, 'coil', 1, 'bit', True, False),
+    ('coil_enable_outdoor_temp_dependent_for_heating_with_mixing_valve_5', 54, 'coil', 1, 'bit', True, False),
+    ('coil_enable_internal_brine_pump_to_start_when_cooling_is_active_for_mixing_valve_2', 55, 'coil', 1, 'bit', True, False),
+    ('coil_enable_internal_brine_pump_to_start_when_cooling_is_active_for_mixing_valve_3', 56, 'coil', 1, 'bit', True, False),
+    ('coil_enable_internal_brine_pump_to_start_when_cooling_is_active_for_mixing_valve_4', 57, 'coil', 1, 'bit', True, False),
+    ('coil_enable_internal_brine_pump_to_start_when_cooling_is_active_for_mixing_valve_5', 58, 'coil', 1, 'bit', True, False),
+    ('dinput_alarm_active_class_a', 0, 'dinput', 1, 'bit', True, True),
+    ('dinput_alarm_active_class_b', 1, 'dinput', 1, 'bit', True, True),
+    ('dinput_alarm_active_class_c', 2, 'dinput', 1, 'bit', True, True),
+    ('dinput_alarm_active_class_d', 3, 'dinput', 1, 'bit', True, False),
+    ('dinput_alarm_active_class_e', 4, 'dinput', 1, 'bit', True, False),
+    ('dinput_high_pressure_switch_alarm', 9, 'dinput', 1, 'bit', True, True),
+    ('dinput_low_pressure_level_alarm', 10, 'dinput', 1, 'bit', True, True),
+    ('dinput_high_discharge_pipe_temperature_alarm', 11, 'dinput', 1, 'bit', True, True),
+    ('dinput_operating_pressure_limit_indication', 12, 'dinput', 1, 'bit', True, True),
+    ('dinput_discharge_pipe_sensor_alarm', 13, 'dinput', 1, 'bit', True, True),
+    ('dinput_liquid_line_sensor_alarm', 14, 'dinput', 1, 'bit', True, True),
+    ('dinput_suction_gas_sensor_alarm', 15, 'dinput', 1, 'bit', True, True),
+    ('dinput_flow_pressure_switch_alarm', 16, 'dinput', 1, 'bit', True, True),
+    ('dinput_power_input_phase_detection_alarm', 22, 'dinput', 1, 'bit', True, True),
+    ('dinput_inverter_unit_alarm', 23, 'dinput', 1, 'bit', True, True),
+    ('dinput_system_supply_low_temperature_alarm', 24, 'dinput', 1, 'bit', True, True),
+    ('dinput_compressor_low_speed_alarm', 25, 'dinput', 1, 'bit', True, True),
+    ('dinput_low_super_heat_alarm', 26, 'dinput', 1, 'bit', True, True),
+    ('dinput_pressure_ratio_out_of_range_alarm', 27, 'dinput', 1, 'bit', True, True),
+    ('dinput_compressor_pressure_outside_envelope_alarm', 28, 'dinput', 1, 'bit', True, True),
+    ('dinput_brine_temperature_out_of_range_alarm', 29, 'dinput', 1, 'bit', True, True),
+    ('dinput_brine_in_sensor_alarm', 30, 'dinput', 1, 'bit', True, True),
+    ('dinput_brine_out_sensor_alarm', 31, 'dinput', 1, 'bit', True, True),
+    ('dinput_condenser_in_sensor_alarm', 32, 'dinput', 1, 'bit', True, True),
+    ('dinput_condenser_out_sensor_alarm', 33, 'dinput', 1, 'bit', True, True),
+    ('dinput_outdoor_sensor_alarm', 34, 'dinput', 1, 'bit', True, True),
+    ('dinput_system_supply_line_sensor_alarm', 35, 'dinput', 1, 'bit', True, True),
+    ('dinput_mix_valve_1_supply_line_sensor_alarm', 36, 'dinput', 1, 'bit', True, True),
+    ('dinput_mix_valve_2_supply_line_sensor_alarm', 37, 'dinput', 1, 'bit', True, True),
+    ('dinput_mix_valve_3_supply_line_sensor_alarm', 38, 'dinput', 1, 'bit', True, True),
+    ('dinput_mix_valve_4_supply_line_sensor_alarm', 39, 'dinput', 1, 'bit', True, True),
+    ('dinput_mix_valve_5_supply_line_sensor_alarm', 40, 'dinput', 1, 'bit', True, True),
+    ('dinput_wcs_return_line_sensor_alarm', 44, 'dinput', 1, 'bit', True, False),
+    ('dinput_twc_supply_line_sensor_alarm', 45, 'dinput', 1, 'bit', True, True),
+    ('dinput_cooling_tank_sensor_alarm', 46, 'dinput', 1, 'bit', True, False),
+    ('dinput_cooling_supply_line_sensor_alarm', 47, 'dinput', 1, 'bit', True, True),
+    ('dinput_cooling_circuit_return_line_sensor_alarm', 48, 'dinput', 1, 'bit', True, False),
+    ('dinput_brine_delta_out_of_range_alarm', 49, 'dinput', 1, 'bit', True, True),
+    ('dinput_tap_water_mid_sensor_alarm', 50, 'dinput', 1, 'bit', True, True),
+    ('dinput_twc_circulation_return_sensor_alarm', 51, 'dinput', 1, 'bit', True, True),
+    ('dinput_hgw_sensor_alarm', 52, 'dinput', 1, 'bit', False, True),
+    ('dinput_internal_additional_heater_alarm', 53, 'dinput', 1, 'bit', False, True),
+    ('dinput_brine_in_high_temperature_alarm', 55, 'dinput', 1, 'bit', True, True),
+    ('dinput_brine_in_low_temperature_alarm', 56, 'dinput', 1, 'bit', True, True),
+    ('dinput_brine_out_low_temperature_alarm', 57, 'dinput', 1, 'bit', True, True),
+    ('dinput_twc_circulation_return_low_temperature_alarm', 58, 'dinput', 1, 'bit', True, True),
+    ('dinput_twc_supply_low_temperature_alarm', 59, 'dinput', 1, 'bit', True, True),
+    ('dinput_mix_valve_1_supply_temperature_deviation_alarm', 60, 'dinput', 1, 'bit', True, True),
+    ('dinput_mix_valve_2_supply_temperature_deviation_alarm', 61, 'dinput', 1, 'bit', True, True),
+    ('dinput_mix_valve_3_supply_temperature_deviation_alarm', 62, 'dinput', 1, 'bit', True, True),
+    ('dinput_mix_valve_4_supply_temperature_deviation_alarm', 63, 'dinput', 1, 'bit', True, True),
+    ('dinput_mix_valve_5_supply_temperature_deviation_alarm', 64, 'dinput', 1, 'bit', True, True),
+    ('dinput_wcs_return_line_temperature_deviation_alarm', 65, 'dinput', 1, 'bit', True, False),
+    ('dinput_sum_alarm', 66, 'dinput', 1, 'bit', True, True),
+    ('dinput_cooling_circuit_supply_line_temperature_deviation_alarm', 67, 'dinput', 1, 'bit', True, False),
+    ('dinput_cooling_tank_temperature_deviation_alarm', 68, 'dinput', 1, 'bit', True, False),
+    ('dinput_surplus_heat_temperature_deviation_alarm', 69, 'dinput', 1, 'bit', True, False),
+    ('dinput_humidity_room_sensor_alarm', 70, 'dinput', 1, 'bit', True, False),
+    ('dinput_surplus_heat_supply_line_sensor_alarm', 71, 'dinput', 1, 'bit', True, False),
+    ('dinput_surplus_heat_return_line_sensor_alarm', 72, 'dinput', 1, 'bit', True, False),
+    ('dinput_cooling_tank_return_line_sensor_alarm', 73, 'dinput', 1, 'bit', True, False),
+    ('dinput_temperature_room_sensor_alarm', 74, 'dinput', 1, 'bit', True, True),
+    ('dinput_inverter_unit_communication_alarm', 75, 'dinput', 1, 'bit', True, True),
+    ('dinput_pool_return_line_sensor_alarm', 76, 'dinput', 1, 'bit', True, True),
+    ('dinput_external_stop_for_pool', 77, 'dinput', 1, 'bit', True, True),
+    ('dinput_external_start_brine_pump', 78, 'dinput', 1, 'bit', True, True),
+    ('dinput_external_relay_for_brine_ground_water_pump', 79, 'dinput', 1, 'bit', True, False),
+    ('dinput_tap_water_end_tank_sensor_alarm', 81, 'dinput', 1, 'bit', True, True),
+    ('dinput_maximum_time_for_anti_legionella_exceeded_alarm', 82, 'dinput', 1, 'bit', False, True),
+    ('dinput_genesis_secondary_unit_alarm', 83, 'dinput', 1, 'bit', True, False),
+    ('dinput_primary_unit_conflict_alarm', 84, 'dinput', 1, 'bit', True, False),
+    ('dinput_primary_unit_no_secondary_alarm', 85, 'dinput', 1, 'bit', True, False),
+    ('dinput_oil_boost_in_progress', 86, 'dinput', 1, 'bit', True, False),
+    ('dinput_compressor_control_signal', 199, 'dinput', 1, 'bit', True, True),
+    ('dinput_smart_grid_1', 201, 'dinput', 1, 'bit', True, True),
+    ('dinput_external_alarm_input', 202, 'dinput', 1, 'bit', True, True),
+    ('dinput_smart_grid_2', 204, 'dinput', 1, 'bit', True, True),
+    ('dinput_external_additional_heater_control_signal', 206, 'dinput', 1, 'bit', True, True),
+    ('dinput_mix_valve_1_circulation_pump_control_signal', 209, 'dinput', 1, 'bit', True, True),
+    ('dinput_condenser_pump_on_off_control', 210, 'dinput', 1, 'bit', True, True),
+    ('dinput_system_circulation_pump_control_signal', 211, 'dinput', 1, 'bit', True, True),
+    ('dinput_hot_gas_circulation_pump_control_signal', 213, 'dinput', 1, 'bit', True, False),
+    ('dinput_brine_pump_on_off_control', 218, 'dinput', 1, 'bit', True, True),
+    ('dinput_external_heater_circulation_pump_control_signal', 219, 'dinput', 1, 'bit', True, True),
+    ('dinput_heating_season_active', 220, 'dinput', 1, 'bit', True, True),
+    ('dinput_external_additional_heater_active', 221, 'dinput', 1, 'bit', True, True),
+    ('dinput_internal_additional_heater_active', 222, 'dinput', 1, 'bit', False, True),
+    ('dinput_hgw_regulation_control_signal', 223, 'dinput', 1, 'bit', False, True),
+    ('dinput_heat_pump_stopping', 224, 'dinput', 1, 'bit', True, True),
+    ('dinput_heat_pump_ok_to_start', 225, 'dinput', 1, 'bit', True, True),
+    ('dinput_twc_supply_line_circulation_pump_control_signal', 230, 'dinput', 1, 'bit', True, True),
+    ('dinput_wcs_regulation_control_signal', 232, 'dinput', 1, 'bit', True, False),
+    ('dinput_wcs_circulation_pump_control_signal', 233, 'dinput', 1, 'bit', True, False),
+    ('dinput_twc_end_tank_heater_control_signal', 234, 'dinput', 1, 'bit', True, True),
+    ('dinput_pool_directional_valve_position', 235, 'dinput', 1, 'bit', True, True),
+    ('dinput_cooling_circuit_circulation_pump_control_signal', 236, 'dinput', 1, 'bit', True, False),
+    ('dinput_pool_circulation_pump_control_signal', 237, 'dinput', 1, 'bit', True, True),
+    ('dinput_surplus_heat_directional_valve_position', 238, 'dinput', 1, 'bit', True, False),
+    ('dinput_surplus_heat_circulation_pump_control_signal', 239, 'dinput', 1, 'bit', True, False),
+    ('dinput_cooling_circuit_regulation_control_signal', 240, 'dinput', 1, 'bit', True, False),
+    ('dinput_surplus_heat_regulation_control_signal', 241, 'dinput', 1, 'bit', True, False),
+    ('dinput_active_cooling_directional_valve_position', 242, 'dinput', 1, 'bit', True, False),
+    ('dinput_passive_active_cooling_directional_valve_position', 243, 'dinput', 1, 'bit', True, False),
+    ('dinput_pool_regulation_control_signal', 244, 'dinput', 1, 'bit', True, True),
+    ('dinput_indication_when_mixing_valve_1_is_producing_passive_cooling', 245, 'dinput', 1, 'bit', True, True),
+    ('dinput_compressor_is_unable_to_speed_up', 246, 'dinput', 1, 'bit', True, True),
+    ('input_first_prioritised_demand', 1, 'input', 1, 'status', True, True),
+    ('input_compressor_available_gears', 4, 'input', 100, 'int', True, True),
+    ('input_compressor_speed_rpm', 5, 'input', 1, 'int', True, True),
+    ('input_external_additional_heater_current_demand', 6, 'input', 100, 'int', True, True),
+    ('input_discharge_pipe_temperature', 7, 'input', 100, 'int', True, True),
+    ('input_condenser_in_temperature', 8, 'input', 100, 'int', True, True),
+    ('input_condenser_out_temperature', 9, 'input', 100, 'int', True, True),
+    ('input_brine_in_temperature', 10, 'input', 100, 'int', True, True),
+    ('input_brine_out_temperature', 11, 'input', 100, 'int', True, True),
+    ('input_system_supply_line_temperature', 12, 'input', 100, 'int', True, True),
+    ('input_outdoor_temperature', 13, 'input', 100, 'int', True, True),
+    ('input_tap_water_top_temperature', 15, 'input', 100, 'int', True, True),
+    ('input_tap_water_lower_temperature', 16, 'input', 100, 'int', True, True),
+    ('input_tap_water_weighted_temperature', 17, 'input', 100, 'int', True, True),
+    ('input_system_supply_line_calculated_set_point', 18, 'input', 100, 'int', True, True),
+    ('input_selected_heat_curve', 19, 'input', 100, 'int', True, True),
+    ('input_heat_curve_x_coordinate_1', 20, 'input', 100, 'int', True, True),
+    ('input_heat_curve_x_coordinate_2', 21, 'input', 100, 'int', True, True),
+    ('input_heat_curve_x_coordinate_3', 22, 'input', 100, 'int', True, True),
+    ('input_heat_curve_x_coordinate_4', 23, 'input', 100, 'int', True, True),
+    ('input_heat_curve_x_coordinate_5', 24, 'input', 100, 'int', True, True),
+    ('input_heat_curve_x_coordinate_6', 25, 'input', 100, 'int', True, True),
+    ('input_heat_curve_x_coordinate_7', 26, 'input', 100, 'int', True, True),
+    ('input_cooling_season_integral_value', 36, 'input', 1, 'int', True, True),
+    ('input_condenser_circulation_pump_speed', 39, 'input', 100, 'int', True, True),
+    ('input_mix_valve_1_supply_line_temperature', 40, 'input', 100, 'int', True, True),
+    ('input_buffer_tank_temperature', 41, 'input', 100, 'int', True, True),
+    ('input_mix_valve_1_position', 43, 'input', 100, 'int', True, True),
+    ('input_brine_circulation_pump_speed', 44, 'input', 100, 'int', True, True),
+    ('input_hgw_supply_line_temperature', 45, 'input', 100, 'int', False, True),
+    ('input_hot_water_directional_valve_position', 47, 'input', 1, 'int', True, False),
+    ('input_compressor_operating_hours', 48, 'input', 1, 'long', True, True),
+    ('input_tap_water_operating_hours', 50, 'input', 1, 'long', True, True),
+    ('input_external_additional_heater_operating_hours', 52, 'input', 1, 'long', True, True),
+    ('input_compressor_speed_percent', 54, 'input', 100, 'int', True, True),
+    ('input_second_prioritised_demand', 55, 'input', 1, 'status', True, True),
+    ('input_third_prioritised_demand', 56, 'input', 1, 'status', True, True),
+    ('input_software_version_major', 57, 'input', 1, 'int', True, True),
+    ('input_software_version_minor', 58, 'input', 1, 'int', True, True),
+    ('input_software_version_micro', 59, 'input', 1, 'int', True, True),
+    ('input_compressor_temporarily_blocked', 60, 'input', 1, 'int', True, True),
+    ('input_compressor_current_gear', 61, 'input', 100, 'int', True, True),
+    ('input_queued_demand_first_priority', 62, 'input', 1, 'status', True, True),
+    ('input_queued_demand_second_priority', 63, 'input', 1, 'status', True, True),
+    ('input_queued_demand_third_priority', 64, 'input', 1, 'status', True, True),
+    ('input_queued_demand_fourth_priority', 65, 'input', 1, 'status', True, True),
+    ('input_queued_demand_fifth_priority', 66, 'input', 1, 'status', True, True),
+    ('input_internal_additional_heater_current_step', 67, 'input', 1, 'int', False, True),
+    ('input_buffer_tank_charge_set_point', 68, 'input', 100, 'int', True, True),
+    ('input_electric_meter_l1_current', 69, 'input', 100, 'int', False, True),
+    ('input_electric_meter_l2_current', 70, 'input', 100, 'int', False, True),
+    ('input_electric_meter_l3_current', 71, 'input', 100, 'int', False, True),
+    ('input_electric_meter_l1_0_voltage', 72, 'input', 100, 'int', False, True),
+    ('input_electric_meter_l2_0_voltage', 73, 'input', 100, 'int', False, True),
+    ('input_electric_meter_l3_0_voltage', 74, 'input', 100, 'int', False, True),
+    ('input_electric_meter_l1_l2_voltage', 75, 'input', 10, 'int', False, True),
+    ('input_electric_meter_l2_l3_voltage', 76, 'input', 10, 'int', False, True),
+    ('input_electric_meter_l3_l1_voltage', 77, 'input', 10, 'int', False, True),
+    ('input_electric_meter_l1_power', 78, 'input', 1, 'int', False, True),
+    ('input_electric_meter_l2_power', 79, 'input', 1, 'int', False, True),
+    ('input_electric_meter_l3_power', 80, 'input', 1, 'int', False, True),
+    ('input_electric_meter_meter_value', 81, 'input', 1, 'int', False, True),
+    ('input_comfort_mode', 82, 'input', 1, 'int', True, True),
+    ('input_electric_meter_kwh_total', 83, 'input', 1, 'long', False, True),
+    ('input_wcs_valve_position', 85, 'input', 100, 'int', True, False),
+    ('input_twc_valve_position', 86, 'input', 100, 'int', True, True),
+    ('input_mix_valve_2_position', 87, 'input', 100, 'int', True, True),
+    ('input_mix_valve_3_position', 88, 'input', 100, 'int', True, True),
+    ('input_mix_valve_4_position', 89, 'input', 100, 'int', True, True),
+    ('input_mix_valve_5_position', 90, 'input', 100, 'int', True, True),
+    ('input_dew_point_room', 91, 'input', 100, 'int', True, False),
+    ('input_cooling_supply_line_mix_valve_position', 92, 'input', 100, 'int', True, False),
+    ('input_surplus_heat_fan_speed', 93, 'input', 100, 'int', True, False),
+    ('input_pool_supply_line_mix_valve_position', 94, 'input', 100, 'int', True, True),
+    ('input_twc_supply_line_temperature', 95, 'input', 100, 'int', True, True),
+    ('input_twc_return_temperature', 96, 'input', 100, 'int', True, True),
+    ('input_wcs_return_line_temperature', 97, 'input', 100, 'int', True, False),
+    ('input_twc_end_tank_temperature', 98, 'input', 100, 'int', True, True),
+    ('input_mix_valve_2_supply_line_temperature', 99, 'input', 100, 'int', True, True),
+    ('input_mix_valve_3_supply_line_temperature', 100, 'input', 100, 'int', True, True),
+    ('input_mix_valve_4_supply_line_temperature', 101, 'input', 100, 'int', True, True),
+    ('input_cooling_circuit_return_line_temperature', 103, 'input', 100, 'int', True, False),
+    ('input_cooling_tank_temperature', 104, 'input', 100, 'int', True, False),
+    ('input_cooling_tank_return_line_temperature', 105, 'input', 100, 'int', True, False),
+    ('input_cooling_circuit_supply_line_temperature', 106, 'input', 100, 'int', True, False),
+    ('input_mix_valve_5_supply_line_temperature', 107, 'input', 100, 'int', True, True),
+    ('input_mix_valve_2_return_line_temperature', 109, 'input', 100, 'int', True, True),
+    ('input_mix_valve_3_return_line_temperature', 111, 'input', 100, 'int', True, True),
+    ('input_mix_valve_4_return_line_temperature', 113, 'input', 100, 'int', True, True),
+    ('input_mix_valve_5_return_line_temperature', 115, 'input', 100, 'int', True, True),
+    ('input_surplus_heat_return_line_temperature', 117, 'input', 100, 'int', True, False),
+    ('input_surplus_heat_supply_line_temperature', 118, 'input', 100, 'int', True, False),
+    ('input_pool_supply_line_temperature', 119, 'input', 1, 'int', True, True),
+    ('input_pool_return_line_temperature', 120, 'input', 1, 'int', True, True),
+    ('input_room_temperature_sensor', 121, 'input', 10, 'int', True, True),
+    ('input_bubble_point', 122, 'input', 100, 'int', True, True),
+    ('input_dew_point', 124, 'input', 100, 'int', True, True),
+    ('input_superheat_temperature', 125, 'input', 100, 'int', True, True),
+    ('input_sub_cooling_temperature', 126, 'input', 100, 'int', True, True),
+    ('input_low_pressure_side', 127, 'input', 100, 'int', True, True),
+    ('input_high_pressure_side', 128, 'input', 100, 'int', True, True),
+    ('input_liquid_line_temperature', 129, 'input', 100, 'int', True, True),
+    ('input_suction_gas_temperature', 130, 'input', 100, 'int', True, True),
+    ('input_heating_season_integral_value', 131, 'input', 1, 'int', True, True),
+    ('input_p_value_for_gear_shifting_and_demand_calculation', 132, 'input', 100, 'int', True, True),
+    ('input_i_value_for_gear_shifting_and_demand_calculation', 133, 'input', 100, 'int', True, True),
+    ('input_d_value_for_gear_shifting_and_demand_calculation', 134, 'input', 100, 'int', True, True),
+    ('input_i_value_for_compressor_on_off_buffer_tank', 135, 'input', 100, 'int', True, True),
+    ('input_p_value_for_compressor_on_off_buffer_tank', 136, 'input', 100, 'int', True, True),
+    ('input_mix_valve_cooling_opening_degree', 137, 'input', 1, 'int', True, True),
+    ('input_desired_gear_for_tap_water', 139, 'input', 1, 'int', True, True),
+    ('input_desired_gear_for_heating', 140, 'input', 1, 'int', True, True),
+    ('input_desired_gear_for_cooling', 141, 'input', 1, 'int', True, True),
+    ('input_desired_gear_for_pool', 142, 'input', 1, 'int', True, True),
+    ('input_number_of_available_secondaries_genesis', 143, 'input', 1, 'int', True, False),
+    ('input_number_of_available_secondaries_legacy', 144, 'input', 1, 'int', True, False),
+    ('input_total_distributed_gears_to_all_units', 145, 'input', 1, 'int', True, True),
+    ('input_maximum_gear_out_of_all_the_currently_requested_gears', 146, 'input', 1, 'int', True, True),
+    ('input_desired_temperature_distribution_circuit_mix_valve_1', 147, 'input', 100, 'int', True, True),
+    ('input_desired_temperature_distribution_circuit_mix_valve_2', 148, 'input', 100, 'int', True, True),
+    ('input_desired_temperature_distribution_circuit_mix_valve_3', 149, 'input', 100, 'int', True, True),
+    ('input_desired_temperature_distribution_circuit_mix_valve_4', 150, 'input', 100, 'int', True, True),
+    ('input_desired_temperature_distribution_circuit_mix_valve_5', 151, 'input', 100, 'int', True, True),
+    ('input_disconnect_hot_gas_end_tank', 152, 'input', 1, 'int', True, False),
+    ('input_legacy_heat_pump_compressor_running', 153, 'input', 1, 'int', True, False),
+    ('input_legacy_heat_pump_reporting_alarm', 154, 'input', 1, 'int', True, False),
+    ('input_legacy_heat_pump_start_signal', 155, 'input', 1, 'int', True, False),
+    ('input_legacy_heat_pump_tap_water_signal', 156, 'input', 1, 'int', True, False),
+    ('input_primary_unit_alarm_combined_output_of_all_class_d_alarms', 160, 'input', 1, 'int', True, False),
+    ('input_primary_unit_alarm_primary_unit_has_lost_communication', 161, 'input', 1, 'int', True, False),
+    ('input_primary_unit_alarm_class_a_alarm_detected_on_the_genesis_secondary', 162, 'input', 1, 'int', True, False),
+    ('input_primary_unit_alarm_class_b_alarm_detected_on_the_genesis_secondary', 163, 'input', 1, 'int', True, False),
+    ('input_primary_unit_alarm_combined_output_of_all_class_e_alarms', 170, 'input', 1, 'int', True, False),
+    ('input_primary_unit_alarm_general_legacy_heat_pump_alarm', 171, 'input', 1, 'int', True, False),
+    ('input_primary_unit_alarm_primary_unit_can_not_communicate_with_expansion', 173, 'input', 1, 'int', True, False),
+    ('holding_operational_mode', 0, 'holding', 1, 'int', True, True),
+    ('holding_max_limitation', 3, 'holding', 100, 'int', True, True),
+    ('holding_min_limitation', 4, 'holding', 100, 'int', True, True),
+    ('holding_comfort_wheel_setting', 5, 'holding', 100, 'int', True, True),
+    ('holding_set_point_heat_curve_y_1', 6, 'holding', 100, 'int', True, True),
+    ('holding_set_point_heat_curve_y_2', 7, 'holding', 100, 'int', True, True),
+    ('holding_set_point_heat_curve_y_3', 8, 'holding', 100, 'int', True, True),
+    ('holding_set_point_heat_curve_y_4', 9, 'holding', 100, 'int', True, True),
+    ('holding_set_point_heat_curve_y_5', 10, 'holding', 100, 'int', True, True),
+    ('holding_set_point_heat_curve_y_6', 11, 'holding', 100, 'int', True, True),
+    ('holding_set_point_heat_curve_y_7', 12, 'holding', 100, 'int', True, True),
+    ('holding_heating_season_stop_temperature', 16, 'holding', 100, 'int', True, True),
+    ('holding_start_temperature_tap_water', 22, 'holding', 100, 'int', True, True),
+    ('holding_stop_temperature_tap_water', 23, 'holding', 100, 'int', True, True),
+    ('holding_minimum_allowed_gear_in_heating', 26, 'holding', 1, 'int', True, True),
+    ('holding_maximum_allowed_gear_in_heating', 27, 'holding', 1, 'int', True, True),
+    ('holding_maximum_allowed_gear_in_tap_water', 28, 'holding', 1, 'int', True, True),
+    ('holding_minimum_allowed_gear_in_tap_water', 29, 'holding', 1, 'int', True, True),
+    ('holding_cooling_mix_valve_set_point', 30, 'holding', 100, 'int', True, False),
+    ('holding_twc_mix_valve_set_point', 31, 'holding', 100, 'int', True, True),
+    ('holding_wcs_return_line_set_point', 32, 'holding', 100, 'int', True, False),
+    ('holding_twc_mix_valve_lowest_allowed_opening_degree', 33, 'holding', 100, 'int', True, True),
+    ('holding_twc_mix_valve_highest_allowed_opening_degree', 34, 'holding', 100, 'int', True, True),
+    ('holding_twc_start_temperature_immersion_heater', 35, 'holding', 100, 'int', True, True),
+    ('holding_twc_start_delay_immersion_heater', 36, 'holding', 100, 'int', True, True),
+    ('holding_twc_stop_temperature_immersion_heater', 37, 'holding', 100, 'int', True, True),
+    ('holding_wcs_mix_valve_lowest_allowed_opening_degree', 38, 'holding', 100, 'int', True, False),
+    ('holding_wcs_mix_valve_highest_allowed_opening_degree', 39, 'holding', 100, 'int', True, False),
+    ('holding_mix_valve_2_lowest_allowed_opening_degree', 40, 'holding', 100, 'int', True, True),
+    ('holding_mix_valve_2_highest_allowed_opening_degree', 41, 'holding', 100, 'int', True, True),
+    ('holding_mix_valve_3_lowest_allowed_opening_degree', 42, 'holding', 100, 'int', True, True),
+    ('holding_mix_valve_3_highest_allowed_opening_degree', 43, 'holding', 100, 'int', True, True),
+    ('holding_mix_valve_4_lowest_allowed_opening_degree', 44, 'holding', 100, 'int', True, True),
+    ('holding_mix_valve_4_highest_allowed_opening_degree', 45, 'holding', 100, 'int', True, True),
+    ('holding_mix_valve_5_lowest_allowed_opening_degree', 46, 'holding', 100, 'int', True, True),
+    ('holding_mix_valve_5_highest_allowed_opening_degree', 47, 'holding', 100, 'int', True, True),
+    ('holding_surplus_heat_chiller_set_point', 48, 'holding', 100, 'int', True, False),
+    ('holding_cooling_supply_line_mix_valve_lowest_allowed_opening_degree', 49, 'holding', 100, 'int', True, False),
+    ('holding_cooling_supply_line_mix_valve_highest_allowed_opening_degree', 50, 'holding', 100, 'int', True, False),
+    ('holding_surplus_heat_opening_degree_for_starting_fan_1', 51, 'holding', 100, 'int', True, False),
+    ('holding_surplus_heat_opening_degree_for_starting_fan_2', 52, 'holding', 100, 'int', True, False),
+    ('holding_surplus_heat_opening_degree_for_stopping_fan_1', 53, 'holding', 100, 'int', True, False),
+    ('holding_surplus_heat_opening_degree_for_stopping_fan_2', 54, 'holding', 100, 'int', True, False),
+    ('holding_surplus_heat_lowest_allowed_opening_degree', 55, 'holding', 100, 'int', True, False),
+    ('holding_surplus_heat_highest_allowed_opening_degree', 56, 'holding', 100, 'int', True, False),
+    ('holding_pool_charge_set_point', 58, 'holding', 100, 'int', True, True),
+    ('holding_pool_mix_valve_lowest_allowed_opening_degree', 59, 'holding', 100, 'int', True, False),
+    ('holding_pool_mix_valve_highest_allowed_opening_degree', 60, 'holding', 100, 'int', True, False),
+    ('holding_gear_shift_delay_heating', 61, 'holding', 1, 'int', True, True),
+    ('holding_gear_shift_delay_pool', 62, 'holding', 1, 'int', True, True),
+    ('holding_gear_shift_delay_cooling', 63, 'holding', 1, 'int', True, True),
+    ('holding_brine_in_high_alarm_limit', 67, 'holding', 100, 'int', True, True),
+    ('holding_brine_in_low_alarm_limit', 68, 'holding', 100, 'int', True, True),
+    ('holding_brine_out_low_alarm_limit', 69, 'holding', 100, 'int', True, True),
+    ('holding_brine_max_delta_limit', 70, 'holding', 100, 'int', True, True),
+    ('holding_hot_gas_pump_start_temperature_discharge_pipe', 71, 'holding', 100, 'int', True, False),
+    ('holding_hot_gas_pump_lower_stop_limit_temperature_discharge_pipe', 72, 'holding', 100, 'int', True, False),
+    ('holding_hot_gas_pump_upper_stop_limit_temperature_discharge_pipe', 73, 'holding', 100, 'int', True, False),
+    ('holding_external_additional_heater_start', 75, 'holding', 1, 'int', True, True),
+    ('holding_condenser_pump_lowest_allowed_speed', 76, 'holding', 100, 'int', True, True),
+    ('holding_brine_pump_lowest_allowed_speed', 77, 'holding', 100, 'int', True, True),
+    ('holding_external_additional_heater_stop', 78, 'holding', 100, 'int', True, True),
+    ('holding_condenser_pump_highest_allowed_speed', 79, 'holding', 100, 'int', True, True),
+    ('holding_brine_pump_highest_allowed_speed', 80, 'holding', 100, 'int', True, True),
+    ('holding_condenser_pump_standby_speed', 81, 'holding', 100, 'int', True, True),
+    ('holding_brine_pump_standby_speed', 82, 'holding', 100, 'int', True, True),
+    ('holding_minimum_allowed_gear_in_pool', 85, 'holding', 1, 'int', True, True),
+    ('holding_maximum_allowed_gear_in_pool', 86, 'holding', 1, 'int', True, True),
+    ('holding_minimum_allowed_gear_in_cooling', 87, 'holding', 1, 'int', True, True),
+    ('holding_maximum_allowed_gear_in_cooling', 88, 'holding', 1, 'int', True, True),
+    ('holding_start_temp_for_cooling', 105, 'holding', 100, 'int', True, True),
+    ('holding_stop_temp_for_cooling', 106, 'holding', 100, 'int', True, True),
+    ('holding_min_limitation_set_point_curve_radiator_mix_valve_1', 107, 'holding', 100, 'int', True, True),
+    ('holding_max_limitation_set_point_curve_radiator_mix_valve_1', 108, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_1_mix_valve_1', 109, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_2_mix_valve_1', 110, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_3_mix_valve_1', 111, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_4_mix_valve_1', 112, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_5_mix_valve_1', 113, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_6_mix_valve_1', 114, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_7_mix_valve_1', 115, 'holding', 100, 'int', True, True),
+    ('holding_fixed_system_supply_set_point', 116, 'holding', 100, 'int', True, True),
+    ('holding_min_limitation_set_point_curve_radiator_mix_valve_2', 199, 'holding', 100, 'int', True, True),
+    ('holding_max_limitation_set_point_curve_radiator_mix_valve_2', 200, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_1_mix_valve_2', 201, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_2_mix_valve_2', 202, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_3_mix_valve_2', 203, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_4_mix_valve_2', 204, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_5_mix_valve_2', 205, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_6_mix_valve_2', 206, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_7_mix_valve_2', 207, 'holding', 100, 'int', True, True),
+    ('holding_min_limitation_set_point_curve_radiator_mix_valve_3', 208, 'holding', 100, 'int', True, True),
+    ('holding_max_limitation_set_point_curve_radiator_mix_valve_3', 209, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_1_mix_valve_3', 210, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_2_mix_valve_3', 211, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_3_mix_valve_3', 212, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_4_mix_valve_3', 213, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_5_mix_valve_3', 214, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_6_mix_valve_3', 215, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_7_mix_valve_3', 216, 'holding', 100, 'int', True, True),
+    ('holding_min_limitation_set_point_curve_radiator_mix_valve_4', 239, 'holding', 100, 'int', True, True),
+    ('holding_max_limitation_set_point_curve_radiator_mix_valve_4', 240, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_1_mix_valve_4', 241, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_2_mix_valve_4', 242, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_3_mix_valve_4', 243, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_4_mix_valve_4', 244, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_5_mix_valve_4', 245, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_6_mix_valve_4', 246, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_7_mix_valve_4', 247, 'holding', 100, 'int', True, True),
+    ('holding_min_limitation_set_point_curve_radiator_mix_valve_5', 248, 'holding', 100, 'int', True, True),
+    ('holding_max_limitation_set_point_curve_radiator_mix_valve_5', 249, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_1_mix_valve_5', 250, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_2_mix_valve_5', 251, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_3_mix_valve_5', 252, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_4_mix_valve_5', 253, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_5_mix_valve_5', 254, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_6_mix_valve_5', 255, 'holding', 100, 'int', True, True),
+    ('holding_set_point_curve_y_coordinate_7_mix_valve_5', 256, 'holding', 100, 'int', True, True),
+    ('holding_set_point_return_temp_from_pool_to_heat_exchanger', 299, 'holding', 10, 'int', True, True),
+    ('holding_set_point_pool_hysteresis', 300, 'holding', 10, 'int', True, True),
+    ('holding_set_point_for_supply_line_temp_passive_cooling_with_mixing_valve_1', 302, 'holding', 100, 'int', True, True),
+    ('holding_set_point_minimum_outdoor_temp_when_cooling_is_permitted', 303, 'holding', 100, 'int', True, True),
+    ('holding_external_heater_outdoor_temp_limit', 304, 'holding', 100, 'int', True, True),
+    ('holding_selected_mode_for_mixing_valve_2', 305, 'holding', 1, 'int', True, False),
+    ('holding_desired_cooling_temperature_setpoint_mixing_valve_2', 306, 'holding', 100, 'int', True, False),
+    ('holding_seasonal_cooling_temperature_outdoor_mixing_valve_2', 307, 'holding', 100, 'int', True, False),
+    ('holding_seasonal_heating_temperature_outdoor_mixing_valve_2', 308, 'holding', 100, 'int', True, False),
+    ('holding_selected_mode_for_mixing_valve_3', 309, 'holding', 1, 'int', True, False),
+    ('holding_desired_cooling_temperature_setpoint_mixing_valve_3', 310, 'holding', 100, 'int', True, False),
+    ('holding_seasonal_cooling_temperature_outdoor_mixing_valve_3', 311, 'holding', 100, 'int', True, False),
+    ('holding_seasonal_heating_temperature_outdoor_mixing_valve_3', 312, 'holding', 100, 'int', True, False),
+    ('holding_selected_mode_for_mixing_valve_4', 313, 'holding', 1, 'int', True, False),
+    ('holding_desired_cooling_temperature_setpoint_mixing_valve_4', 314, 'holding', 100, 'int', True, False),
+    ('holding_seasonal_cooling_temperature_outdoor_mixing_valve_4', 315, 'holding', 100, 'int', True, False),
+    ('holding_seasonal_heating_temperature_outdoor_temp_mixing_valve_4', 316, 'holding', 100, 'int', True, False),
+    ('holding_selected_mode_for_mixing_valve_5', 317, 'holding', 1, 'int', True, False),
+    ('holding_desired_cooling_temperature_setpoint_mixing_valve_5', 318, 'holding', 100, 'int', True, False),
+    ('holding_seasonal_cooling_temperature_outdoor_mixing_valve_5', 319, 'holding', 100, 'int', True, False),
+    ('holding_seasonal_heating_temperature_outdoor_mixing_valve_5', 320, 'holding', 100, 'int', True, False),
+)
+
+#Registers the controller only answers while another register is set: name -> condition register
+REGISTER_CONDITIONS = {
+    'holding_fixed_system_supply_set_point': 'coil_enable_fixed_system_supply_set_point',
+}
@@ -0,0 +1,98 @@
+"""Poll registers at different intervals depending on how often they change."""
+import asyncio
+import logging
+from time import monotonic, time
+
+from .catalog import get_catalog
+from .const import (
+    GROUP_ALARMS,
+    GROUP_FIRMWARE,
+    GROUP_POLL_INTERVALS,
+    GROUP_SETTINGS,
+    GROUP_STATUS,
+    GROUP_TEMPERATURES,
+    REG_COIL,
+    REG_DISCRETE_INPUT,
+    REG_HOLDING,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def register_group(name):
+    """Return the poll group of a register."""
+    reg_type = get_catalog()[name].reg_type
+    if name.startswith('input_software_version'):
+        return GROUP_FIRMWARE
+    if reg_type in (REG_COIL, REG_HOLDING) or name.startswith('input_heat_curve'):
+        return GROUP_SETTINGS
+    if reg_type == REG_DISCRETE_INPUT and 'alarm' in name:
+        return GROUP_ALARMS
+    if 'temperature' in name:
+        return GROUP_TEMPERATURES
+    return GROUP_STATUS
+
+
+def group_registers(group, kind):
+    """Return the registers of a poll group available on a model."""
+    return [register.name for register in get_catalog().for_model(kind) if register_group(register.name) == group]
+
+
+class PollScheduler:
+    """Read each register when its poll interval has passed, merging all due registers into one read plan."""
+
+    def __init__(self, thermia, intervals=None, register_intervals=None):
+        """Initialize.
+
+        intervals overrides the poll interval in seconds per group, register_intervals per register.
+        An interval of None disables polling of that group or register, at least one register has to
+        remain enabled.
+        """
+        self._thermia = thermia
+        group_intervals = dict(GROUP_POLL_INTERVALS)
+        group_intervals.update(intervals or {})
+        self.intervals = {}
+        for register in get_catalog().for_model(thermia._kind):
+            self.intervals[register.name] = group_intervals.get(register_group(register.name))
+        self.intervals.update(register_intervals or {})
+        self.intervals = {name: interval for name, interval in self.intervals.items() if interval is not None}
+        if not self.intervals:
+            raise ValueError("Polling is disabled for every register")
+        #Registers restored from a snapshot are first due when their interval since the last read has passed
+        age = monotonic() - time()
+        updated = thermia.updated
+        self._next_poll = {name: updated[name] + age + interval if name in updated else 0.0
+                           for name, interval in self.intervals.items()}
+
+    def due(self, now=None):
+        """Return the registers whose poll interval has passed."""
+        if now is None:
+            now = monotonic()
+        return [name for name, next_poll in self._next_poll.items() if next_poll <= now]
+
+    def next_due(self):
+        """Return the monotonic time when the next register is due."""
+        return min(self._next_poll.values(), default=None)
+
+    async def async_tick(self):
+        """Read all due registers in one pass, update the heat pump data and return the values read."""
+        now = monotonic()
+        due = self.due(now)
+        if not due:
+            return {}
+        _LOGGER.debug(f"Polling {len(due)} due registers")
+        read = await self._thermia.async_update(only_registers=due, merge=True)
+        #Registers that could not be read are retried at the shortest interval
+        retry = min(self.intervals.values())
+        for name in due:
+            if name in read:
+                self._next_poll[name] = now + self.intervals[name]
+            else:
+                self._next_poll[name] = now + min(retry, self.intervals[name])
+        return read
+
+    async def async_run(self):
+        """Poll forever, sleeping until the next register is due."""
+        while True:
+            await self.async_tick()
+            await asyncio.sleep(max(0.0, self.next_due() - monotonic()))
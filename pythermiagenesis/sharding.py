@@ -0,0 +1,285 @@
+"""Fleet polling spread over worker processes, each polling its share of the heat pumps with a ThermiaFleet.
+
+Commands are sent to the workers pickled, results come back as binary messages: a header with the
+outcome and the pump key, followed by the values in the snapshot format or the error text.
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import struct
+
+from .fleet import FleetResult, ThermiaFleet
+from .snapshot import Snapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+_COMMAND_ADD = 'add'
+_COMMAND_REMOVE = 'remove'
+_COMMAND_POLL = 'poll'
+_COMMAND_STOP = 'stop'
+
+#Result of one pump: ok, elapsed seconds and the length of the key, an empty message ends a poll
+_RESULT = struct.Struct('>?dH')
+#Seconds to wait for a worker to exit after asking it to stop
+_STOP_TIMEOUT = 5.0
+
+
+def encode_result(result, thermia):
+    """Return a FleetResult of a worker as a binary message."""
+    key = result.key.encode()
+    if result.ok:
+        payload = Snapshot(thermia._host, thermia._port, thermia._kind, thermia.firmware, result.data,
+                           thermia.updated).dumps()
+    else:
+        payload = (getattr(result.error, 'message', '') or repr(result.error)).encode()
+    return _RESULT.pack(result.ok, result.elapsed, len(key)) + key + payload
+
+
+def decode_result(message):
+    """Return the FleetResult in a binary message of a worker."""
+    from . import ThermiaException
+
+    ok, elapsed, length = _RESULT.unpack_from(message)
+    key = message[_RESULT.size:_RESULT.size + length].decode()
+    payload = message[_RESULT.size + length:]
+    if ok:
+        snapshot = Snapshot.loads(payload)
+        if snapshot is not None:
+            return FleetResult(key, snapshot.values, None, elapsed)
+        return FleetResult(key, None, ThermiaException("Unreadable result from worker"), elapsed)
+    return FleetResult(key, None, ThermiaException(payload.decode()), elapsed)
+
+
+def _worker_main(connection, concurrency, per_gateway, stagger):
+    """Entry point of a worker process."""
+    try:
+        asyncio.run(_async_worker(connection, ThermiaFleet(concurrency, per_gateway, stagger)))
+    except KeyboardInterrupt:
+        pass
+
+
+async def _async_worker(connection, fleet):
+    """Handle commands one at a time until asked to stop or the parent goes away."""
+    from . import ThermiaGenesis
+
+    loop = asyncio.get_event_loop()
+    while True:
+        try:
+            command, *args = await loop.run_in_executor(None, connection.recv)
+        except EOFError:
+            break
+        if command == _COMMAND_ADD:
+            key, gateway, host, port, options = args
+            try:
+                fleet.add(ThermiaGenesis(host, port, **options), key, gateway)
+            except Exception:  # pylint:disable=broad-except
+                _LOGGER.exception(f"Could not add heat pump {key}")
+        elif command == _COMMAND_REMOVE and args[0] in fleet.pumps:
+            await fleet.remove(args[0]).aclose()
+        elif command == _COMMAND_POLL:
+            only_registers, keys = args
+            async for result in fleet.as_completed(only_registers, [key for key in keys if key in fleet.pumps]):
+                connection.send_bytes(encode_result(result, fleet[result.key]))
+            connection.send_bytes(b'')
+        elif command == _COMMAND_STOP:
+            break
+    await fleet.aclose()
+
+
+class _Worker:
+    """A worker process and the pumps assigned to it."""
+
+    __slots__ = ('process', 'connection', 'keys', 'outstanding')
+
+    def __init__(self, process, connection):
+        self.process = process
+        self.connection = connection
+        self.keys = set()
+        #Polls sent and not yet ended by the worker
+        self.outstanding = 0
+
+
+class ShardedFleet:
+    """Heat pumps polled by a pool of worker processes, see ThermiaFleet for the limits.
+
+    Pumps behind one gateway are always polled by the same worker, so concurrency and per_gateway
+    apply per worker. Pumps are added as arguments of ThermiaGenesis, as each worker creates its own
+    clients, use the asyncio transport. When a worker dies it is replaced, its pumps are spread
+    over the least loaded workers and polled again if the worker died during a poll.
+    """
+
+    def __init__(self, workers=None, concurrency=32, per_gateway=1, stagger=1.0, context='spawn'):
+        """Initialize, workers defaults to the number of CPUs, context is a multiprocessing start method."""
+        self._size = workers or os.cpu_count() or 1
+        self._options = (concurrency, per_gateway, stagger)
+        self._context = multiprocessing.get_context(context)
+        self._workers = []
+        #Key to (gateway, host, port, ThermiaGenesis arguments)
+        self._pumps = {}
+        self._assignment = {}
+        self._gateway_workers = {}
+        self.restarts = 0
+
+    def __len__(self):
+        return len(self._pumps)
+
+    def __iter__(self):
+        return iter(self._pumps)
+
+    def shards(self):
+        """Return the keys of the pumps of each worker process, by process ID."""
+        return {worker.process.pid: sorted(worker.keys) for worker in self._workers}
+
+    def add(self, host, port=502, key=None, gateway=None, **options):
+        """Add a heat pump, options are passed to ThermiaGenesis, return the key of its results."""
+        if key is None:
+            key = f"{host}:{port}"
+        if key in self._pumps:
+            raise ValueError(f"Heat pump {key} is already in the fleet")
+        self._pumps[key] = (host if gateway is None else gateway, host, port, options)
+        self._assign(key)
+        return key
+
+    def remove(self, key):
+        """Remove a heat pump, its worker closes the connection."""
+        gateway = self._pumps.pop(key)[0]
+        worker = self._assignment.pop(key)
+        worker.keys.discard(key)
+        if not any(self._pumps[other][0] == gateway for other in worker.keys):
+            self._gateway_workers.pop(gateway, None)
+        self._send(worker, (_COMMAND_REMOVE, key))
+
+    async def as_completed(self, only_registers=None, keys=None):
+        """Poll all heat pumps, or those in keys, and yield a FleetResult as each poll finishes.
+
+        Closing the iterator early waits for the polls the workers already started.
+        """
+        pending = set(self._pumps if keys is None else keys)
+        results = asyncio.Queue()
+        readers = {}
+        retried = set()
+        self._poll(pending, only_registers, results, readers)
+        try:
+            while pending:
+                item = await results.get()
+                if isinstance(item, _Worker):
+                    readers.pop(item, None)
+                    lost = [key for key in item.keys if key in pending]
+                    self._replace(item)
+                    for key in [key for key in lost if key in retried]:
+                        pending.discard(key)
+                        yield self._lost(key)
+                    retried.update(lost)
+                    self._poll([key for key in lost if key in pending], only_registers, results, readers)
+                elif item.key in pending:
+                    pending.discard(item.key)
+                    yield item
+        finally:
+            await asyncio.gather(*readers.values(), return_exceptions=True)
+
+    async def async_update(self, only_registers=None, keys=None):
+        """Poll all heat pumps, or those in keys, and return a dict of key to FleetResult."""
+        results = {}
+        async for result in self.as_completed(only_registers, keys):
+            results[result.key] = result
+        return results
+
+    async def aclose(self):
+        """Stop the worker processes, they close their connections."""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            try:
+                worker.connection.send((_COMMAND_STOP,))
+            except OSError:
+                pass
+        loop = asyncio.get_event_loop()
+        for worker in workers:
+            await loop.run_in_executor(None, worker.process.join, _STOP_TIMEOUT)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.connection.close()
+        self._assignment = {}
+        self._gateway_workers = {}
+
+    def _start_worker(self):
+        parent, child = self._context.Pipe()
+        process = self._context.Process(target=_worker_main, args=(child,) + self._options,
+                                        name='thermiagenesis-shard', daemon=True)
+        process.start()
+        child.close()
+        worker = _Worker(process, parent)
+        self._workers.append(worker)
+        _LOGGER.debug(f"Started worker {process.pid}")
+        return worker
+
+    def _assign(self, key):
+        """Send a pump to the worker of its gateway, or to the least loaded worker."""
+        gateway, host, port, options = self._pumps[key]
+        worker = self._gateway_workers.get(gateway)
+        if worker is None:
+            while len(self._workers) < self._size:
+                self._start_worker()
+            worker = min(self._workers, key=lambda worker: len(worker.keys))
+            self._gateway_workers[gateway] = worker
+        worker.keys.add(key)
+        self._assignment[key] = worker
+        self._send(worker, (_COMMAND_ADD, key, gateway, host, port, options))
+
+    def _send(self, worker, command):
+        try:
+            worker.connection.send(command)
+        except OSError:
+            #The pumps of the worker, including this one, are sent to the replacement
+            self._replace(worker)
+
+    def _replace(self, worker):
+        """Replace a dead worker and spread its pumps over the least loaded workers."""
+        if worker not in self._workers:
+            return
+        _LOGGER.warning(f"Worker {worker.process.pid} stopped responding, moving {len(worker.keys)} heat pumps")
+        self._workers.remove(worker)
+        worker.connection.close()
+        if worker.process.is_alive():
+            worker.process.terminate()
+        self.restarts += 1
+        for gateway in [gateway for gateway, owner in self._gateway_workers.items() if owner is worker]:
+            del self._gateway_workers[gateway]
+        for key in sorted(worker.keys):
+            if key in self._pumps:
+                self._assign(key)
+
+    def _poll(self, keys, only_registers, results, readers):
+        """Ask the workers of keys to poll them, results and dead workers are put in results."""
+        shards = {}
+        for key in keys:
+            shards.setdefault(self._assignment[key], []).append(key)
+        for worker, worker_keys in shards.items():
+            try:
+                worker.connection.send((_COMMAND_POLL, only_registers, worker_keys))
+            except OSError:
+                results.put_nowait(worker)
+                continue
+            worker.outstanding += 1
+            if worker not in readers or readers[worker].done():
+                readers[worker] = asyncio.ensure_future(self._read(worker, results))
+
+    async def _read(self, worker, results):
+        loop = asyncio.get_event_loop()
+        while worker.outstanding:
+            try:
+                message = await loop.run_in_executor(None, worker.connection.recv_bytes)
+            except (EOFError, OSError):
+                worker.outstanding = 0
+                results.put_nowait(worker)
+                return
+            if message:
+                results.put_nowait(decode_result(message))
+            else:
+                worker.outstanding -= 1
+
+    @staticmethod
+    def _lost(key):
+        from . import ThermiaException
+
+        return FleetResult(key, None, ThermiaException("Worker died twice while polling"), 0.0)
@@ -0,0 +1,422 @@
+"""
+Modbus TCP simulator of a Thermia Genesis heat pump (BMC controller).
+
+Serves the register layout of the Mega or Inverter register map with plausible
+values that drift over time. Reads outside REGISTER_RANGES, or spanning two
+ranges, get an illegal data address exception like the real controller, and
+conditional registers (REGISTER_CONDITIONS, e.g. the fixed system supply set
+point) can only be used while their condition coil is set. A per-request
+latency makes it usable for measuring throughput offline:
+
+    python -m pythermiagenesis.simulator --kind mega --port 5020 --latency 0.05
+"""
+import argparse
+import asyncio
+import logging
+import random
+import struct
+import threading
+from array import array
+
+from .catalog import get_catalog
+from .const import (
+    MODEL_INVERTER,
+    MODEL_MEGA,
+    REG_COIL,
+    REG_DISCRETE_INPUT,
+    REG_HOLDING,
+    REG_INPUT,
+    REGISTER_RANGES,
+    STATUS_OFF,
+    STATUS_TEXT,
+    TYPE_BIT,
+    TYPE_INT,
+    TYPE_LONG,
+    TYPE_STATUS,
+)
+from .transport import (
+    EXP_DATA_ADDRESS,
+    EXP_DATA_VALUE,
+    EXP_ILLEGAL_FUNCTION,
+    EXP_SLAVE_DEVICE_BUSY,
+    FC_READ_COILS,
+    FC_READ_DISCRETE_INPUTS,
+    FC_READ_HOLDING_REGISTERS,
+    FC_READ_INPUT_REGISTERS,
+    FC_WRITE_MULTIPLE_COILS,
+    FC_WRITE_MULTIPLE_REGISTERS,
+    FC_WRITE_SINGLE_COIL,
+    FC_WRITE_SINGLE_REGISTER,
+    MAX_READ_BITS,
+    MAX_READ_REGISTERS,
+    MAX_WRITE_BITS,
+    MAX_WRITE_REGISTERS,
+    MBAP_HEADER,
+    pack_bits,
+    unpack_bits,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_READ_TYPES = {
+    FC_READ_COILS: REG_COIL,
+    FC_READ_DISCRETE_INPUTS: REG_DISCRETE_INPUT,
+    FC_READ_HOLDING_REGISTERS: REG_HOLDING,
+    FC_READ_INPUT_REGISTERS: REG_INPUT,
+}
+_BIT_TYPES = (REG_COIL, REG_DISCRETE_INPUT)
+
+#How requests sent before the previous response arrived are handled: one at a time in order,
+#concurrently (the latency of each overlaps) or dropped, like gateways that do not support it
+PIPELINING_SERIAL = 'serial'
+PIPELINING_CONCURRENT = 'concurrent'
+PIPELINING_DROP = 'drop'
+
+#Typical temperatures by sensor name, anything else starts around 25 degrees
+_TEMPERATURES = (
+    ('outdoor', 5.0),
+    ('brine', 4.0),
+    ('tap_water', 48.0),
+    ('hot_water', 48.0),
+    ('discharge', 70.0),
+    ('suction', 0.0),
+    ('supply', 35.0),
+    ('return', 30.0),
+    ('room', 21.0),
+)
+_SOFTWARE_VERSION = {'major': 9, 'minor': 3, 'micro': 0}
+_ENABLED_COILS = ('coil_enable_heat', 'coil_enable_tap_water', 'coil_enable_brine_pump_continuous_operation')
+
+
+def _profile(register, rng):
+    """Return the initial value of a register and how far it may drift per step, or None for constants."""
+    name = register.name
+    if register.datatype == TYPE_BIT:
+        return name in _ENABLED_COILS, None
+    if register.datatype == TYPE_STATUS:
+        return 1, None
+    if register.datatype == TYPE_LONG:
+        return rng.randrange(1000, 20000), 1
+    if name.startswith('input_software_version_'):
+        return _SOFTWARE_VERSION[name.rsplit('_', 1)[1]], None
+    if 'temperature' in name:
+        base = next((value for key, value in _TEMPERATURES if key in name), 25.0)
+        if register.reg_type == REG_HOLDING:
+            return base, None
+        return round(base + rng.uniform(-2, 2), 2), 0.1
+    if any(key in name for key in ('percent', 'speed', 'position')):
+        return round(rng.uniform(20, 80), 2), 1.0
+    if register.reg_type == REG_HOLDING:
+        return rng.randrange(0, 50), None
+    return rng.randrange(0, 10), None
+
+
+class GenesisSimulator:
+    """asyncio Modbus TCP server with the register layout of one heat pump model."""
+
+    def __init__(self, kind=MODEL_INVERTER, host='127.0.0.1', port=502, unit_id=1,
+                 latency=0.0, jitter=0.0, update_interval=1.0, seed=None, busy_rate=0.0, disconnect_rate=0.0,
+                 pipelining=PIPELINING_SERIAL, ranges=None):
+        """Initialize, port 0 picks a free port which is available from port after start().
+
+        ranges replaces REGISTER_RANGES of the model, e.g. to simulate another firmware.
+        """
+        self.kind = kind
+        self.host = host
+        self.port = port
+        self.unit_id = unit_id
+        self.latency = latency
+        self.jitter = jitter
+        self.update_interval = update_interval
+        #Fraction of requests answered with a busy exception, or by closing the connection
+        self.busy_rate = busy_rate
+        self.disconnect_rate = disconnect_rate
+        self.pipelining = pipelining
+        #Number of requests answered, by function code
+        self.requests = {}
+        self._rng = random.Random(seed)
+        self._server = None
+        self._updater = None
+        #Open connections and the task serving each of them
+        self._connections = {}
+        self._thread = None
+        self._loop = None
+        self._registers = {}
+        self._values = {}
+        self._drift = {}
+        ranges = ranges or REGISTER_RANGES[kind]
+        self._ranges = ranges
+        self._bits = {reg_type: bytearray(ranges[reg_type][-1][1] + 1) for reg_type in _BIT_TYPES}
+        self._words = {reg_type: array('H', bytes(2 * (ranges[reg_type][-1][1] + 2)))
+                       for reg_type in (REG_HOLDING, REG_INPUT)}
+        for register in get_catalog().for_model(kind):
+            if self._in_range(register.reg_type, register.address, register.end - register.address + 1):
+                self._registers[register.name] = register
+                value, drift = _profile(register, self._rng)
+                if drift is not None:
+                    self._drift[register.name] = (value, drift)
+                self.set(register.name, value)
+        #(register type, address) of conditional registers -> (register type, address) of their condition
+        catalog = get_catalog()
+        self._gates = {(register.reg_type, register.address): (catalog[register.condition].reg_type,
+                                                               catalog[register.condition].address)
+                       for register in catalog.conditional}
+
+    def get(self, name):
+        """Return the value of a register as ThermiaGenesis decodes it."""
+        register = self._registers[name]
+        if register.reg_type in _BIT_TYPES:
+            return bool(self._bits[register.reg_type][register.address])
+        words = self._words[register.reg_type]
+        if register.datatype == TYPE_LONG:
+            raw = (words[register.address] << 16) | words[register.address + 1]
+        else:
+            raw = words[register.address]
+            if register.datatype == TYPE_STATUS:
+                return STATUS_TEXT.get(raw, STATUS_OFF)
+            if register.datatype == TYPE_INT:
+                #32767 is reported for missing values
+                raw = 0 if raw == 32767 else raw - 65536 if raw > 32767 else raw
+        return raw if register.scale == 1 else raw / register.scale
+
+    def set(self, name, value):
+        """Change the value of a register."""
+        register = self._registers[name]
+        self._values[name] = value
+        if register.reg_type in _BIT_TYPES:
+            self._bits[register.reg_type][register.address] = bool(value)
+            return
+        raw = int(round(value * register.scale))
+        words = self._words[register.reg_type]
+        if register.datatype == TYPE_LONG:
+            words[register.address] = (raw >> 16) & 0xFFFF
+            words[register.address + 1] = raw & 0xFFFF
+        else:
+            words[register.address] = raw & 0xFFFF
+
+    def step(self):
+        """Let the measured values drift around their initial value, counters only increase."""
+        rng = self._rng
+        for name, (initial, drift) in self._drift.items():
+            value = self._values[name]
+            if self._registers[name].datatype == TYPE_LONG:
+                self.set(name, value + (rng.random() < 0.1))
+            else:
+                self.set(name, round(value + rng.uniform(-drift, drift) + (initial - value) * 0.05, 2))
+
+    async def start(self):
+        """Start serving."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        if self.update_interval:
+            self._updater = asyncio.ensure_future(self._update_loop())
+        _LOGGER.info("Simulating a %s heat pump on %s:%s", self.kind, self.host, self.port)
+
+    async def stop(self):
+        """Stop serving and close the open connections."""
+        if self._updater is not None:
+            self._updater.cancel()
+            self._updater = None
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._connections):
+                writer.close()
+            await asyncio.gather(*self._connections.values(), return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    def start_thread(self):
+        """Serve from an event loop in a background thread, for blocking clients or to keep it off the measured loop."""
+        started = threading.Event()
+
+        def run():
+            loop = asyncio.new_event_loop()
+            self._loop = loop
+            loop.run_until_complete(self.start())
+            started.set()
+            loop.run_forever()
+            loop.run_until_complete(self.stop())
+            loop.close()
+
+        self._thread = threading.Thread(target=run, name=f"simulator-{self.kind}", daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def stop_thread(self):
+        """Stop a simulator started with start_thread()."""
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+
+    async def serve_forever(self):
+        """Start serving and keep running until cancelled."""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _update_loop(self):
+        while True:
+            await asyncio.sleep(self.update_interval)
+            self.step()
+
+    async def _handle(self, reader, writer):
+        self._connections[writer] = asyncio.current_task()
+        #Requests being answered concurrently on this connection
+        outstanding = set()
+        try:
+            while True:
+                header = await reader.readexactly(MBAP_HEADER.size)
+                transaction_id, protocol_id, length, unit_id = MBAP_HEADER.unpack(header)
+                pdu = await reader.readexactly(length - 1)
+                if protocol_id != 0 or not pdu:
+                    break
+                if self.disconnect_rate and self._rng.random() < self.disconnect_rate:
+                    break
+                if self.pipelining == PIPELINING_SERIAL:
+                    await self._respond(writer, transaction_id, unit_id, pdu)
+                    await writer.drain()
+                elif not (self.pipelining == PIPELINING_DROP and outstanding):
+                    task = asyncio.ensure_future(self._respond(writer, transaction_id, unit_id, pdu))
+                    outstanding.add(task)
+                    task.add_done_callback(outstanding.discard)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for task in outstanding:
+                task.cancel()
+            self._connections.pop(writer, None)
+            writer.close()
+
+    async def _respond(self, writer, transaction_id, unit_id, pdu):
+        if self.busy_rate and self._rng.random() < self.busy_rate:
+            response = bytes((pdu[0] | 0x80, EXP_SLAVE_DEVICE_BUSY))
+        else:
+            response = self.process(pdu)
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        if not writer.is_closing():
+            writer.write(MBAP_HEADER.pack(transaction_id, 0, len(response) + 1, unit_id) + response)
+
+    def process(self, pdu):
+        """Return the response PDU for a request PDU."""
+        function_code = pdu[0]
+        self.requests[function_code] = self.requests.get(function_code, 0) + 1
+        try:
+            if function_code in _READ_TYPES:
+                address, count = struct.unpack_from('>HH', pdu, 1)
+                data = self._read(_READ_TYPES[function_code], address, count)
+            elif function_code in (FC_WRITE_SINGLE_COIL, FC_WRITE_SINGLE_REGISTER):
+                address, value = struct.unpack_from('>HH', pdu, 1)
+                if function_code == FC_WRITE_SINGLE_COIL:
+                    if value not in (0x0000, 0xFF00):
+                        raise _ModbusException(EXP_DATA_VALUE)
+                    self._write(REG_COIL, address, [value == 0xFF00])
+                else:
+                    self._write(REG_HOLDING, address, [value])
+                data = pdu[1:5]
+            elif function_code in (FC_WRITE_MULTIPLE_COILS, FC_WRITE_MULTIPLE_REGISTERS):
+                address, count, size = struct.unpack_from('>HHB', pdu, 1)
+                if function_code == FC_WRITE_MULTIPLE_COILS:
+                    if not 1 <= count <= MAX_WRITE_BITS or size != (count + 7) // 8:
+                        raise _ModbusException(EXP_DATA_VALUE)
+                    self._write(REG_COIL, address, unpack_bits(pdu[6:], count))
+                else:
+                    if not 1 <= count <= MAX_WRITE_REGISTERS or size != count * 2:
+                        raise _ModbusException(EXP_DATA_VALUE)
+                    self._write(REG_HOLDING, address, struct.unpack_from(f'>{count}H', pdu, 6))
+                data = pdu[1:5]
+            else:
+                raise _ModbusException(EXP_ILLEGAL_FUNCTION)
+        except _ModbusException as err:
+            return bytes((function_code | 0x80, err.code))
+        except struct.error:
+            return bytes((function_code | 0x80, EXP_DATA_VALUE))
+        return bytes((function_code,)) + data
+
+    def _in_range(self, reg_type, address, count):
+        """Return True if the addresses are within one of the ranges the controller answers."""
+        ranges = self._ranges.get(reg_type, ())
+        end = address + count - 1
+        return any(start <= address and end <= last for start, last in ranges)
+
+    def _check(self, reg_type, address, count):
+        if not self._in_range(reg_type, address, count):
+            raise _ModbusException(EXP_DATA_ADDRESS)
+        for (gated_type, gated), (condition_type, condition) in self._gates.items():
+            if(gated_type == reg_type and address <= gated < address + count
+                    and not self._bits[condition_type][condition]):
+                raise _ModbusException(EXP_DATA_ADDRESS)
+
+    def _read(self, reg_type, address, count):
+        limit = MAX_READ_BITS if reg_type in _BIT_TYPES else MAX_READ_REGISTERS
+        if not 1 <= count <= limit:
+            raise _ModbusException(EXP_DATA_VALUE)
+        self._check(reg_type, address, count)
+        if reg_type in _BIT_TYPES:
+            data = pack_bits(self._bits[reg_type][address:address + count])
+        else:
+            data = struct.pack(f'>{count}H', *self._words[reg_type][address:address + count])
+        return bytes((len(data),)) + data
+
+    def _write(self, reg_type, address, values):
+        self._check(reg_type, address, len(values))
+        if reg_type == REG_COIL:
+            self._bits[REG_COIL][address:address + len(values)] = bytes(map(bool, values))
+        else:
+            self._words[REG_HOLDING][address:address + len(values)] = array('H', values)
+        #Keep the drifting values in sync with what was written
+        for name in self._drift.keys() & self._names_at(reg_type, address, len(values)):
+            self._values[name] = self.get(name)
+
+    def _names_at(self, reg_type, address, count):
+        catalog = get_catalog()
+        registers = (catalog.lookup(self.kind, reg_type, offset) for offset in range(address, address + count))
+        return {register.name for register in registers if register is not None}
+
+
+class _ModbusException(Exception):
+    """Request answered with a Modbus exception response."""
+
+    def __init__(self, code):
+        super().__init__(code)
+        self.code = code
+
+
+def main():
+    """Run a simulator from the command line."""
+    parser = argparse.ArgumentParser(description="Simulate a Thermia Genesis heat pump over Modbus TCP")
+    parser.add_argument('--kind', choices=(MODEL_MEGA, MODEL_INVERTER), default=MODEL_INVERTER)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5020)
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="random extra latency, up to this many seconds")
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--pipelining', choices=(PIPELINING_SERIAL, PIPELINING_CONCURRENT, PIPELINING_DROP),
+                        default=PIPELINING_SERIAL, help="handling of requests sent before the previous response")
+    parser.add_argument('--busy-rate', type=float, default=0.0, help="fraction of requests answered with device busy")
+    parser.add_argument('--disconnect-rate', type=float, default=0.0, help="fraction of requests answered by disconnecting")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    simulator = GenesisSimulator(args.kind, args.host, args.port, latency=args.latency,
+                                 jitter=args.jitter, seed=args.seed, busy_rate=args.busy_rate,
+                                 disconnect_rate=args.disconnect_rate, pipelining=args.pipelining)
+    try:
+        asyncio.run(simulator.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""Snapshots of decoded heat pump data, saved to disk to have data available right after a restart.
+
+File layout: magic, format version and the length of a JSON header (host, port, model, firmware,
+save time and a checksum of the register catalog), followed by one (catalog index, value,
+timestamp) record per register. Status texts are stored as their code.
+"""
+import json
+import logging
+import os
+import struct
+import zlib
+from functools import lru_cache
+from time import time
+
+from .catalog import get_catalog
+from .const import STATUS_CODES, STATUS_OFF, STATUS_TEXT, TYPE_BIT, TYPE_STATUS
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b'TGSN'
+VERSION = 1
+_HEADER = struct.Struct('>4sBH')
+_RECORD = struct.Struct('>Hdd')
+
+
+@lru_cache(maxsize=None)
+def catalog_checksum():
+    """Checksum of the register names in catalog order, snapshots of another register map are ignored."""
+    return zlib.crc32('\n'.join(register.name for register in get_catalog()).encode())
+
+
+class Snapshot:
+    """Decoded values of one heat pump with the wall clock time each value was read."""
+
+    __slots__ = ('host', 'port', 'kind', 'firmware', 'saved', 'values', 'timestamps')
+
+    def __init__(self, host, port, kind, firmware, values, timestamps, saved=None):
+        self.host = host
+        self.port = port
+        self.kind = kind
+        self.firmware = firmware
+        self.values = values
+        self.timestamps = timestamps
+        self.saved = time() if saved is None else saved
+
+    def dumps(self):
+        """Return the snapshot in the binary file format."""
+        header = json.dumps({'host': self.host, 'port': self.port, 'kind': self.kind, 'firmware': self.firmware,
+                             'saved': self.saved, 'catalog': catalog_checksum()}).encode()
+        catalog = get_catalog()
+        records = []
+        for name, value in self.values.items():
+            if isinstance(value, str):
+                value = STATUS_CODES.get(value)
+            if value is None or name not in catalog:
+                continue
+            records.append(_RECORD.pack(catalog[name].index, value, self.timestamps.get(name, self.saved)))
+        return _HEADER.pack(MAGIC, VERSION, len(header)) + header + b''.join(records)
+
+    @classmethod
+    def loads(cls, data):
+        """Return the snapshot stored in data, or None if it is not a snapshot of this register map."""
+        magic, version, length = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            return None
+        header = json.loads(data[_HEADER.size:_HEADER.size + length])
+        if header['catalog'] != catalog_checksum():
+            return None
+        registers = get_catalog().registers
+        values = {}
+        timestamps = {}
+        for index, value, timestamp in _RECORD.iter_unpack(data[_HEADER.size + length:]):
+            register = registers[index]
+            values[register.name] = _restore(register, value)
+            timestamps[register.name] = timestamp
+        return cls(header['host'], header['port'], header['kind'], header['firmware'], values, timestamps,
+                   header['saved'])
+
+    def __repr__(self):
+        return f"Snapshot({self.host}:{self.port} {self.kind} {self.firmware}, {len(self.values)} registers)"
+
+
+def _restore(register, value):
+    """Return a stored value with the type the decoder gives it."""
+    if register.datatype == TYPE_BIT:
+        return bool(value)
+    if register.datatype == TYPE_STATUS:
+        return STATUS_TEXT.get(int(value), STATUS_OFF)
+    if register.scale == 1:
+        return int(value)
+    return value
+
+
+def save_snapshot(path, snapshot):
+    """Write a snapshot to a file, replacing it atomically."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, 'wb') as output:
+        output.write(snapshot.dumps())
+    os.replace(temporary, path)
+
+
+def load_snapshot(path):
+    """Return the snapshot stored in a file, or None if there is no usable snapshot."""
+    try:
+        with open(path, 'rb') as snapshot:
+            data = snapshot.read()
+        return Snapshot.loads(data)
+    except (OSError, ValueError, KeyError, IndexError, struct.error) as err:
+        _LOGGER.debug(f"No snapshot loaded from {path}: {err}")
+        return None
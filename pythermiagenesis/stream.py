@@ -0,0 +1,140 @@
+"""Fixed-rate polling delivered as an async iterator, decoupled from the consumer by a bounded buffer."""
+import asyncio
+import logging
+from collections import deque
+from time import monotonic, time
+
+from .catalog import get_catalog
+from .const import OVERFLOW_COALESCE_LATEST, OVERFLOW_DROP_OLDEST
+from .scheduler import register_group
+
+_LOGGER = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = (OVERFLOW_DROP_OLDEST, OVERFLOW_COALESCE_LATEST)
+
+
+class StreamItem:
+    """Values of one poll, or the values changed by it, with the wall clock time the poll finished."""
+
+    __slots__ = ('timestamp', 'values', 'status', 'dropped')
+
+    def __init__(self, timestamp, values, status):
+        self.timestamp = timestamp
+        self.values = values
+        #READ_* status of each value
+        self.status = status
+        #Items dropped or coalesced into this one since the previous item was taken
+        self.dropped = 0
+
+    def __repr__(self):
+        return f"StreamItem({self.timestamp:.3f}, {len(self.values)} values, {self.dropped} dropped)"
+
+
+class StreamBuffer:
+    """Bounded queue of StreamItems, put never waits for the consumer."""
+
+    def __init__(self, size, overflow=OVERFLOW_DROP_OLDEST, merge=False):
+        """Initialize, with merge the values of dropped or coalesced items are kept in the item that follows them."""
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow}")
+        if size < 1:
+            raise ValueError("Stream buffer size must be at least 1")
+        self._items = deque()
+        self._size = size
+        self._overflow = overflow
+        self._merge = merge
+        self._event = asyncio.Event()
+        self._dropped = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def put(self, item):
+        items = self._items
+        if len(items) >= self._size:
+            self._dropped += 1
+            if self._overflow == OVERFLOW_DROP_OLDEST:
+                dropped = items.popleft()
+                following = items[0] if items else item
+            else:
+                dropped, following = items.pop(), item
+            if self._merge:
+                following.values = {**dropped.values, **following.values}
+                following.status = {**dropped.status, **following.status}
+        items.append(item)
+        self._event.set()
+
+    async def get(self):
+        """Wait for the oldest item and return it."""
+        while not self._items:
+            self._event.clear()
+            await self._event.wait()
+        item = self._items.popleft()
+        item.dropped, self._dropped = self._dropped, 0
+        return item
+
+
+async def async_stream(thermia, interval=10.0, registers=None, groups=None, deltas=False, buffer=16,
+                       overflow=OVERFLOW_DROP_OLDEST):
+    """Poll a heat pump every interval seconds and yield a StreamItem per poll, see ThermiaGenesis.stream."""
+    names = None
+    if registers is not None or groups is not None:
+        names = set(registers or ())
+        if groups is not None:
+            names.update(register.name for register in get_catalog().for_model(thermia._kind)
+                         if register_group(register.name) in groups)
+        names = sorted(names)
+    queue = StreamBuffer(buffer, overflow, merge=deltas)
+    poller = asyncio.ensure_future(_poll(thermia, interval, names, deltas, queue))
+    try:
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait((getter, poller), return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                getter.cancel()
+                #The poller only ends with an error, raise it
+                poller.result()
+            yield getter.result()
+    finally:
+        poller.cancel()
+        try:
+            await poller
+        except asyncio.CancelledError:
+            pass
+
+
+async def _poll(thermia, interval, names, deltas, queue):
+    """Poll on a fixed schedule, ticks missed by a slow poll are skipped instead of shifting the schedule."""
+    start = monotonic()
+    tick = 0
+    last = {}
+    failing = False
+    while True:
+        try:
+            await thermia.async_update(only_registers=names, merge=names is not None)
+        except asyncio.CancelledError:
+            #An Exception before Python 3.8
+            raise
+        except Exception as err:  # pylint:disable=broad-except
+            if not failing:
+                _LOGGER.warning(f"Stream poll failed, retrying every {interval} s: {getattr(err, 'message', '') or err!r}")
+            failing = True
+        else:
+            if failing:
+                _LOGGER.info("Stream poll recovered")
+            failing = False
+            data = thermia.data
+            values = dict(data) if names is None else {name: data[name] for name in names if name in data}
+            if deltas:
+                values = {name: value for name, value in values.items() if name not in last or last[name] != value}
+                last.update(values)
+            if values or not deltas:
+                status = thermia.status
+                queue.put(StreamItem(time(), values, {name: status.get(name) for name in values}))
+
+        elapsed = monotonic() - start
+        missed = int(elapsed // interval) - tick
+        if missed > 0:
+            _LOGGER.debug(f"Stream poll took longer than {interval} s, skipping {missed} ticks")
+        tick = max(tick + 1, int(elapsed // interval) + 1)
+        await asyncio.sleep(start + tick * interval - monotonic())
@@ -0,0 +1,112 @@
+"""Change notifications for register values, with optional deadbands."""
+import asyncio
+import logging
+
+from .catalog import get_catalog
+from .scheduler import register_group
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Deadband:
+    """Minimum change of a numeric value, absolute and/or relative to the last reported value, before it is reported."""
+
+    __slots__ = ('absolute', 'relative')
+
+    def __init__(self, absolute=None, relative=None):
+        self.absolute = absolute
+        self.relative = relative
+
+    def exceeded(self, old, new):
+        """Return True if the change from old to new reaches every threshold that is set."""
+        if new == old:
+            return False
+        if isinstance(new, bool) or not isinstance(new, (int, float)) or not isinstance(old, (int, float)):
+            return True
+        delta = abs(new - old)
+        if self.absolute is not None and delta < self.absolute:
+            return False
+        if self.relative is not None and delta < self.relative * abs(old):
+            return False
+        return True
+
+    def __repr__(self):
+        return f"Deadband(absolute={self.absolute}, relative={self.relative})"
+
+
+class Subscription:
+    """A callback for changes of a set of registers."""
+
+    __slots__ = ('callback', 'registers', 'deadband', 'deadbands', 'last')
+
+    def __init__(self, callback, registers, deadband, deadbands):
+        self.callback = callback
+        #None for all registers
+        self.registers = registers
+        self.deadband = deadband
+        self.deadbands = deadbands
+        #Last reported value per register
+        self.last = {}
+
+    def changes(self, values):
+        """Return the values that changed beyond their deadband and remember them as reported."""
+        changed = {}
+        last = self.last
+        names = values.keys() if self.registers is None else self.registers.intersection(values)
+        for name in names:
+            new = values[name]
+            if name in last:
+                old = last[name]
+                if old == new:
+                    continue
+                deadband = self.deadbands.get(name, self.deadband)
+                if deadband is not None and not deadband.exceeded(old, new):
+                    continue
+            changed[name] = new
+            last[name] = new
+        return changed
+
+
+class SubscriptionManager:
+    """Keeps the subscriptions of one heat pump and dispatches changed values to them."""
+
+    def __init__(self):
+        """Initialize."""
+        self._subscriptions = []
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+    def subscribe(self, callback, registers=None, groups=None, deadband=None, deadbands=None):
+        """Call callback with a dict of changed values after each update, return a function that unsubscribes.
+
+        registers and groups (see scheduler.register_group) limit the subscription, by default all
+        registers are included. deadband applies to all registers, deadbands overrides it per register.
+        callback may be a coroutine function.
+        """
+        names = None
+        if registers is not None or groups is not None:
+            names = set(registers or ())
+            if groups is not None:
+                names.update(register.name for register in get_catalog() if register_group(register.name) in groups)
+            names = frozenset(names)
+        subscription = Subscription(callback, names, deadband, dict(deadbands or {}))
+        self._subscriptions.append(subscription)
+
+        def unsubscribe():
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+        return unsubscribe
+
+    async def async_dispatch(self, values):
+        """Send the changed values to every subscription with changes."""
+        for subscription in list(self._subscriptions):
+            changed = subscription.changes(values)
+            if not changed:
+                continue
+            try:
+                result = subscription.callback(changed)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:  # pylint:disable=broad-except
+                _LOGGER.exception("Error in subscription callback")
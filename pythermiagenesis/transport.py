@@ -0,0 +1,405 @@
+"""
+Modbus TCP transports used by ThermiaGenesis.
+
+Both transports expose the same coroutine based interface, modelled on the
+pyModbusTCP client: read/write methods return the data (or True for writes) on
+success and None on failure, with details available from last_error() and
+last_except().
+"""
+import asyncio
+import logging
+import struct
+from time import perf_counter
+
+from .const import (
+    REG_COIL,
+    REG_DISCRETE_INPUT,
+    REG_HOLDING,
+    REG_INPUT,
+    TRANSPORT_ASYNCIO,
+    TRANSPORT_PYMODBUSTCP,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Function codes
+FC_READ_COILS = 0x01
+FC_READ_DISCRETE_INPUTS = 0x02
+FC_READ_HOLDING_REGISTERS = 0x03
+FC_READ_INPUT_REGISTERS = 0x04
+FC_WRITE_SINGLE_COIL = 0x05
+FC_WRITE_SINGLE_REGISTER = 0x06
+FC_WRITE_MULTIPLE_COILS = 0x0F
+FC_WRITE_MULTIPLE_REGISTERS = 0x10
+
+READ_FUNCTION_CODES = {
+    REG_COIL: FC_READ_COILS,
+    REG_DISCRETE_INPUT: FC_READ_DISCRETE_INPUTS,
+    REG_INPUT: FC_READ_INPUT_REGISTERS,
+    REG_HOLDING: FC_READ_HOLDING_REGISTERS,
+}
+_BIT_FUNCTION_CODES = (FC_READ_COILS, FC_READ_DISCRETE_INPUTS)
+
+# Error codes, same values as pyModbusTCP.constants
+MB_NO_ERR = 0
+MB_RESOLVE_ERR = 1
+MB_CONNECT_ERR = 2
+MB_SEND_ERR = 3
+MB_RECV_ERR = 4
+MB_TIMEOUT_ERR = 5
+MB_FRAME_ERR = 6
+MB_EXCEPT_ERR = 7
+MB_CRC_ERR = 8
+MB_SOCK_CLOSE_ERR = 9
+
+# Modbus exception codes
+EXP_NONE = 0
+EXP_ILLEGAL_FUNCTION = 1
+EXP_DATA_ADDRESS = 2
+EXP_DATA_VALUE = 3
+EXP_SLAVE_DEVICE_FAILURE = 4
+EXP_SLAVE_DEVICE_BUSY = 6
+
+# Protocol limits for a single request
+MAX_READ_BITS = 2000
+MAX_READ_REGISTERS = 125
+MAX_WRITE_BITS = 1968
+MAX_WRITE_REGISTERS = 123
+
+MBAP_HEADER = struct.Struct('>HHHB')
+
+
+def _valid(address, count, limit):
+    """Return True if count items from address fit in one request and in the address space."""
+    return 1 <= count <= limit and 0 <= address and address + count <= 0x10000
+
+
+def _valid_registers(values):
+    return all(0 <= value <= 0xFFFF for value in values)
+
+
+def pack_bits(bits):
+    """Pack a list of booleans into bytes, LSB first."""
+    packed = bytearray((len(bits) + 7) // 8)
+    for i, bit in enumerate(bits):
+        if bit:
+            packed[i >> 3] |= 1 << (i & 7)
+    return bytes(packed)
+
+
+def unpack_bits(data, count):
+    """Unpack count booleans from bytes, LSB first."""
+    return [bool(data[i >> 3] & (1 << (i & 7))) for i in range(count)]
+
+
+class AsyncModbusClient:
+    """Non-blocking Modbus TCP client built on asyncio streams."""
+
+    def __init__(self, host, port=502, unit_id=1, timeout=30.0):
+        """Initialize."""
+        self._host = host
+        self._port = port
+        self._unit_id = unit_id
+        self._timeout = timeout
+        self._reader = None
+        self._writer = None
+        self._transaction_id = 0
+        self._lock = None
+        self._last_error = MB_NO_ERR
+        self._last_except = EXP_NONE
+
+    def last_error(self):
+        return self._last_error
+
+    def last_except(self):
+        return self._last_except
+
+    def is_open(self):
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def open(self):
+        if self.is_open():
+            return True
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self._host, self._port), self._timeout)
+        except asyncio.TimeoutError:
+            self._last_error = MB_TIMEOUT_ERR
+            return False
+        except OSError as err:
+            _LOGGER.debug(f"Connect to {self._host}:{self._port} failed: {err}")
+            self._last_error = MB_CONNECT_ERR
+            return False
+        self._last_error = MB_NO_ERR
+        return True
+
+    async def close(self):
+        writer = self._writer
+        self._reader = None
+        self._writer = None
+        if writer is None:
+            return
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+    # Requests that can not be encoded return None, as with pyModbusTCP
+    async def read_coils(self, bit_addr, bit_nb=1):
+        if not _valid(bit_addr, bit_nb, MAX_READ_BITS):
+            return None
+        pdu = await self._read(FC_READ_COILS, bit_addr, bit_nb)
+        return self._decode_bits(pdu, bit_nb)
+
+    async def read_discrete_inputs(self, bit_addr, bit_nb=1):
+        if not _valid(bit_addr, bit_nb, MAX_READ_BITS):
+            return None
+        pdu = await self._read(FC_READ_DISCRETE_INPUTS, bit_addr, bit_nb)
+        return self._decode_bits(pdu, bit_nb)
+
+    async def read_holding_registers(self, reg_addr, reg_nb=1):
+        if not _valid(reg_addr, reg_nb, MAX_READ_REGISTERS):
+            return None
+        pdu = await self._read(FC_READ_HOLDING_REGISTERS, reg_addr, reg_nb)
+        return self._decode_registers(pdu, reg_nb)
+
+    async def read_input_registers(self, reg_addr, reg_nb=1):
+        if not _valid(reg_addr, reg_nb, MAX_READ_REGISTERS):
+            return None
+        pdu = await self._read(FC_READ_INPUT_REGISTERS, reg_addr, reg_nb)
+        return self._decode_registers(pdu, reg_nb)
+
+    async def write_single_coil(self, bit_addr, bit_value):
+        if not _valid(bit_addr, 1, 1):
+            return None
+        body = struct.pack('>HH', bit_addr, 0xFF00 if bit_value else 0x0000)
+        pdu = await self._transaction(FC_WRITE_SINGLE_COIL, body)
+        return self._check_echo(pdu, body)
+
+    async def write_single_register(self, reg_addr, reg_value):
+        if not (_valid(reg_addr, 1, 1) and _valid_registers((reg_value,))):
+            return None
+        body = struct.pack('>HH', reg_addr, reg_value)
+        pdu = await self._transaction(FC_WRITE_SINGLE_REGISTER, body)
+        return self._check_echo(pdu, body)
+
+    async def write_multiple_coils(self, bits_addr, bits_value):
+        if not _valid(bits_addr, len(bits_value), MAX_WRITE_BITS):
+            return None
+        data = pack_bits(bits_value)
+        body = struct.pack('>HHB', bits_addr, len(bits_value), len(data)) + data
+        pdu = await self._transaction(FC_WRITE_MULTIPLE_COILS, body)
+        return self._check_echo(pdu, body[:4])
+
+    async def write_multiple_registers(self, regs_addr, regs_value):
+        if not (_valid(regs_addr, len(regs_value), MAX_WRITE_REGISTERS) and _valid_registers(regs_value)):
+            return None
+        count = len(regs_value)
+        body = struct.pack(f'>HHB{count}H', regs_addr, count, count * 2, *regs_value)
+        pdu = await self._transaction(FC_WRITE_MULTIPLE_REGISTERS, body)
+        return self._check_echo(pdu, body[:4])
+
+    async def read_pipelined(self, requests, window):
+        """Send read requests of (function code, address, count) with up to window of them outstanding.
+
+        Responses are matched to requests by transaction ID. Return (results, ok) where results has
+        (data, error, exception, latency) for each request, data is None for a failed request. ok is
+        False if the device broke the protocol (unknown transaction ID, no response in time, closed
+        connection), the connection is then closed and requests without a response fail with that error.
+        """
+        results = [None] * len(requests)
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not self.is_open() and not await self.open():
+                return [(None, self._last_error, EXP_NONE, 0.0)] * len(requests), True
+            error = MB_NO_ERR
+            in_flight = {}
+            sent = 0
+            try:
+                while sent < len(requests) or in_flight:
+                    while sent < len(requests) and len(in_flight) < window:
+                        function_code, address, count = requests[sent]
+                        self._transaction_id = (self._transaction_id + 1) & 0xFFFF
+                        self._writer.write(MBAP_HEADER.pack(self._transaction_id, 0, 6, self._unit_id)
+                                           + struct.pack('>BHH', function_code, address, count))
+                        in_flight[self._transaction_id] = (sent, perf_counter())
+                        sent += 1
+                    await self._writer.drain()
+                    header = await asyncio.wait_for(self._reader.readexactly(MBAP_HEADER.size), self._timeout)
+                    rx_tid, protocol, length, unit_id = MBAP_HEADER.unpack(header)
+                    if length < 2:
+                        raise ValueError("Invalid MBAP length")
+                    pdu = await asyncio.wait_for(self._reader.readexactly(length - 1), self._timeout)
+                    if rx_tid not in in_flight or protocol != 0 or unit_id != self._unit_id:
+                        raise ValueError("Unexpected transaction")
+                    index, started = in_flight.pop(rx_tid)
+                    function_code, _, count = requests[index]
+                    results[index] = self._read_result(function_code, count, pdu) + (perf_counter() - started,)
+            except asyncio.TimeoutError:
+                error = MB_TIMEOUT_ERR
+            except asyncio.IncompleteReadError:
+                error = MB_SOCK_CLOSE_ERR
+            except ValueError:
+                error = MB_FRAME_ERR
+            except OSError:
+                error = MB_RECV_ERR
+        if error == MB_NO_ERR:
+            return results, True
+        self._last_error = error
+        await self.close()
+        return [result or (None, error, EXP_NONE, 0.0) for result in results], False
+
+    @staticmethod
+    def _read_result(function_code, count, pdu):
+        """Return (data, error, exception) for the response PDU of a read."""
+        if pdu[0] == function_code | 0x80:
+            return None, MB_EXCEPT_ERR, pdu[1] if len(pdu) > 1 else EXP_NONE
+        if pdu[0] != function_code or len(pdu) < 2 or pdu[1] != len(pdu) - 2:
+            return None, MB_FRAME_ERR, EXP_NONE
+        if function_code in _BIT_FUNCTION_CODES:
+            if pdu[1] < (count + 7) // 8:
+                return None, MB_FRAME_ERR, EXP_NONE
+            return unpack_bits(pdu[2:], count), MB_NO_ERR, EXP_NONE
+        if pdu[1] != count * 2:
+            return None, MB_FRAME_ERR, EXP_NONE
+        return list(struct.unpack_from(f'>{count}H', pdu, 2)), MB_NO_ERR, EXP_NONE
+
+    async def _read(self, function_code, address, count):
+        return await self._transaction(function_code, struct.pack('>HH', address, count))
+
+    def _decode_bits(self, pdu, count):
+        if pdu is None:
+            return None
+        if len(pdu) < 1 or pdu[0] != len(pdu) - 1 or pdu[0] < (count + 7) // 8:
+            self._last_error = MB_FRAME_ERR
+            return None
+        return unpack_bits(pdu[1:], count)
+
+    def _decode_registers(self, pdu, count):
+        if pdu is None:
+            return None
+        if len(pdu) != 1 + count * 2 or pdu[0] != count * 2:
+            self._last_error = MB_FRAME_ERR
+            return None
+        return list(struct.unpack_from(f'>{count}H', pdu, 1))
+
+    def _check_echo(self, pdu, expected):
+        if pdu is None:
+            return None
+        if pdu[:len(expected)] != expected:
+            self._last_error = MB_FRAME_ERR
+            return None
+        return True
+
+    async def _transaction(self, function_code, body):
+        """Send one request PDU and return the response data, or None."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if not self.is_open() and not await self.open():
+                return None
+            self._transaction_id = (self._transaction_id + 1) & 0xFFFF
+            tid = self._transaction_id
+            frame = MBAP_HEADER.pack(tid, 0, len(body) + 2, self._unit_id) + bytes((function_code,)) + body
+            try:
+                self._writer.write(frame)
+                await self._writer.drain()
+            except OSError:
+                self._last_error = MB_SEND_ERR
+                await self.close()
+                return None
+            try:
+                header = await asyncio.wait_for(self._reader.readexactly(MBAP_HEADER.size), self._timeout)
+                rx_tid, protocol, length, unit_id = MBAP_HEADER.unpack(header)
+                if length < 2:
+                    raise ValueError("Invalid MBAP length")
+                pdu = await asyncio.wait_for(self._reader.readexactly(length - 1), self._timeout)
+            except asyncio.TimeoutError:
+                self._last_error = MB_TIMEOUT_ERR
+                await self.close()
+                return None
+            except asyncio.IncompleteReadError:
+                self._last_error = MB_SOCK_CLOSE_ERR
+                await self.close()
+                return None
+            except ValueError:
+                self._last_error = MB_FRAME_ERR
+                await self.close()
+                return None
+            except OSError:
+                self._last_error = MB_RECV_ERR
+                await self.close()
+                return None
+        if rx_tid != tid or protocol != 0 or unit_id != self._unit_id:
+            self._last_error = MB_FRAME_ERR
+            await self.close()
+            return None
+        if pdu[0] == function_code | 0x80:
+            self._last_error = MB_EXCEPT_ERR
+            self._last_except = pdu[1] if len(pdu) > 1 else EXP_NONE
+            return None
+        if pdu[0] != function_code:
+            self._last_error = MB_FRAME_ERR
+            return None
+        self._last_error = MB_NO_ERR
+        self._last_except = EXP_NONE
+        return pdu[1:]
+
+
+class ModbusClientTransport:
+    """Coroutine interface for the blocking pyModbusTCP client."""
+
+    def __init__(self, host, port=502, unit_id=1, timeout=None):
+        """Initialize."""
+        from pyModbusTCP.client import ModbusClient
+        self._client = ModbusClient(host, port=port, unit_id=unit_id, timeout=timeout, auto_open=True)
+
+    def last_error(self):
+        return self._client.last_error()
+
+    def last_except(self):
+        return self._client.last_except()
+
+    def is_open(self):
+        return self._client.is_open()
+
+    async def open(self):
+        return self._client.open()
+
+    async def close(self):
+        self._client.close()
+
+    async def read_coils(self, bit_addr, bit_nb=1):
+        return self._client.read_coils(bit_addr, bit_nb)
+
+    async def read_discrete_inputs(self, bit_addr, bit_nb=1):
+        return self._client.read_discrete_inputs(bit_addr, bit_nb)
+
+    async def read_holding_registers(self, reg_addr, reg_nb=1):
+        return self._client.read_holding_registers(reg_addr, reg_nb)
+
+    async def read_input_registers(self, reg_addr, reg_nb=1):
+        return self._client.read_input_registers(reg_addr, reg_nb)
+
+    async def write_single_coil(self, bit_addr, bit_value):
+        return self._client.write_single_coil(bit_addr, bit_value)
+
+    async def write_single_register(self, reg_addr, reg_value):
+        return self._client.write_single_register(reg_addr, reg_value)
+
+    async def write_multiple_coils(self, bits_addr, bits_value):
+        return self._client.write_multiple_coils(bits_addr, bits_value)
+
+    async def write_multiple_registers(self, regs_addr, regs_value):
+        return self._client.write_multiple_registers(regs_addr, regs_value)
+
+
+def create_transport(transport, host, port=502, unit_id=1, timeout=None):
+    """Create the Modbus transport selected by name."""
+    if transport == TRANSPORT_ASYNCIO:
+        return AsyncModbusClient(host, port=port, unit_id=unit_id, timeout=timeout or 30.0)
+    if transport == TRANSPORT_PYMODBUSTCP:
+        return ModbusClientTransport(host, port=port, unit_id=unit_id, timeout=timeout)
+    raise ValueError(f"Unknown transport {transport}")
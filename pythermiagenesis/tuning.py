@@ -0,0 +1,119 @@
+"""Adaptive tuning of request size and inter-request delay per device."""
+import asyncio
+import logging
+
+from .const import REG_HOLDING, REG_INPUT, REGISTER_RANGES
+from .transport import EXP_SLAVE_DEVICE_BUSY, MAX_READ_REGISTERS, MB_EXCEPT_ERR
+
+_LOGGER = logging.getLogger(__name__)
+
+#Candidates tried when probing, best first
+PROBE_BLOCK_SIZES = (MAX_READ_REGISTERS, 64, 32, 16, 8)
+PROBE_DELAYS = (0.0, 0.02, 0.05, 0.1, 0.2)
+#Number of back-to-back reads that must succeed for a delay to be accepted
+PROBE_READS = 3
+
+MIN_BLOCK_SIZE = 4
+MAX_DELAY = 1.0
+#Number of polls in a row without overload before stepping back towards the tuned settings
+RECOVERY_POLLS = 10
+
+#Tuning results per (host, port) for the lifetime of the process
+_TUNERS = {}
+
+
+class AutoTuner:
+    """Largest block size and smallest delay a device handles without errors."""
+
+    def __init__(self, max_registers, delay):
+        """Initialize."""
+        self.max_registers = max_registers
+        self.delay = delay
+        #Settings found by probing, or given, that backing off steps back towards
+        self.tuned_registers = max_registers
+        self.tuned_delay = delay
+        self.probed = False
+        self.failures = 0
+        self.successes = 0
+
+    def record_failure(self):
+        """Back off after a poll that overloaded the device: halve the block size and double the delay."""
+        self.failures += 1
+        self.successes = 0
+        self.max_registers = max(MIN_BLOCK_SIZE, self.max_registers // 2)
+        self.delay = min(MAX_DELAY, max(self.delay * 2, PROBE_DELAYS[1]))
+        _LOGGER.info(f"Backing off to max_registers {self.max_registers} and delay {self.delay}")
+
+    def record_success(self):
+        """Count a poll without overload, every RECOVERY_POLLS in a row undo one back off step."""
+        if(self.max_registers >= self.tuned_registers and self.delay <= self.tuned_delay):
+            return
+        self.successes += 1
+        if(self.successes < RECOVERY_POLLS):
+            return
+        self.successes = 0
+        self.max_registers = min(self.tuned_registers, self.max_registers * 2)
+        delay = self.delay / 2
+        self.delay = delay if delay >= max(self.tuned_delay, PROBE_DELAYS[1]) else self.tuned_delay
+        _LOGGER.info(f"Recovering to max_registers {self.max_registers} and delay {self.delay}")
+
+    async def async_probe(self, client, kind):
+        """Find the largest block size and then the smallest delay that the device answers without errors."""
+        blocks = [block for reg_type in (REG_INPUT, REG_HOLDING) for block in REGISTER_RANGES[kind][reg_type]]
+        start, end = max(blocks, key=lambda block: block[1] - block[0])
+        read = client.read_input_registers
+        if (start, end) not in REGISTER_RANGES[kind][REG_INPUT]:
+            read = client.read_holding_registers
+
+        block_size = None
+        for size in PROBE_BLOCK_SIZES:
+            length = min(size, end - start + 1)
+            if await self._async_read(client, read, start, length):
+                block_size = length
+                break
+            await asyncio.sleep(PROBE_DELAYS[-1])
+        if block_size is None:
+            _LOGGER.warning("Auto tuning failed to read any block, keeping current settings")
+            return False
+
+        delay = None
+        for candidate in PROBE_DELAYS:
+            for _ in range(PROBE_READS):
+                await asyncio.sleep(candidate)
+                if not await self._async_read(client, read, start, block_size):
+                    break
+            else:
+                delay = candidate
+                break
+            await asyncio.sleep(PROBE_DELAYS[-1])
+        if delay is None:
+            delay = PROBE_DELAYS[-1]
+
+        self.max_registers = self.tuned_registers = block_size
+        self.delay = self.tuned_delay = delay
+        self.successes = 0
+        self.probed = True
+        _LOGGER.info(f"Auto tuned to max_registers {self.max_registers} and delay {self.delay}")
+        return True
+
+    async def _async_read(self, client, read, start, length):
+        if not client.is_open() and not await client.open():
+            return False
+        return await read(start, length) is not None
+
+
+def is_overload(error, exception):
+    """Return True if a failed request points at an overloaded device rather than an unsupported request.
+
+    Timeouts, busy replies and dropped connections are overload, exception replies such as an
+    illegal data address are answered the same way however slowly the device is polled.
+    """
+    return error != MB_EXCEPT_ERR or exception == EXP_SLAVE_DEVICE_BUSY
+
+
+def get_tuner(host, port, max_registers, delay):
+    """Return the tuner remembered for a host, creating it from the given settings."""
+    key = (host, port)
+    if key not in _TUNERS:
+        _TUNERS[key] = AutoTuner(max_registers, delay)
+    return _TUNERS[key]
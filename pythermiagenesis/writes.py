@@ -0,0 +1,66 @@
+"""Group register writes into as few Modbus requests as possible."""
+from .catalog import get_catalog
+from .const import REG_COIL, REG_HOLDING, TYPE_INT
+from .decoder import value_converter
+from .transport import MAX_WRITE_BITS, MAX_WRITE_REGISTERS
+
+
+def num_to_bin(value):
+    if(value > -1): return value
+    return 65536 + value
+
+
+def encode_value(register, value):
+    """Convert a value to what is written to a coil or holding register."""
+    if register.reg_type == REG_COIL:
+        return bool(value)
+    converted_value = int(value * register.scale)
+    if register.datatype == TYPE_INT:
+        converted_value = num_to_bin(converted_value)
+    return converted_value
+
+
+def decode_written(register, raw):
+    """Return the value a register is expected to read back after writing raw to it."""
+    return value_converter(register.datatype, register.scale)(raw)
+
+
+class WriteRequest:
+    """Values written to consecutive addresses with one Modbus request."""
+
+    __slots__ = ('reg_type', 'start', 'names', 'values')
+
+    def __init__(self, reg_type, start, names, values):
+        self.reg_type = reg_type
+        self.start = start
+        self.names = names
+        self.values = values
+
+    def __repr__(self):
+        return f"WriteRequest({self.reg_type}, start={self.start}, length={len(self.values)})"
+
+
+def plan_writes(values, max_registers=MAX_WRITE_REGISTERS):
+    """Return the WriteRequests for a dict of register name to value, ordered by type and address."""
+    catalog = get_catalog()
+    registers = []
+    for name in values:
+        register = catalog[name]
+        if register.reg_type not in (REG_COIL, REG_HOLDING):
+            raise ValueError(f"{name} is a {register.reg_type} register and can not be changed")
+        registers.append(register)
+    registers.sort(key=lambda register: (register.reg_type, register.address))
+
+    requests = []
+    request = None
+    for register in registers:
+        limit = min(max_registers, MAX_WRITE_BITS if register.reg_type == REG_COIL else MAX_WRITE_REGISTERS)
+        if(request is None
+                or request.reg_type != register.reg_type
+                or request.start + len(request.values) != register.address
+                or len(request.values) >= limit):
+            request = WriteRequest(register.reg_type, register.address, [], [])
+            requests.append(request)
+        request.names.append(register.name)
+        request.values.append(encode_value(register, values[register.name]))
+    return requests
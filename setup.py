@@ -13,7 +13,7 @@ setup(
     url="https://github.com/cjne/pythermiagenesis",
     license="MIT",
     packages=["pythermiagenesis"],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     install_requires=["pymodbustcp==0.1.10"],
     classifiers=[
         "License :: OSI Approved :: MIT License",
@@ -0,0 +1,83 @@
+"""Fixtures running ThermiaGenesis against the bundled simulator."""
+import pytest
+from pyModbusTCP.utils import word_list_to_long
+
+from pythermiagenesis import ThermiaGenesis
+from pythermiagenesis.const import (
+    MODEL_INVERTER,
+    MODEL_MEGA,
+    STATUS_OFF,
+    STATUS_TEXT,
+    TRANSPORT_ASYNCIO,
+    TYPE_BIT,
+    TYPE_INT,
+    TYPE_LONG,
+    TYPE_STATUS,
+)
+from pythermiagenesis.simulator import GenesisSimulator
+
+
+async def start_simulator(kind=MODEL_MEGA, **options):
+    """Start a simulator, on a free port unless port is given, values do not drift unless update_interval is given."""
+    options.setdefault('port', 0)
+    options.setdefault('seed', 1)
+    options.setdefault('update_interval', 0)
+    simulator = GenesisSimulator(kind, **options)
+    await simulator.start()
+    return simulator
+
+
+@pytest.fixture(params=[MODEL_MEGA, MODEL_INVERTER])
+async def simulator(request):
+    """A simulator of each model."""
+    simulator = await start_simulator(request.param)
+    yield simulator
+    await simulator.stop()
+
+
+@pytest.fixture
+async def mega():
+    """A Mega simulator."""
+    simulator = await start_simulator(MODEL_MEGA)
+    yield simulator
+    await simulator.stop()
+
+
+@pytest.fixture
+async def connect():
+    """Return a function creating a ThermiaGenesis for a simulator, they are closed after the test."""
+    clients = []
+
+    def create(simulator, **options):
+        options.setdefault('transport', TRANSPORT_ASYNCIO)
+        options.setdefault('delay', 0)
+        thermia = ThermiaGenesis('127.0.0.1', simulator.port, kind=simulator.kind, **options)
+        clients.append(thermia)
+        return thermia
+    yield create
+    for thermia in clients:
+        await thermia.aclose()
+
+
+def requests(simulator):
+    """Number of requests a simulator has answered."""
+    return sum(simulator.requests.values())
+
+
+def baseline_decode(register, words):
+    """Decode a register the way the first version of the library did."""
+    value = words[0]
+    if register.datatype == TYPE_BIT:
+        return bool(value)
+    if register.datatype == TYPE_LONG:
+        value = word_list_to_long(words[:2])[0]
+    elif register.datatype == TYPE_INT:
+        if value == 32767:
+            value = 0
+        if value > 32767:
+            value = value - 65536
+    elif register.datatype == TYPE_STATUS:
+        value = STATUS_TEXT.get(value, STATUS_OFF)
+    if register.scale != 1:
+        value = value / register.scale
+    return value
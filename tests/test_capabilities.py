@@ -0,0 +1,89 @@
+"""Capability probing and its cache."""
+import json
+
+import pytest
+
+from pythermiagenesis import capabilities as capability_module
+from pythermiagenesis.capabilities import CACHE_VERSION, Capabilities, CapabilityCache, async_probe_capabilities
+from pythermiagenesis.catalog import get_catalog
+from pythermiagenesis.const import READ_FAILED, REG_HOLDING, REGISTER_RANGES
+from pythermiagenesis.transport import AsyncModbusClient
+
+from .conftest import requests, start_simulator
+
+
+@pytest.fixture
+async def reduced():
+    """A Mega simulator of a firmware without the first block of holding registers."""
+    ranges = dict(REGISTER_RANGES['mega'])
+    ranges[REG_HOLDING] = ranges[REG_HOLDING][1:]
+    simulator = await start_simulator(ranges=ranges)
+    yield simulator
+    await simulator.stop()
+
+
+def _within(block, ranges):
+    return any(start <= block[0] and block[1] <= end for start, end in ranges)
+
+
+async def test_probe_finds_the_blocks_answered(reduced):
+    client = AsyncModbusClient('127.0.0.1', reduced.port, timeout=5)
+    try:
+        capabilities = await async_probe_capabilities(client, 'mega')
+    finally:
+        await client.close()
+    for reg_type, blocks in capabilities.ranges.items():
+        assert all(_within(block, reduced._ranges[reg_type]) for block in blocks), reg_type
+        largest = max(end - start + 1 for start, end in blocks)
+        assert capabilities.limits[reg_type] == largest
+    first_block = REGISTER_RANGES['mega'][REG_HOLDING][0]
+    for register in get_catalog().for_model('mega'):
+        block = (register.address, register.end)
+        if register.condition is not None:
+            assert capabilities.supports(register)
+        else:
+            assert capabilities.supports(register) == _within(block, reduced._ranges[register.reg_type]), register.name
+    assert not any(capabilities.supports(register) for register in get_catalog().for_model('mega')
+                   if register.reg_type == REG_HOLDING and register.end < first_block[1] and register.condition is None)
+
+
+async def test_probe_fails_without_a_device():
+    client = AsyncModbusClient('127.0.0.1', 1, timeout=1)
+    assert await async_probe_capabilities(client, 'mega') is None
+
+
+def test_cache_round_trip(tmp_path):
+    path = tmp_path / 'cache' / 'capabilities.json'
+    cache = CapabilityCache(str(path))
+    capabilities = Capabilities({REG_HOLDING: [[0, 10], [20, 30]]}, {REG_HOLDING: 11})
+    assert cache.get('host', 502, 'mega', '1.2.3') is None
+    cache.put('host', 502, 'mega', '1.2.3', capabilities)
+    cache.put('host', 502, 'mega', '1.2.4', Capabilities({}, {}))
+    assert cache.get('host', 502, 'mega', '1.2.3') == capabilities
+    assert cache.get('host', 502, 'inverter', '1.2.3') is None
+
+    path.write_text('{"version": ')
+    assert cache.get('host', 502, 'mega', '1.2.3') is None
+    path.write_text(json.dumps({'version': CACHE_VERSION + 1, 'devices': {}}))
+    assert cache.get('host', 502, 'mega', '1.2.3') is None
+    cache.put('host', 502, 'mega', '1.2.3', capabilities)
+    assert cache.get('host', 502, 'mega', '1.2.3') == capabilities
+
+
+async def test_cached_capabilities_are_not_probed_again(reduced, connect, tmp_path, monkeypatch):
+    path = str(tmp_path / 'capabilities.json')
+    first = connect(reduced, capabilities=path)
+    await first.async_update()
+    assert first.capabilities is not None
+    assert READ_FAILED not in first.status.values()
+
+    async def probe(*args):
+        raise AssertionError("probed again")
+    monkeypatch.setattr(capability_module, 'async_probe_capabilities', probe)
+    second = connect(reduced, capabilities=path)
+    before = requests(reduced)
+    data = await second.async_update()
+    assert second.capabilities == first.capabilities
+    #The firmware read that selects the cache entry, then the poll
+    assert requests(reduced) - before == 1 + second.read_plan().request_count
+    assert data.keys() == first.data.keys()
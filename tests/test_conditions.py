@@ -0,0 +1,51 @@
+"""Registers that can only be read while their condition is set."""
+from pythermiagenesis.const import READ_FAILED
+
+from .conftest import requests
+
+GATED = 'holding_fixed_system_supply_set_point'
+CONDITION = 'coil_enable_fixed_system_supply_set_point'
+
+
+async def test_full_poll_reads_gated_registers_only_when_set(mega, connect):
+    thermia = connect(mega)
+    plan = thermia.read_plan()
+    mega.set(CONDITION, False)
+    before = requests(mega)
+    data = await thermia.async_update()
+    assert requests(mega) - before == plan.request_count
+    assert GATED not in data
+
+    mega.set(CONDITION, True)
+    before = requests(mega)
+    data = await thermia.async_update()
+    assert requests(mega) - before == plan.request_count + 1
+    assert data[GATED] == mega.get(GATED)
+
+
+async def test_condition_cleared_since_last_read(mega, connect, caplog):
+    mega.set(CONDITION, True)
+    thermia = connect(mega)
+    data = await thermia.async_update(only_registers=[GATED])
+    assert data[GATED] == mega.get(GATED)
+    mega.set(CONDITION, False)
+    data = await thermia.async_update(only_registers=[GATED])
+    assert data == {CONDITION: False}
+    assert READ_FAILED not in thermia.status.values()
+    assert 'Failed to read' not in caplog.text
+
+
+async def test_condition_cleared_between_passes(mega, connect, caplog):
+    mega.set(CONDITION, True)
+    thermia = connect(mega)
+    get_data = thermia._get_data
+
+    async def clear_after_first_pass(plan, refused=None):
+        data = await get_data(plan, refused)
+        mega.set(CONDITION, False)
+        return data
+    thermia._get_data = clear_after_first_pass
+    data = await thermia.async_update()
+    assert GATED not in data and GATED not in thermia.status
+    assert thermia._conditions[CONDITION] is False
+    assert 'Failed to read' not in caplog.text
@@ -0,0 +1,66 @@
+"""Keeping the connection open between calls and reconnecting."""
+import pytest
+
+from pythermiagenesis import ThermiaConnectionError, ThermiaGenesis
+from pythermiagenesis.const import MODEL_MEGA, READ_OK, TRANSPORT_ASYNCIO
+
+from .conftest import requests, start_simulator
+
+
+def count_opens(thermia):
+    """Count the connections a ThermiaGenesis opens."""
+    opens = []
+    open_connection = thermia._client.open
+
+    async def open():
+        if not thermia._client.is_open():
+            opens.append(True)
+        return await open_connection()
+    thermia._client.open = open
+    return opens
+
+
+async def test_kept_alive_connection_is_reused(mega, connect):
+    thermia = connect(mega, keep_alive=True)
+    opens = count_opens(thermia)
+    for _ in range(3):
+        await thermia.async_update()
+    assert len(opens) == 1
+    assert thermia._client.is_open() and len(mega._connections) == 1
+
+
+async def test_connection_is_closed_without_keep_alive(mega, connect):
+    thermia = connect(mega)
+    opens = count_opens(thermia)
+    for _ in range(3):
+        await thermia.async_update()
+    assert len(opens) == 3
+    assert not thermia._client.is_open()
+
+
+async def test_idle_probe_reconnects_after_restart(connect):
+    simulator = await start_simulator()
+    thermia = connect(simulator, keep_alive=True, idle_timeout=0)
+    opens = count_opens(thermia)
+    await thermia.async_update()
+    port = simulator.port
+    await simulator.stop()
+    simulator = await start_simulator(port=port)
+    try:
+        await thermia.async_update()
+        assert len(opens) == 2
+        assert set(thermia.status.values()) == {READ_OK}
+        #The probe failed on the dead connection, the new one is only used by the poll
+        assert requests(simulator) == thermia.read_plan().request_count
+    finally:
+        await simulator.stop()
+
+
+async def test_connection_error_after_reconnect_attempts():
+    thermia = ThermiaGenesis('127.0.0.1', 1, kind=MODEL_MEGA, transport=TRANSPORT_ASYNCIO, delay=0,
+                             reconnect_attempts=3, reconnect_delay=0.01)
+    opens = count_opens(thermia)
+    with pytest.raises(ThermiaConnectionError):
+        await thermia.async_update()
+    assert len(opens) == 3
+    await thermia.aclose()
@@ -0,0 +1,44 @@
+"""The compiled request decoders against the decoding of the original request loop."""
+from pythermiagenesis.catalog import get_catalog
+from pythermiagenesis.const import TYPE_BIT, TYPE_LONG
+from pythermiagenesis.decoder import RequestDecoder
+from pythermiagenesis.plan import ReadRequest
+
+from .conftest import baseline_decode
+
+
+def _decoder(register):
+    return RequestDecoder(ReadRequest(register.reg_type, register.address, register.end - register.address + 1,
+                                      ((register.name, 0),)))
+
+
+def _kinds():
+    """One register of every datatype and scale."""
+    kinds = {}
+    for register in get_catalog():
+        kinds.setdefault((register.datatype, register.scale), register)
+    return kinds.values()
+
+
+def test_every_word_value_decodes_as_before():
+    for register in _kinds():
+        if register.datatype in (TYPE_BIT, TYPE_LONG):
+            continue
+        decoder = _decoder(register)
+        for raw in range(65536):
+            value = decoder.decode([raw])[register.name]
+            expected = baseline_decode(register, [raw])
+            assert value == expected and type(value) is type(expected), (register, raw)
+
+
+def test_bits_and_longs_decode_as_before():
+    for register in _kinds():
+        decoder = _decoder(register)
+        if register.datatype == TYPE_BIT:
+            samples = ([False], [True])
+        elif register.datatype == TYPE_LONG:
+            samples = ([0, 0], [0, 1], [1, 0], [0x7FFF, 0xFFFF], [0x8000, 0], [0xFFFF, 0xFFFF])
+        else:
+            continue
+        for words in samples:
+            assert decoder.decode(words)[register.name] == baseline_decode(register, words)
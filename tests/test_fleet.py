@@ -0,0 +1,46 @@
+"""Concurrent polling of several heat pumps."""
+import asyncio
+
+from pythermiagenesis import ThermiaGenesis
+from pythermiagenesis.const import MODEL_INVERTER
+from pythermiagenesis.fleet import ThermiaFleet
+
+from .conftest import start_simulator
+
+
+async def test_fleet_polls_every_pump(mega, connect):
+    inverter = await start_simulator(MODEL_INVERTER)
+    try:
+        fleet = ThermiaFleet(concurrency=2, stagger=0.0)
+        fleet.add(connect(mega), key='mega')
+        fleet.add(connect(inverter), key='inverter')
+        fleet.add(ThermiaGenesis('127.0.0.1', port=1, kind=MODEL_INVERTER, transport='asyncio', delay=0), key='down')
+        results = await fleet.async_update()
+        assert set(results) == {'mega', 'inverter', 'down'}
+        assert results['mega'].data['input_outdoor_temperature'] == mega.get('input_outdoor_temperature')
+        assert results['inverter'].ok and not results['down'].ok
+        await fleet.remove('down').aclose()
+    finally:
+        await inverter.stop()
+
+
+async def test_gateway_limit(mega, connect):
+    fleet = ThermiaFleet(concurrency=8, per_gateway=1, stagger=0.0)
+    running = []
+    peak = []
+
+    for index in range(3):
+        thermia = connect(mega)
+        update = thermia.async_update
+
+        async def tracked(update=update, **kwargs):
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+            return await update(**kwargs)
+        thermia.async_update = tracked
+        fleet.add(thermia, key=str(index), gateway='gateway')
+    results = await fleet.async_update(only_registers=['input_outdoor_temperature'])
+    assert all(result.ok for result in results.values())
+    assert max(peak) == 1
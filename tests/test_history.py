@@ -0,0 +1,83 @@
+"""Bounded history of register values."""
+import pytest
+
+from pythermiagenesis.const import STATUS_OFF
+from pythermiagenesis.history import RegisterHistory, RingBuffer, np
+
+#Both storages, NumPy only when it is installed
+STORAGES = [False] + ([True] if np is not None else [])
+
+
+def _filled(use_numpy, count, capacity=5):
+    buffer = RingBuffer(capacity, use_numpy)
+    for i in range(count):
+        buffer.append(float(i), i * 10.0)
+    return buffer
+
+
+@pytest.mark.parametrize('use_numpy', STORAGES)
+def test_wraparound(use_numpy):
+    buffer = _filled(use_numpy, 3)
+    assert len(buffer) == 3
+    assert list(buffer.window()[1]) == [0.0, 10.0, 20.0]
+    buffer = _filled(use_numpy, 12)
+    assert len(buffer) == 5
+    times, values = buffer.window()
+    assert list(times) == [7.0, 8.0, 9.0, 10.0, 11.0]
+    assert list(values) == [70.0, 80.0, 90.0, 100.0, 110.0]
+    assert buffer.latest() == (11.0, 110.0)
+    assert RingBuffer(2, use_numpy).latest() is None
+    with pytest.raises(ValueError):
+        RingBuffer(0, use_numpy)
+
+
+@pytest.mark.parametrize('use_numpy', STORAGES)
+def test_window_and_stats(use_numpy):
+    buffer = _filled(use_numpy, 12)
+    assert list(buffer.window(last=2)[1]) == [100.0, 110.0]
+    assert list(buffer.window(since=8.5)[0]) == [9.0, 10.0, 11.0]
+    assert list(buffer.window(since=9.0)[0]) == [9.0, 10.0, 11.0]
+    #Both limits apply
+    assert list(buffer.window(last=4, since=9.0)[0]) == [9.0, 10.0, 11.0]
+    assert list(buffer.window(last=2, since=0.0)[0]) == [10.0, 11.0]
+    assert len(buffer.window(since=20.0)[0]) == 0
+    assert buffer.stats() == {'count': 5, 'min': 70.0, 'max': 110.0, 'mean': 90.0}
+    assert buffer.stats(last=2) == {'count': 2, 'min': 100.0, 'max': 110.0, 'mean': 105.0}
+    assert buffer.stats(since=100.0) is None
+    if np is not None:
+        assert isinstance(buffer.window()[1], np.ndarray) == use_numpy
+
+
+def test_storages_agree():
+    if np is None:
+        pytest.skip("NumPy is not installed")
+    for count in (3, 5, 12):
+        plain, vector = _filled(False, count), _filled(True, count)
+        for last, since in ((None, None), (3, None), (None, 8.0), (4, 2.0)):
+            assert list(plain.window(last, since)[1]) == list(vector.window(last, since)[1])
+            assert plain.stats(last, since) == vector.stats(last, since)
+
+
+def test_status_texts_are_stored_as_codes():
+    history = RegisterHistory(3, use_numpy=False)
+    history.record({'input_status': 'Hot water', 'input_other': STATUS_OFF, 'unknown': 'text'}, timestamp=1.0)
+    history.record({'input_status': 'Heat'}, timestamp=2.0)
+    assert list(history.window('input_status')[1]) == [3.0, 4.0]
+    assert list(history.window('input_other')[1]) == [0.0]
+    assert 'unknown' not in history
+    assert history.memory == 2 * 3 * 16
+    assert history.stats('input_status', last=1)['mean'] == 4.0
+
+
+async def test_polls_and_verified_writes_are_recorded(mega, connect):
+    thermia = connect(mega, history=4)
+    name = 'holding_comfort_wheel_setting'
+    for _ in range(2):
+        await thermia.async_update()
+    assert len(thermia.history['input_outdoor_temperature']) == 2
+    await thermia.async_set(name, 21.5, verify=True)
+    assert len(thermia.history[name]) == 3
+    assert thermia.history[name].latest()[1] == 21.5
+    #Unverified writes are recorded when they are read back
+    await thermia.async_set(name, 22)
+    assert len(thermia.history[name]) == 3
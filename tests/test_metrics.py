@@ -0,0 +1,120 @@
+"""Transaction and update metrics."""
+from pythermiagenesis.const import REG_HOLDING, REG_INPUT, REGISTER_RANGES
+from pythermiagenesis.metrics import (
+    LATENCY_BUCKETS,
+    OPERATION_READ,
+    OPERATION_WRITE,
+    Metrics,
+    Transaction,
+    UpdateStats,
+    export_prometheus,
+    frame_bytes,
+)
+from pythermiagenesis.transport import EXP_DATA_ADDRESS, MB_EXCEPT_ERR
+
+from .conftest import requests, start_simulator
+
+
+def _stats(wall_time):
+    stats = UpdateStats()
+    stats.wall_time = wall_time
+    stats.delay_time = wall_time / 2
+    stats.decode_time = wall_time / 10
+    return stats
+
+
+def test_transactions_are_counted():
+    metrics = Metrics()
+    metrics.record_transaction(Transaction(OPERATION_READ, REG_INPUT, 0, 10, 0.001))
+    metrics.record_transaction(Transaction(OPERATION_READ, REG_INPUT, 10, 10, 0.03, retries=2))
+    metrics.record_transaction(Transaction(OPERATION_READ, REG_HOLDING, 0, 4, 10.0, error=MB_EXCEPT_ERR,
+                                           exception=EXP_DATA_ADDRESS))
+    metrics.record_transaction(Transaction(OPERATION_WRITE, REG_HOLDING, 3, 1, 0.005))
+    assert metrics.requests == {(OPERATION_READ, REG_INPUT): 2, (OPERATION_READ, REG_HOLDING): 1,
+                                (OPERATION_WRITE, REG_HOLDING): 1}
+    assert metrics.failures == {(OPERATION_READ, REG_HOLDING): 1}
+    assert metrics.exceptions == {EXP_DATA_ADDRESS: 1}
+    assert metrics.retries == 2
+    #A failed transaction only counts the request
+    assert metrics.bytes == (2 * frame_bytes(OPERATION_READ, REG_INPUT, 10) + frame_bytes(OPERATION_READ, REG_HOLDING, 4, False)
+                             + frame_bytes(OPERATION_WRITE, REG_HOLDING, 1))
+    #Bounds are inclusive, latencies above the last bound go to +Inf
+    expected = [0] * (len(LATENCY_BUCKETS) + 1)
+    expected[0] = 2
+    expected[LATENCY_BUCKETS.index(0.05)] = 1
+    expected[-1] = 1
+    assert metrics.latency_buckets == expected
+    assert not list(metrics.transactions)[2].ok
+
+
+def test_updates_and_hooks():
+    metrics = Metrics(keep=2)
+    transactions, updates = [], []
+    remove = metrics.add_hook(transactions.append, updates.append)
+
+    def broken(record):
+        raise RuntimeError("hook failed")
+    metrics.add_hook(on_update=broken)
+    for wall_time in (1.0, 2.0, 3.0):
+        metrics.record_update(_stats(wall_time))
+    metrics.record_transaction(Transaction(OPERATION_READ, REG_INPUT, 0, 1, 0.001))
+    assert (metrics.update_count, metrics.update_time, metrics.delay_time) == (3, 6.0, 3.0)
+    assert [stats.wall_time for stats in metrics.updates] == [2.0, 3.0]
+    assert len(updates) == 3 and len(transactions) == 1
+    remove()
+    metrics.record_update(_stats(1.0))
+    assert len(updates) == 3
+
+
+def test_prometheus_text():
+    first = Metrics({'host': 'pump "1"'})
+    first.record_transaction(Transaction(OPERATION_READ, REG_HOLDING, 0, 4, 0.02, error=MB_EXCEPT_ERR,
+                                         exception=EXP_DATA_ADDRESS))
+    second = Metrics({'host': 'pump2'})
+    second.record_transaction(Transaction(OPERATION_READ, REG_INPUT, 0, 4, 0.002))
+    lines = first.prometheus().splitlines()
+    assert '# TYPE thermiagenesis_requests_total counter' in lines
+    assert 'thermiagenesis_requests_total{host="pump \\"1\\"",operation="read",reg_type="holding"} 1' in lines
+    assert 'thermiagenesis_request_failures_total{host="pump \\"1\\"",operation="read",reg_type="holding"} 1' in lines
+    assert 'thermiagenesis_exceptions_total{host="pump \\"1\\"",code="2"} 1' in lines
+    assert 'thermiagenesis_request_latency_seconds_bucket{host="pump \\"1\\"",le="0.01"} 0' in lines
+    assert 'thermiagenesis_request_latency_seconds_bucket{host="pump \\"1\\"",le="0.025"} 1' in lines
+    assert 'thermiagenesis_request_latency_seconds_bucket{host="pump \\"1\\"",le="+Inf"} 1' in lines
+    assert 'thermiagenesis_request_latency_seconds_count{host="pump \\"1\\""} 1' in lines
+    text = export_prometheus(first, second, prefix='heatpump')
+    assert text.count('# HELP heatpump_requests_total ') == 1
+    assert 'heatpump_requests_total{host="pump2",operation="read",reg_type="input"} 1' in text.splitlines()
+
+
+async def test_every_transaction_is_recorded(mega, connect):
+    thermia = connect(mega, metrics=True, keep_alive=True, idle_timeout=0)
+    await thermia.async_update()
+    assert len(thermia.metrics.transactions) == requests(mega)
+    assert thermia.metrics.update_count == 1
+    assert thermia.metrics.updates[0].registers == len(thermia.data)
+
+    before = requests(mega)
+    await thermia.async_set('holding_comfort_wheel_setting', 21, verify=True)
+    recorded = list(thermia.metrics.transactions)[-(requests(mega) - before):]
+    #Idle probe, write and read back
+    assert [(transaction.operation, transaction.reg_type) for transaction in recorded] == [
+        (OPERATION_READ, REG_INPUT), (OPERATION_WRITE, REG_HOLDING), (OPERATION_READ, REG_HOLDING)]
+    assert all(transaction.ok for transaction in recorded)
+
+
+async def test_exception_responses_are_recorded(connect):
+    ranges = dict(REGISTER_RANGES['mega'])
+    missing = ranges[REG_HOLDING][0]
+    ranges[REG_HOLDING] = ranges[REG_HOLDING][1:]
+    simulator = await start_simulator(ranges=ranges)
+    try:
+        thermia = connect(simulator, metrics=True)
+        await thermia.async_update()
+    finally:
+        await simulator.stop()
+    failed = [transaction for transaction in thermia.metrics.transactions if not transaction.ok]
+    assert failed and all((transaction.reg_type, transaction.error, transaction.exception)
+                          == (REG_HOLDING, MB_EXCEPT_ERR, EXP_DATA_ADDRESS) for transaction in failed)
+    assert all(transaction.start <= missing[1] for transaction in failed)
+    assert thermia.metrics.exceptions == {EXP_DATA_ADDRESS: len(failed)}
+    assert thermia.metrics.updates[0].failures == len(failed)
@@ -0,0 +1,25 @@
+"""Names exported by the package."""
+import pythermiagenesis
+from pythermiagenesis import const
+
+
+def _star_import(module):
+    namespace = {}
+    exec(f"from {module} import *", namespace)
+    return namespace
+
+
+def test_star_import_of_const():
+    namespace = _star_import('pythermiagenesis.const')
+    assert namespace['REGISTERS'] is const.REGISTERS
+    assert namespace['ATTR_INPUT_OUTDOOR_TEMPERATURE'] == 'input_outdoor_temperature'
+    assert '__getattr__' not in namespace
+
+
+def test_star_import_of_package():
+    namespace = _star_import('pythermiagenesis')
+    assert namespace['ThermiaGenesis'] is pythermiagenesis.ThermiaGenesis
+    assert namespace['num_to_bin'](-1) == 65535
+    assert namespace['REGISTERS'] is const.REGISTERS
+    assert namespace['ATTR_INPUT_OUTDOOR_TEMPERATURE'] == 'input_outdoor_temperature'
+    assert namespace['REG_HOLDING'] == const.REG_HOLDING
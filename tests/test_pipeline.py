@@ -0,0 +1,36 @@
+"""Pipelined polls."""
+from pythermiagenesis.const import READ_OK
+from pythermiagenesis.simulator import PIPELINING_CONCURRENT, PIPELINING_DROP
+
+from .conftest import requests, start_simulator
+
+
+async def test_pipelined_poll_matches_serial_poll(connect):
+    simulator = await start_simulator(pipelining=PIPELINING_CONCURRENT)
+    try:
+        serial = connect(simulator)
+        expected = dict(await serial.async_update())
+        pipelined = connect(simulator, pipeline=8)
+        before = requests(simulator)
+        assert await pipelined.async_update() == expected
+        assert pipelined.status == serial.status
+        assert pipelined._pipeline == 8
+        assert requests(simulator) - before == pipelined.read_plan().request_count
+    finally:
+        await simulator.stop()
+
+
+async def test_pipelining_is_turned_off_when_requests_are_dropped(connect):
+    simulator = await start_simulator(pipelining=PIPELINING_DROP)
+    try:
+        thermia = connect(simulator, pipeline=8, timeout=0.2)
+        data = await thermia.async_update()
+        assert thermia._pipeline == 1
+        assert data and set(thermia.status.values()) == {READ_OK}
+        #Dropped requests are never answered, each request is answered once by the pipeline or the serial reads
+        assert requests(simulator) == thermia.read_plan().request_count
+        before = requests(simulator)
+        await thermia.async_update()
+        assert requests(simulator) - before == thermia.read_plan().request_count
+    finally:
+        await simulator.stop()
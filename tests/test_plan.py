@@ -0,0 +1,56 @@
+"""Read plans cover the selection within the register blocks and request limits."""
+import pytest
+
+from pythermiagenesis.catalog import get_catalog
+from pythermiagenesis.const import MODEL_INVERTER, MODEL_MEGA, REGISTER_RANGES
+from pythermiagenesis.plan import compile_plan
+
+
+def greedy_request_count(kind, names, max_registers):
+    """Number of requests of a greedy chunking that starts a new request whenever the next register does not fit."""
+    catalog = get_catalog()
+    registers = sorted((catalog[name] for name in names), key=lambda register: (register.reg_type, register.address))
+    count = 0
+    chunk = None
+    for register in registers:
+        if(chunk is None or chunk[0] != register.reg_type or register.end - chunk[1] >= max_registers
+                or register.address > chunk[2]):
+            block = next(block for block in REGISTER_RANGES[kind][register.reg_type]
+                         if block[0] <= register.address <= block[1])
+            chunk = (register.reg_type, register.address, block[1])
+            count += 1
+    return count
+
+
+@pytest.mark.parametrize('kind', [MODEL_MEGA, MODEL_INVERTER])
+@pytest.mark.parametrize('max_registers', [1, 8, 16, 64])
+def test_plan_covers_every_register_within_limits(kind, max_registers):
+    plan = compile_plan(kind, None, max_registers)
+    catalog = get_catalog()
+    #Registers outside the blocks of the model are never read
+    names = [register.name for register in catalog.for_model(kind)
+             if any(start <= register.address and register.end <= end
+                    for start, end in REGISTER_RANGES[kind][register.reg_type])]
+    assert sorted(plan.registers) == sorted(names)
+    for request in plan:
+        assert request.length <= max(max_registers, 2)
+        assert any(start <= request.start and request.end <= end for start, end in REGISTER_RANGES[kind][request.reg_type])
+        for name, offset in request.slots:
+            register = catalog[name]
+            assert register.reg_type == request.reg_type
+            assert request.start + offset == register.address
+            assert register.end <= request.end
+    assert plan.request_count <= greedy_request_count(kind, names, max_registers)
+
+
+def test_plan_for_a_selection():
+    names = ('input_outdoor_temperature', 'input_brine_in_temperature', 'coil_enable_heat')
+    plan = compile_plan(MODEL_MEGA, tuple(sorted(names)), 16)
+    assert sorted(plan.registers) == sorted(names)
+    assert compile_plan(MODEL_MEGA, tuple(sorted(names)), 16) is plan
+
+
+def test_excluded_registers_are_not_read():
+    excluded = frozenset(['input_outdoor_temperature'])
+    plan = compile_plan(MODEL_MEGA, None, 16, excluded)
+    assert 'input_outdoor_temperature' not in plan.registers
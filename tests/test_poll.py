@@ -0,0 +1,75 @@
+"""Full and partial polls against the simulator."""
+from pythermiagenesis import ThermiaGenesis
+from pythermiagenesis.catalog import get_catalog
+from pythermiagenesis.const import (
+    READ_OK,
+    REG_COIL,
+    REG_DISCRETE_INPUT,
+    REG_HOLDING,
+    TRANSPORT_PYMODBUSTCP,
+)
+from pythermiagenesis.simulator import GenesisSimulator
+from pythermiagenesis.transport import AsyncModbusClient
+
+from .conftest import baseline_decode, requests
+
+
+async def read_raw(simulator, register):
+    """Read the words or bit of one register with its own request."""
+    client = AsyncModbusClient('127.0.0.1', simulator.port, timeout=5)
+    length = register.end - register.address + 1
+    read = {
+        REG_COIL: client.read_coils,
+        REG_DISCRETE_INPUT: client.read_discrete_inputs,
+        REG_HOLDING: client.read_holding_registers,
+    }.get(register.reg_type, client.read_input_registers)
+    words = await read(register.address, length)
+    await client.close()
+    return words
+
+
+async def test_full_poll_matches_baseline_decode(simulator, connect):
+    thermia = connect(simulator)
+    data = await thermia.async_update()
+    catalog = get_catalog()
+    assert len(data) > 300
+    for name, value in data.items():
+        register = catalog[name]
+        expected = baseline_decode(register, await read_raw(simulator, register))
+        assert value == expected and type(value) is type(expected), name
+        assert value == simulator.get(name)
+    assert set(thermia.status.values()) == {READ_OK}
+    assert thermia.firmware is not None
+
+
+def test_pymodbustcp_transport_reads_the_same():
+    simulator = GenesisSimulator('mega', port=0, seed=1, update_interval=0).start_thread()
+    try:
+        import asyncio
+        expected = asyncio.run(ThermiaGenesis('127.0.0.1', simulator.port, kind='mega', delay=0,
+                                              transport='asyncio').async_update())
+        data = asyncio.run(ThermiaGenesis('127.0.0.1', simulator.port, kind='mega', delay=0,
+                                          transport=TRANSPORT_PYMODBUSTCP).async_update())
+    finally:
+        simulator.stop_thread()
+    assert data == expected
+
+
+async def test_partial_poll(mega, connect):
+    thermia = connect(mega)
+    names = ['input_outdoor_temperature', 'coil_enable_heat']
+    before = requests(mega)
+    data = await thermia.async_update(only_registers=names)
+    assert sorted(data) == sorted(names)
+    assert requests(mega) - before == 2
+
+
+async def test_results_are_not_changed_by_later_updates(mega, connect):
+    thermia = connect(mega)
+    result = await thermia.async_update()
+    copy = dict(result)
+    assert result is not thermia.data
+    mega.set('input_outdoor_temperature', copy['input_outdoor_temperature'] + 5)
+    await thermia.async_update(only_registers=['input_outdoor_temperature'], merge=True)
+    await thermia.async_set('holding_comfort_wheel_setting', copy['holding_comfort_wheel_setting'] + 1, verify=True)
+    assert result == copy
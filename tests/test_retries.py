@@ -0,0 +1,38 @@
+"""Retries and partial results of failed requests."""
+from pythermiagenesis.catalog import get_catalog
+from pythermiagenesis.const import READ_FAILED, READ_OK, READ_STALE, REG_HOLDING, REGISTER_RANGES
+
+from .conftest import start_simulator
+
+
+async def test_busy_responses_are_retried(connect):
+    simulator = await start_simulator(busy_rate=0.2)
+    try:
+        thermia = connect(simulator, retries=6, retry_delay=0)
+        data = await thermia.async_update()
+        assert set(thermia.status.values()) == {READ_OK}
+        assert len(data) > 300
+    finally:
+        await simulator.stop()
+
+
+async def test_unanswered_block_keeps_last_values(connect):
+    ranges = dict(REGISTER_RANGES['mega'])
+    simulator = await start_simulator()
+    thermia = connect(simulator)
+    first = await thermia.async_update()
+    await simulator.stop()
+    missing = ranges[REG_HOLDING][0]
+    ranges[REG_HOLDING] = ranges[REG_HOLDING][1:]
+    simulator = await start_simulator(ranges=ranges)
+    try:
+        thermia._port = simulator.port
+        thermia._client._port = simulator.port
+        await thermia.async_update()
+    finally:
+        await simulator.stop()
+    stale = [name for name, status in thermia.status.items() if status == READ_STALE]
+    catalog = get_catalog()
+    assert stale and all(catalog[name].reg_type == REG_HOLDING and catalog[name].address <= missing[1] for name in stale)
+    assert all(thermia.data[name] == first[name] for name in stale)
+    assert READ_FAILED not in thermia.status.values()
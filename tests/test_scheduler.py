@@ -0,0 +1,89 @@
+"""Polling tiers."""
+import asyncio
+from time import monotonic, time
+
+import pytest
+
+from pythermiagenesis.catalog import get_catalog
+from pythermiagenesis.const import GROUP_POLL_INTERVALS, REG_HOLDING, REGISTER_RANGES
+from pythermiagenesis.scheduler import PollScheduler, group_registers, register_group
+
+from .conftest import start_simulator
+
+#Every group every 100 s
+SLOW = dict.fromkeys(GROUP_POLL_INTERVALS, 100)
+
+
+def test_groups():
+    assert register_group('input_outdoor_temperature') == 'temperatures'
+    assert register_group('coil_enable_heat') == 'settings'
+    assert register_group('input_software_version_major') == 'firmware'
+    assert 'input_outdoor_temperature' in group_registers('temperatures', 'mega')
+
+
+def test_disabled_registers_are_not_scheduled(mega, connect):
+    thermia = connect(mega)
+    scheduler = PollScheduler(thermia, intervals={'alarms': None}, register_intervals={'coil_enable_heat': None})
+    assert 'coil_enable_heat' not in scheduler.intervals
+    assert not any(register_group(name) == 'alarms' for name in scheduler.intervals)
+    with pytest.raises(ValueError):
+        PollScheduler(thermia, intervals=dict.fromkeys(GROUP_POLL_INTERVALS))
+
+
+async def test_due_and_next_due(mega, connect):
+    thermia = connect(mega)
+    scheduler = PollScheduler(thermia, intervals=SLOW, register_intervals={'input_outdoor_temperature': 1})
+    assert sorted(scheduler.due()) == sorted(scheduler.intervals)
+    assert scheduler.next_due() == 0.0
+    start = monotonic()
+    read = await scheduler.async_tick()
+    assert len(read) > 300 and thermia.data == read
+    assert scheduler.due() == []
+    assert await scheduler.async_tick() == {}
+    assert start + 1 <= scheduler.next_due() <= monotonic() + 1
+    #Registers the heat pump did not answer are retried at the shortest interval too
+    unread = set(scheduler.intervals) - set(read)
+    assert sorted(scheduler.due(monotonic() + 2)) == sorted(unread | {'input_outdoor_temperature'})
+    assert sorted(scheduler.due(monotonic() + 101)) == sorted(scheduler.intervals)
+
+
+async def test_unread_registers_are_retried_sooner(connect):
+    ranges = dict(REGISTER_RANGES['mega'])
+    missing = ranges[REG_HOLDING][0]
+    ranges[REG_HOLDING] = ranges[REG_HOLDING][1:]
+    simulator = await start_simulator(ranges=ranges)
+    try:
+        thermia = connect(simulator)
+        scheduler = PollScheduler(thermia, intervals={**SLOW, 'temperatures': 5})
+        read = await scheduler.async_tick()
+    finally:
+        await simulator.stop()
+    unread = set(scheduler.intervals) - set(read)
+    catalog = get_catalog()
+    assert any(catalog[name].reg_type == REG_HOLDING and catalog[name].address <= missing[1] for name in unread)
+    assert sorted(scheduler.due(monotonic() + 6)) == sorted(unread | set(group_registers('temperatures', 'mega')))
+
+
+async def test_snapshot_values_are_due_after_their_interval(mega, connect):
+    thermia = connect(mega)
+    now = time()
+    thermia.updated = {'input_outdoor_temperature': now - 50, 'coil_enable_heat': now - 150}
+    scheduler = PollScheduler(thermia, intervals=SLOW)
+    due = scheduler.due()
+    assert 'coil_enable_heat' in due and 'input_outdoor_temperature' not in due
+    assert 'input_outdoor_temperature' in scheduler.due(monotonic() + 51)
+
+
+async def test_run_polls_until_cancelled(mega, connect):
+    thermia = connect(mega)
+    scheduler = PollScheduler(thermia, intervals=dict.fromkeys(GROUP_POLL_INTERVALS, 0.05))
+    ticks = []
+    tick = scheduler.async_tick
+
+    async def counted():
+        ticks.append(await tick())
+        return ticks[-1]
+    scheduler.async_tick = counted
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(scheduler.async_run(), 0.2)
+    assert 2 <= len(ticks) and ticks[0]
@@ -0,0 +1,44 @@
+"""Fleet polling from worker processes."""
+import asyncio
+
+from pythermiagenesis import ThermiaException
+from pythermiagenesis.const import MODEL_INVERTER
+from pythermiagenesis.fleet import FleetResult
+from pythermiagenesis.sharding import ShardedFleet, decode_result, encode_result
+
+from .conftest import start_simulator
+
+
+class _Pump:
+    _host, _port, _kind, firmware = 'host', 502, MODEL_INVERTER, '1.0'
+    updated = {}
+
+
+def test_results_round_trip():
+    result = decode_result(encode_result(FleetResult('pump', {'input_outdoor_temperature': 1.5}, None, 0.25), _Pump))
+    assert (result.key, result.data, result.elapsed) == ('pump', {'input_outdoor_temperature': 1.5}, 0.25)
+    result = decode_result(encode_result(FleetResult('pump', None, ThermiaException("gone"), 0.5), _Pump))
+    assert result.data is None and result.error.message == 'gone'
+
+
+async def test_workers_poll_and_are_replaced():
+    simulators = [await start_simulator(MODEL_INVERTER, seed=seed) for seed in range(4)]
+    fleet = ShardedFleet(2, stagger=0.0, context='fork')
+    try:
+        for simulator in simulators:
+            fleet.add('127.0.0.1', simulator.port, gateway=simulator.port, kind=MODEL_INVERTER, transport='asyncio', delay=0)
+        results = await fleet.async_update(only_registers=['input_outdoor_temperature'])
+        assert {key: result.data for key, result in results.items()} == {
+            f'127.0.0.1:{simulator.port}': {'input_outdoor_temperature': simulator.get('input_outdoor_temperature')}
+            for simulator in simulators}
+        assert sorted(len(keys) for keys in fleet.shards().values()) == [2, 2]
+
+        fleet._workers[0].process.kill()
+        await asyncio.sleep(0.1)
+        results = await fleet.async_update(only_registers=['input_outdoor_temperature'])
+        assert len(results) == 4 and all(result.ok for result in results.values())
+        assert fleet.restarts == 1
+    finally:
+        await fleet.aclose()
+        for simulator in simulators:
+            await simulator.stop()
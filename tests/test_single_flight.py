@@ -0,0 +1,57 @@
+"""Concurrent updates sharing one poll."""
+import asyncio
+
+from .conftest import requests
+
+
+async def test_concurrent_full_updates_share_a_poll(mega, connect):
+    thermia = connect(mega)
+    await thermia.async_update()
+    before = requests(mega)
+    await thermia.async_update()
+    single = requests(mega) - before
+    before = requests(mega)
+    results = await asyncio.gather(*(thermia.async_update() for _ in range(5)))
+    assert requests(mega) - before == single
+    assert all(result == results[0] for result in results)
+
+
+async def test_partial_update_joins_and_reads_the_rest(mega, connect):
+    thermia = connect(mega)
+    await thermia.async_update(only_registers=['input_outdoor_temperature'])
+    before = requests(mega)
+    first = thermia.async_update(only_registers=['input_outdoor_temperature'])
+    second = thermia.async_update(only_registers=['input_outdoor_temperature', 'coil_enable_heat'])
+    first, second = await asyncio.gather(first, second)
+    #The shared register once, the other one with a request of its own
+    assert requests(mega) - before == 2
+    assert first == {'input_outdoor_temperature': mega.get('input_outdoor_temperature')}
+    assert second == {'input_outdoor_temperature': mega.get('input_outdoor_temperature'),
+                      'coil_enable_heat': mega.get('coil_enable_heat')}
+
+
+async def test_cancelling_a_caller_keeps_the_shared_poll(mega, connect):
+    thermia = connect(mega, delay=0.01)
+    first = asyncio.ensure_future(thermia.async_update())
+    second = asyncio.ensure_future(thermia.async_update())
+    await asyncio.sleep(0)
+    first.cancel()
+    assert len(await second) > 100
+
+
+async def test_nothing_to_read(mega, connect):
+    thermia = connect(mega)
+    before = requests(mega)
+    assert await thermia.async_update(only_registers=[]) == {}
+    stream = thermia.stream(0.01, groups=[])
+    item = await stream.__anext__()
+    await stream.aclose()
+    assert item.values == {}
+    assert requests(mega) == before
+
+
+async def test_registers_from_a_generator(mega, connect):
+    thermia = connect(mega)
+    names = ['input_outdoor_temperature', 'coil_enable_heat']
+    data = await thermia.async_update(only_registers=(name for name in names))
+    assert data == {name: mega.get(name) for name in names}
@@ -0,0 +1,42 @@
+"""Warm start snapshots."""
+from pythermiagenesis.const import READ_OK, READ_STALE
+from pythermiagenesis.snapshot import Snapshot, load_snapshot
+
+
+async def test_snapshot_restores_values_with_their_types(mega, connect, tmp_path):
+    path = str(tmp_path / 'pump.snapshot')
+    thermia = connect(mega, snapshot=path)
+    data = dict(await thermia.async_update())
+    await thermia.aclose()
+
+    restored = connect(mega, snapshot=path)
+    assert restored.data == data
+    assert all(type(restored.data[name]) is type(value) for name, value in data.items())
+    assert set(restored.status.values()) == {READ_STALE}
+    assert restored.firmware == thermia.firmware
+    assert await restored.async_refresh(intervals={'temperatures': 0})
+    assert restored.status['input_outdoor_temperature'] == READ_OK
+    assert restored.status['coil_enable_heat'] == READ_STALE
+
+
+async def test_snapshot_of_another_pump_is_ignored(mega, connect, tmp_path):
+    path = str(tmp_path / 'pump.snapshot')
+    thermia = connect(mega, snapshot=path)
+    await thermia.async_update()
+    await thermia.aclose()
+    other = connect(mega, snapshot=path)
+    other._port += 1
+    other.data = {}
+    other._load_snapshot()
+    assert other.data == {}
+    assert connect(mega, snapshot=str(tmp_path / 'missing')).data == {}
+
+
+def test_corrupt_snapshots_are_ignored(tmp_path):
+    path = tmp_path / 'pump.snapshot'
+    data = Snapshot('host', 502, 'mega', '1.2.3', {'input_outdoor_temperature': 1.5}, {}).dumps()
+    assert Snapshot.loads(data).values == {'input_outdoor_temperature': 1.5}
+    path.write_bytes(data[:3])
+    assert load_snapshot(str(path)) is None
+    path.write_bytes(b'XXXX' + data[4:])
+    assert load_snapshot(str(path)) is None
@@ -0,0 +1,54 @@
+"""Fixed-rate polls as an async iterator."""
+import pytest
+
+from pythermiagenesis.const import OVERFLOW_COALESCE_LATEST
+from pythermiagenesis.stream import StreamBuffer, StreamItem
+
+
+def _item(values):
+    return StreamItem(0.0, values, dict.fromkeys(values))
+
+
+async def test_buffer_drops_oldest():
+    buffer = StreamBuffer(2)
+    for value in range(4):
+        buffer.put(_item({'a': value}))
+    item = await buffer.get()
+    assert item.values == {'a': 2} and item.dropped == 2
+    assert (await buffer.get()).values == {'a': 3}
+
+
+async def test_buffer_coalesces_deltas():
+    buffer = StreamBuffer(1, OVERFLOW_COALESCE_LATEST, merge=True)
+    buffer.put(_item({'a': 1, 'b': 1}))
+    buffer.put(_item({'a': 2}))
+    item = await buffer.get()
+    assert item.values == {'a': 2, 'b': 1} and item.dropped == 1
+
+
+def test_buffer_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        StreamBuffer(1, 'block')
+
+
+async def test_stream_yields_changes(mega, connect):
+    thermia = connect(mega)
+    registers = ['input_outdoor_temperature', 'coil_enable_heat']
+    stream = thermia.stream(0.01, registers=registers, deltas=True)
+    first = await stream.__anext__()
+    assert first.values == {name: mega.get(name) for name in registers}
+    mega.set('input_outdoor_temperature', 3.5)
+    second = await stream.__anext__()
+    assert second.values == {'input_outdoor_temperature': 3.5}
+    await stream.aclose()
+
+
+async def test_buffer_keeps_deltas_of_dropped_items():
+    buffer = StreamBuffer(2, merge=True)
+    buffer.put(_item({'a': 1}))
+    buffer.put(_item({'b': 1}))
+    buffer.put(_item({'c': 1}))
+    buffer.put(_item({'a': 2}))
+    first = await buffer.get()
+    assert first.values == {'a': 1, 'b': 1, 'c': 1} and first.dropped == 2
+    assert (await buffer.get()).values == {'a': 2}
@@ -0,0 +1,45 @@
+"""Change notifications after updates."""
+from pythermiagenesis import Deadband
+
+
+async def test_changes_are_reported_once(mega, connect):
+    thermia = connect(mega)
+    changes = []
+    thermia.subscribe(changes.append, registers=['input_outdoor_temperature', 'coil_enable_heat'])
+    await thermia.async_update()
+    assert changes == [{'input_outdoor_temperature': mega.get('input_outdoor_temperature'),
+                        'coil_enable_heat': mega.get('coil_enable_heat')}]
+    await thermia.async_update()
+    assert len(changes) == 1
+    mega.set('input_outdoor_temperature', 12.5)
+    await thermia.async_update()
+    assert changes[-1] == {'input_outdoor_temperature': 12.5}
+
+
+async def test_deadband_and_unsubscribe(mega, connect):
+    thermia = connect(mega)
+    changes = []
+    unsubscribe = thermia.subscribe(changes.append, groups=['temperatures'], deadband=Deadband(absolute=1.0))
+    mega.set('input_outdoor_temperature', 10.0)
+    await thermia.async_update()
+    mega.set('input_outdoor_temperature', 10.5)
+    await thermia.async_update()
+    assert len(changes) == 1
+    mega.set('input_outdoor_temperature', 11.0)
+    await thermia.async_update()
+    assert changes[-1] == {'input_outdoor_temperature': 11.0}
+    unsubscribe()
+    mega.set('input_outdoor_temperature', 20.0)
+    await thermia.async_update()
+    assert len(changes) == 2
+
+
+async def test_async_callbacks_may_update(mega, connect):
+    thermia = connect(mega)
+    seen = []
+
+    async def callback(changed):
+        seen.append(await thermia.async_update(only_registers=['input_outdoor_temperature'], merge=True))
+    thermia.subscribe(callback, registers=['coil_enable_heat'])
+    await thermia.async_update()
+    assert seen == [{'input_outdoor_temperature': mega.get('input_outdoor_temperature')}]
@@ -0,0 +1,90 @@
+"""Modbus TCP framing of the asyncio client against the simulator."""
+import asyncio
+import struct
+
+from pythermiagenesis.const import REG_HOLDING, REGISTER_RANGES
+from pythermiagenesis.transport import (
+    EXP_DATA_ADDRESS,
+    FC_READ_HOLDING_REGISTERS,
+    MB_CONNECT_ERR,
+    MB_EXCEPT_ERR,
+    MB_NO_ERR,
+    MBAP_HEADER,
+    AsyncModbusClient,
+    pack_bits,
+    unpack_bits,
+)
+
+
+def test_bits_round_trip():
+    for count in (1, 7, 8, 9, 31):
+        bits = [bool(i % 3) for i in range(count)]
+        assert len(pack_bits(bits)) == (count + 7) // 8
+        assert unpack_bits(pack_bits(bits), count) == bits
+
+
+async def test_raw_frame(mega):
+    reader, writer = await asyncio.open_connection('127.0.0.1', mega.port)
+    start = REGISTER_RANGES[mega.kind][REG_HOLDING][0][0]
+    writer.write(MBAP_HEADER.pack(0x1234, 0, 6, 1) + struct.pack('>BHH', FC_READ_HOLDING_REGISTERS, start, 2))
+    transaction_id, protocol, length, unit_id = MBAP_HEADER.unpack(await reader.readexactly(MBAP_HEADER.size))
+    pdu = await reader.readexactly(length - 1)
+    writer.close()
+    assert (transaction_id, protocol, unit_id) == (0x1234, 0, 1)
+    assert pdu[:2] == bytes((FC_READ_HOLDING_REGISTERS, 4)) and len(pdu) == 6
+
+
+async def test_reads_and_writes(mega):
+    client = AsyncModbusClient('127.0.0.1', mega.port, timeout=5)
+    start = REGISTER_RANGES[mega.kind][REG_HOLDING][0][0]
+    assert await client.write_single_register(start, 1234)
+    assert await client.write_multiple_registers(start + 1, [1, 2, 65535])
+    assert await client.read_holding_registers(start, 4) == [1234, 1, 2, 65535]
+    assert await client.write_single_coil(3, True)
+    assert await client.write_multiple_coils(4, [False, True])
+    assert await client.read_coils(3, 3) == [True, False, True]
+    assert client.last_error() == MB_NO_ERR
+    await client.close()
+
+
+async def test_exception_response(mega):
+    client = AsyncModbusClient('127.0.0.1', mega.port, timeout=5)
+    assert await client.read_holding_registers(60000, 2) is None
+    assert client.last_error() == MB_EXCEPT_ERR
+    assert client.last_except() == EXP_DATA_ADDRESS
+    #The connection stays usable after an exception response
+    start = REGISTER_RANGES[mega.kind][REG_HOLDING][0][0]
+    assert await client.read_holding_registers(start, 1) is not None
+    await client.close()
+
+
+async def test_connect_error():
+    client = AsyncModbusClient('127.0.0.1', 1, timeout=5)
+    assert await client.read_input_registers(0, 1) is None
+    assert client.last_error() == MB_CONNECT_ERR
+
+
+async def test_pipelined_reads_match_serial_reads(mega):
+    client = AsyncModbusClient('127.0.0.1', mega.port, timeout=5)
+    start = REGISTER_RANGES[mega.kind][REG_HOLDING][0][0]
+    requests = [(FC_READ_HOLDING_REGISTERS, start + offset, 3) for offset in range(10)]
+    results, ok = await client.read_pipelined(requests, 4)
+    assert ok
+    for (_, address, count), (data, error, exception, _) in zip(requests, results):
+        assert error == MB_NO_ERR and exception == 0
+        assert data == await client.read_holding_registers(address, count)
+    await client.close()
+
+
+async def test_requests_out_of_range_fail(mega):
+    client = AsyncModbusClient('127.0.0.1', mega.port, timeout=1.0)
+    try:
+        assert await client.read_holding_registers(65535, 2) is None
+        assert await client.read_coils(-1) is None
+        assert await client.write_single_register(0, 65536) is None
+        assert await client.write_single_register(65536, 0) is None
+        assert await client.write_multiple_registers(0, [1, -1]) is None
+        assert await client.write_single_coil(70000, True) is None
+        assert await client.read_holding_registers(0, 1) is not None
+    finally:
+        await client.close()
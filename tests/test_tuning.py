@@ -0,0 +1,55 @@
+"""Adaptive request size and delay."""
+from pythermiagenesis.const import REG_HOLDING, REGISTER_RANGES
+from pythermiagenesis.transport import EXP_DATA_ADDRESS, EXP_SLAVE_DEVICE_BUSY, MB_EXCEPT_ERR, MB_TIMEOUT_ERR
+from pythermiagenesis.tuning import RECOVERY_POLLS, AutoTuner, is_overload
+
+from .conftest import start_simulator
+
+
+def test_only_overload_backs_off():
+    assert is_overload(MB_TIMEOUT_ERR, 0)
+    assert is_overload(MB_EXCEPT_ERR, EXP_SLAVE_DEVICE_BUSY)
+    assert not is_overload(MB_EXCEPT_ERR, EXP_DATA_ADDRESS)
+
+
+def test_recovers_after_polls_without_overload():
+    tuner = AutoTuner(64, 0.0)
+    tuner.record_failure()
+    tuner.record_failure()
+    assert (tuner.max_registers, tuner.delay) == (16, 0.04)
+    for _ in range(RECOVERY_POLLS - 1):
+        tuner.record_success()
+    assert tuner.max_registers == 16
+    tuner.record_success()
+    assert (tuner.max_registers, tuner.delay) == (32, 0.02)
+    for _ in range(RECOVERY_POLLS):
+        tuner.record_success()
+    assert (tuner.max_registers, tuner.delay) == (64, 0.0)
+    tuner.record_success()
+    assert (tuner.max_registers, tuner.delay) == (64, 0.0)
+
+
+async def test_unsupported_registers_do_not_back_off(connect):
+    ranges = dict(REGISTER_RANGES['mega'])
+    ranges[REG_HOLDING] = ranges[REG_HOLDING][1:]
+    simulator = await start_simulator(ranges=ranges)
+    try:
+        thermia = connect(simulator, auto_tune=True)
+        await thermia.async_tune()
+        tuned = (thermia.MAX_REGISTERS, thermia._delay)
+        for _ in range(3):
+            await thermia.async_update()
+        assert (thermia.MAX_REGISTERS, thermia._delay) == tuned
+        assert thermia._tuner.failures == 0
+    finally:
+        await simulator.stop()
+
+
+async def test_timeouts_back_off(mega, connect):
+    thermia = connect(mega, auto_tune=True, timeout=0.05, retries=0)
+    await thermia.async_tune()
+    tuned = thermia.MAX_REGISTERS
+    mega.latency = 0.1
+    await thermia.async_update(only_registers=['input_outdoor_temperature'])
+    assert thermia._tuner.failures == 1
+    assert thermia.MAX_REGISTERS == tuned // 2
@@ -0,0 +1,9 @@
+"""Write-through cache and read back of pending writes."""
+
+
+async def test_set_keeps_unverified_writes_pending(mega, connect):
+    thermia = connect(mega)
+    await thermia.async_set('holding_comfort_wheel_setting', 22)
+    assert thermia.pending == {'holding_comfort_wheel_setting': 22}
+    assert await thermia.async_verify() == {'holding_comfort_wheel_setting': True}
+    assert not thermia.pending
@@ -0,0 +1,70 @@
+"""Single and bulk writes with read back."""
+import pytest
+
+from pythermiagenesis.const import READ_OK
+from pythermiagenesis.writes import plan_writes
+
+from .conftest import requests
+
+CURVE = ['holding_set_point_heat_curve_y_1', 'holding_set_point_heat_curve_y_2', 'holding_set_point_heat_curve_y_3']
+
+
+def test_consecutive_registers_share_a_request():
+    requests = plan_writes({name: 20 for name in CURVE})
+    assert len(requests) == 1 and requests[0].names == CURVE
+
+
+def test_read_only_registers_are_refused():
+    with pytest.raises(ValueError):
+        plan_writes({'input_outdoor_temperature': 1})
+
+
+async def test_set_many_verifies(mega, connect):
+    thermia = connect(mega)
+    values = {name: 25 + index for index, name in enumerate(CURVE)}
+    values['coil_enable_heat'] = False
+    before = requests(mega)
+    results = await thermia.async_set_many(values)
+    #One write per register type and one read back each
+    assert requests(mega) - before == 4
+    assert results == dict.fromkeys(values, True)
+    for name, value in values.items():
+        assert mega.get(name) == value
+        assert thermia.data[name] == value
+    assert not thermia.pending
+
+
+async def test_values_out_of_range_are_not_written(mega, connect, caplog):
+    thermia = connect(mega)
+    before = mega.get(CURVE[0])
+    assert await thermia.async_set_many({CURVE[0]: 1000}) == {CURVE[0]: False}
+    await thermia.async_set(CURVE[0], 1000)
+    assert 'Traceback' not in caplog.text
+    assert mega.get(CURVE[0]) == before
+    assert CURVE[0] not in thermia.pending
+
+
+async def test_set_returns_the_value_read_back(mega, connect):
+    thermia = connect(mega)
+    name = 'holding_comfort_wheel_setting'
+    assert await thermia.async_set(name, 23.5, verify=True) == 23.5
+    assert thermia.status[name] == READ_OK
+    assert thermia.updated[name] > 0
+    assert await thermia.async_set(CURVE[0], 1000, verify=True) is None
+
+    get_data = thermia._get_data
+
+    async def clamped(plan, refused=None):
+        data = await get_data(plan, refused)
+        data[name] = 22.0
+        return data
+    thermia._get_data = clamped
+    assert await thermia.async_set(name, 24, verify=True) is None
+    assert thermia.data[name] == 22.0
+
+
+async def test_read_only_register_is_not_written(mega, connect, caplog, capsys):
+    thermia = connect(mega)
+    assert await thermia.async_set('input_outdoor_temperature', 1, verify=True) is None
+    assert 'input_outdoor_temperature can not be changed' in caplog.text
+    assert capsys.readouterr().out == ''